@@ -0,0 +1,31 @@
+import argparse
+import os
+import time
+
+from Clock_dashboard import DESIGNS
+from clock_engine.atlas import POSITIONS, build_atlas
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pre-render the hands of the clock designs into sprite atlases for --atlas playback"
+    )
+    parser.add_argument('--design', choices=list(DESIGNS) + ['all'], default='all',
+                        help="clock design (default: all)")
+    parser.add_argument('--zoom', type=float, default=1.0,
+                        help="pixels per design unit, the size the clock will be shown at (default: 1)")
+    parser.add_argument('--seconds', type=int, choices=[60, 3600], default=POSITIONS['second'],
+                        help="second hand positions: 60 ticks or 3600 for a smooth sweep (default: 60)")
+    parser.add_argument('--output', default='.', help="directory for the atlas files (default: current)")
+    args = parser.parse_args()
+    
+    os.makedirs(args.output, exist_ok=True)
+    designs = list(DESIGNS) if args.design == 'all' else [args.design]
+    for design in designs:
+        path = os.path.join(args.output, f"{design}.atlas")
+        began = time.perf_counter()
+        sprites = build_atlas(DESIGNS[design], path, args.zoom, {'second': args.seconds})
+        print(f"{path}: {sprites} sprites, {os.path.getsize(path) / 1e6:.1f} MB "
+              f"in {time.perf_counter() - began:.1f}s")
+
+if __name__ == "__main__":
+    main()
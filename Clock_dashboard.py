@@ -0,0 +1,207 @@
+import tkinter as tk
+import argparse
+import math
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine import ItemWatchdog
+from clock_engine.backend import TkBackend
+from clock_engine.clock import RESIZE_SETTLE_MS
+from clock_engine.gradient import hex_to_rgb
+from clock_engine.raster import RasterCanvas
+from clock_engine.scheduler import FrameAnimations, FrameScheduler, next_frame_delay
+from clock_engine.timesource import WallClock, add_time_arguments, time_source_from_args
+from clock_engine.view import ClockView, fit_zoom
+from clock_engine.zones import zone_label
+
+DESIGNS = {
+    'modern': LuxuryModernClock,
+    'watch': LuxuryWatchClock,
+}
+
+class ClockDashboard:
+    """Many clocks laid out in a grid on one canvas, driven by one timer.
+
+    ``zones`` gives each clock a time zone (a tzinfo, an IANA name or None
+    for local time) and a label with its city, making a world clock.
+    """
+    
+    def __init__(self, root, designs, width=1600, height=900, columns=None,
+                 static_cache=True, motion='sweep', adaptive=True, time_source=None, glow_budget=256,
+                 item_budget=None, zones=None):
+        if not designs:
+            raise ValueError("a dashboard needs at least one clock")
+        self.root = root
+        self.width = width
+        self.height = height
+        self.motion = motion
+        self.adaptive = adaptive
+        self.time_source = time_source or WallClock()
+        
+        if root is None:
+            # Headless, e.g. for benchmarks; frames are rendered by the caller
+            self.canvas = RasterCanvas(width, height, '#1a1a1a')
+        else:
+            self.root.title("Clock Dashboard")
+            self.root.configure(bg='#1a1a1a')
+            self.canvas = TkBackend(root, width=width, height=height, bg='#1a1a1a', highlightthickness=0)
+            self.canvas.pack(fill='both', expand=True)
+        
+        # Grid layout, each clock scaled to fit its cell
+        self.designs = [DESIGNS[design] for design in designs]
+        self.columns = columns or math.ceil(math.sqrt(len(designs)))
+        self.rows = math.ceil(len(designs) / self.columns)
+        
+        # Small clocks draw less detail; a budget shared out makes many clocks coarser still
+        clock_budget = None if item_budget is None else item_budget // len(designs)
+        zones = zones or [None] * len(designs)
+        self.clocks = []
+        for clock_cls, zone, (zoom, x, y) in zip(self.designs, zones, self.layout(width, height)):
+            # Clocks of the same design and size load the same cached static image;
+            # clocks in the same zone share its cached offset
+            view = ClockView(self.canvas, x, y, zoom)
+            clock = clock_cls(
+                root, static_cache=static_cache, motion=motion, adaptive=adaptive, canvas=view,
+                item_budget=clock_budget, zone=zone
+            )
+            if zone is not None:
+                self.label_zone(clock, zone)
+            self.clocks.append(clock)
+        
+        # The fastest-moving second hand decides when the next frame is due
+        self.pixel_interval = min(clock.pixel_interval for clock in self.clocks)
+        self.watchdog = ItemWatchdog(self.canvas)
+        
+        # Glowing ornaments of all clocks pulse together, within a fixed
+        # number of item recolors per frame however many clocks there are
+        self.glows = [clock.glow for clock in self.clocks if hasattr(clock, 'glow')]
+        self.glow_budget = glow_budget
+        self.glow_cursor = 0
+        self.glow_intensity = 0
+        self.glow_direction = 1
+        self.frame_animations = None
+        
+        if root is not None:
+            self.scheduler = FrameScheduler(root)
+            self.scheduler.add_job(self.update_dashboard, 0.05)
+            if self.glows and adaptive:
+                # The glow steps with the frames instead of waking the dashboard up
+                self.frame_animations = FrameAnimations([(self.animate_glow, 0.1)])
+            elif self.glows:
+                self.scheduler.add_job(self.animate_glow, 0.1)
+            self.scheduler.pause_while_unmapped()
+            self.scheduler.start()
+            self.resize_job = None
+            self.canvas.bind('<Configure>', self.on_resize)
+    
+    @staticmethod
+    def label_zone(clock, zone):
+        """Write the zone's city above a clock's dial, light or dark to stand out from it"""
+        light = sum(hex_to_rgb(clock.background)) > 3 * 128
+        clock.canvas.create_text(
+            clock.center_x, 60, text=zone_label(zone), font=('Georgia', 36, 'bold'),
+            fill='#1a1a1a' if light else '#F5F5DC', tags="zone_label"
+        )
+    
+    def layout(self, width, height):
+        """Zoom and offset of each clock, fitted into its cell of the grid"""
+        cell_width = width / self.columns
+        cell_height = height / self.rows
+        for index, clock_cls in enumerate(self.designs):
+            zoom, x, y = fit_zoom(clock_cls.width, clock_cls.height, cell_width, cell_height)
+            yield zoom, index % self.columns * cell_width + x, index // self.columns * cell_height + y
+    
+    def on_resize(self, event):
+        """Lay the grid out again for the new canvas size, scaling every clock in place"""
+        self.width, self.height = event.width, event.height
+        if self.resize_job is not None:
+            self.root.after_cancel(self.resize_job)
+            self.resize_job = None
+        stale = False
+        for clock, (zoom, x, y) in zip(self.clocks, self.layout(event.width, event.height)):
+            stale = not clock.relayout(zoom, x, y) or stale
+        self.pixel_interval = min(clock.pixel_interval for clock in self.clocks)
+        if stale:
+            # New sizes are rasterized once, when resizing pauses; then all clocks share them
+            self.resize_job = self.root.after(RESIZE_SETTLE_MS, self.finish_resize)
+    
+    def finish_resize(self):
+        self.resize_job = None
+        for clock in self.clocks:
+            clock.refresh_static_layer()
+    
+    def render_frame(self, timestamp):
+        """Draw every clock for the same epoch time"""
+        for clock in self.clocks:
+            clock.render_frame(timestamp)
+    
+    def update_dashboard(self):
+        """Shared tick for all clocks"""
+        now = self.time_source.now()
+        self.render_frame(now)
+        if self.frame_animations is not None:
+            self.frame_animations.run()
+        self.watchdog.check()
+        
+        if self.adaptive:
+            return self.time_source.wall_delay(next_frame_delay(now, self.motion, self.pixel_interval))
+    
+    def animate_glow(self):
+        """Advance the shared glow, recoloring at most glow_budget items"""
+        self.glow_intensity += self.glow_direction * 5
+        if self.glow_intensity >= 30:
+            self.glow_direction = -1
+        elif self.glow_intensity <= 0:
+            self.glow_direction = 1
+        
+        # Clocks take turns so none is always last in line for the budget
+        level = self.glow_intensity // 5
+        budget = self.glow_budget
+        for _ in range(len(self.glows)):
+            if budget <= 0:
+                break
+            glow = self.glows[self.glow_cursor]
+            self.glow_cursor = (self.glow_cursor + 1) % len(self.glows)
+            budget -= glow.show(level, budget)
+
+def dashboard_designs(count, design):
+    """Design names for ``count`` clocks; 'mixed' alternates both designs"""
+    if design == 'mixed':
+        names = list(DESIGNS)
+        return [names[i % len(names)] for i in range(count)]
+    return [design] * count
+
+def clock_count(value):
+    """argparse type for a number of clocks, at least one"""
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"need at least one clock, not {count}")
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="Grid of luxury clocks on one canvas")
+    parser.add_argument('--count', type=clock_count, default=12, help="number of clocks (default: 12)")
+    parser.add_argument('--design', choices=list(DESIGNS) + ['mixed'], default='mixed',
+                        help="clock design (default: mixed)")
+    parser.add_argument('--columns', type=int, default=None, help="grid columns (default: square grid)")
+    parser.add_argument('--size', default='1600x900', help="canvas size as WIDTHxHEIGHT")
+    parser.add_argument('--motion', choices=['sweep', 'tick'], default='sweep',
+                        help="smooth sweeping or once-per-second second hands")
+    parser.add_argument('--fixed-rate', action='store_true',
+                        help="redraw at a steady 20 FPS instead of only when something moves")
+    parser.add_argument('--item-budget', type=int, default=10000,
+                        help="face items shared by all clocks before they lose detail (default: 10000)")
+    add_time_arguments(parser)
+    args = parser.parse_args()
+    width, height = (int(value) for value in args.size.lower().split('x'))
+    
+    root = tk.Tk()
+    dashboard = ClockDashboard(
+        root, dashboard_designs(args.count, args.design), width, height, args.columns,
+        motion=args.motion, adaptive=not args.fixed_rate, time_source=time_source_from_args(args),
+        item_budget=args.item_budget
+    )
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
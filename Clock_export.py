@@ -0,0 +1,22 @@
+import argparse
+
+from Clock_dashboard import DESIGNS
+from clock_engine.export import add_export_arguments, export_from_args
+from clock_engine.timesource import add_time_arguments
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render a clock animation to a PNG sequence, animated GIF or video without a display"
+    )
+    parser.add_argument('output', help="directory for PNG frames, or a .gif, .mp4, .rgb file ('-' for raw RGB on stdout)")
+    parser.add_argument('--design', choices=list(DESIGNS), default='modern', help="clock design (default: modern)")
+    parser.add_argument('--motion', choices=['sweep', 'tick'], default='sweep',
+                        help="smooth sweeping or once-per-second second hand")
+    parser.add_argument('--face', metavar='FILE', help="draw the clock from another face file")
+    add_time_arguments(parser)
+    add_export_arguments(parser)
+    args = parser.parse_args()
+    export_from_args(DESIGNS[args.design], args, motion=args.motion, face=args.face)
+
+if __name__ == "__main__":
+    main()
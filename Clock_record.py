@@ -0,0 +1,95 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from Clock_dashboard import DESIGNS
+from clock_engine.backend import TkBackend
+from clock_engine.export import parse_size
+from clock_engine.raster import RasterCanvas
+from clock_engine.recording import CommandLog, dump_log, record_clock, replay
+from clock_engine.timesource import SimulatedTime, parse_timestamp
+from clock_engine.zones import parse_zone
+
+def frame_count(value):
+    """argparse type for a number of frames, at least one"""
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"need at least one frame, not {count}")
+    return count
+
+def record(args):
+    source = SimulatedTime(args.start, step=args.interval)
+    timestamps = [source.now() for _ in range(args.count)]
+    began = time.perf_counter()
+    log = record_clock(DESIGNS[args.design], args.log, timestamps, args.size,
+                       {'motion': args.motion, 'face': args.face, 'zone': args.zone}, args.static_image)
+    elapsed = time.perf_counter() - began
+    print(f"{args.log}: {log.command_count()} commands over {len(log.frames)} frames, "
+          f"{os.path.getsize(args.log) / 1024:.1f} KB in {elapsed:.2f}s")
+
+def replay_log(args):
+    log = CommandLog(args.log)
+    if args.backend == 'tk':
+        import tkinter as tk
+        root = tk.Tk()
+        canvas = TkBackend(root, width=log.width, height=log.height, bg=log.background, highlightthickness=0)
+        canvas.pack()
+        # Tk draws when idle; make it draw every frame before the next one starts
+        on_frame = root.update_idletasks
+    else:
+        canvas = RasterCanvas(log.width, log.height, log.background)
+        # 'calls' keeps the items in memory without ever drawing them
+        on_frame = canvas.render if args.backend == 'raster' else None
+
+    setup, frames = replay(log, canvas, on_frame)
+    if not frames:
+        # A log cut short, or written by something else, may set a scene up and stop
+        print(f"{args.log} on {args.backend}: setup {setup * 1000:.1f} ms, no frames")
+        return
+    print(f"{args.log} on {args.backend}: setup {setup * 1000:.1f} ms, {len(frames)} frames, "
+          f"mean {statistics.mean(frames) * 1000:.3f} ms, "
+          f"p95 {sorted(frames)[int(len(frames) * 0.95)] * 1000:.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Record a clock's canvas calls into a binary log, replay it at full speed or dump it as text"
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    recorder = commands.add_parser('record', help="draw frames off-screen and log every canvas call")
+    recorder.add_argument('log', help="command log to write")
+    recorder.add_argument('--design', choices=list(DESIGNS), default='modern', help="clock design (default: modern)")
+    recorder.add_argument('--motion', choices=['sweep', 'tick'], default='sweep',
+                          help="smooth sweeping or once-per-second second hand")
+    recorder.add_argument('--face', metavar='FILE', help="draw the clock from another face file")
+    recorder.add_argument('--zone', type=parse_zone, default=None,
+                          help="IANA time zone to show (default: local time)")
+    recorder.add_argument('--size', type=parse_size, default=None, metavar='WIDTHxHEIGHT',
+                          help="canvas size in pixels (default: the design size)")
+    recorder.add_argument('--count', type=frame_count, default=200, help="number of frames (default: 200)")
+    recorder.add_argument('--interval', type=float, default=0.05,
+                          help="seconds of clock time between frames (default: 0.05)")
+    recorder.add_argument('--start', type=parse_timestamp, default=None,
+                          help="clock time of the first frame, epoch seconds or ISO 8601 (default: now)")
+    recorder.add_argument('--static-image', action='store_true',
+                          help="log the dial as the one cached image the clock shows, not the calls that draw it")
+    recorder.set_defaults(run=record)
+
+    player = commands.add_parser('replay', help="make a log's canvas calls as fast as possible and time them")
+    player.add_argument('log', help="command log to replay")
+    player.add_argument('--backend', choices=['calls', 'raster', 'tk'], default='raster',
+                        help="calls: only make the calls; raster: draw each frame off-screen; "
+                             "tk: a real Tk canvas, needs a display (default: raster)")
+    player.set_defaults(run=replay_log)
+
+    dumper = commands.add_parser('dump', help="write a log as text, one call per line, e.g. to diff two logs")
+    dumper.add_argument('log', help="command log to dump")
+    dumper.set_defaults(run=lambda args: dump_log(CommandLog(args.log), sys.stdout))
+
+    args = parser.parse_args()
+    args.run(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+import argparse
+
+from Clock_dashboard import DESIGNS
+from clock_engine.serve import serve
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve PNG and SVG images of both clock designs over HTTP")
+    parser.add_argument('address', nargs='?', default='127.0.0.1:8080', help="[HOST:]PORT (default: 127.0.0.1:8080)")
+    parser.add_argument('--cache-size', type=int, default=32,
+                        help="designs, themes and sizes kept ready with their dials (default: 32)")
+    args = parser.parse_args()
+    serve(DESIGNS, args.address, cache_size=args.cache_size)
+
+if __name__ == "__main__":
+    main()
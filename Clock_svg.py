@@ -0,0 +1,56 @@
+import argparse
+import gzip
+import sys
+import time
+
+from Clock_dashboard import DESIGNS
+from clock_engine.export import parse_size
+from clock_engine.timesource import parse_timestamp
+from clock_engine.vector import VectorClock, clock_page
+from clock_engine.zones import parse_zone
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write clocks as compact SVG, the artwork defined once and the hands as transforms"
+    )
+    parser.add_argument('output', help="SVG file, .svgz for gzip, or '-' for stdout")
+    parser.add_argument('--design', choices=list(DESIGNS) + ['all'], default='modern',
+                        help="clock design; 'all' puts one of each on a page (default: modern)")
+    parser.add_argument('--face', metavar='FILE', help="draw the clock from another face file")
+    parser.add_argument('--time', type=parse_timestamp, default=None,
+                        help="time shown, epoch seconds or ISO 8601 (default: now)")
+    parser.add_argument('--zone', type=parse_zone, default=None,
+                        help="IANA time zone, e.g. Asia/Tokyo (default: local time)")
+    parser.add_argument('--animate', action='store_true',
+                        help="keep the hands turning in the browser with SMIL animations")
+    parser.add_argument('--motion', choices=['sweep', 'tick'], default='tick',
+                        help="how an animated second hand moves (default: tick)")
+    parser.add_argument('--count', type=int, default=1,
+                        help="clocks per design on one page, sharing their definitions (default: 1)")
+    parser.add_argument('--columns', type=int, default=None, help="clocks per row on a page (default: square)")
+    parser.add_argument('--size', type=parse_size, default=None, metavar='WIDTHxHEIGHT',
+                        help="size of a single clock in pixels (default: the design size)")
+    args = parser.parse_args()
+    
+    timestamp = time.time() if args.time is None else args.time
+    designs = list(DESIGNS) if args.design == 'all' else [args.design]
+    vectors = [VectorClock(DESIGNS[design], face=args.face, motion=args.motion) for design in designs]
+    if len(vectors) == 1 and args.count == 1:
+        document = vectors[0].document(timestamp, args.zone, args.size, args.animate)
+    else:
+        clocks = [(vector, args.zone) for vector in vectors for _ in range(args.count)]
+        cell_width = args.size[0] if args.size else None
+        document = clock_page(clocks, timestamp, args.columns, cell_width, args.animate)
+    
+    data = document.encode()
+    if args.output == '-':
+        sys.stdout.buffer.write(data)
+        return
+    if args.output.endswith('.svgz'):
+        data = gzip.compress(data)
+    with open(args.output, 'wb') as output:
+        output.write(data)
+    print(f"{args.output}: {len(data) / 1024:.1f} KB", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
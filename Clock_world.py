@@ -0,0 +1,38 @@
+import tkinter as tk
+import argparse
+
+from Clock_dashboard import DESIGNS, ClockDashboard, dashboard_designs
+from clock_engine.timesource import add_time_arguments, time_source_from_args
+from clock_engine.zones import WORLD_ZONES, city_zones, parse_zone
+
+def main():
+    parser = argparse.ArgumentParser(description="World clock: a grid of clocks, one per time zone")
+    parser.add_argument('zones', nargs='*', type=parse_zone, metavar='ZONE',
+                        help="IANA time zones to show, e.g. Asia/Tokyo (default: twelve world cities)")
+    parser.add_argument('--all', action='store_true', help="show every city zone in the tz database")
+    parser.add_argument('--design', choices=list(DESIGNS) + ['mixed'], default='modern',
+                        help="clock design (default: modern)")
+    parser.add_argument('--columns', type=int, default=None, help="grid columns (default: square grid)")
+    parser.add_argument('--size', default='1600x900', help="canvas size as WIDTHxHEIGHT")
+    parser.add_argument('--motion', choices=['sweep', 'tick'], default='sweep',
+                        help="smooth sweeping or once-per-second second hands")
+    parser.add_argument('--fixed-rate', action='store_true',
+                        help="redraw at a steady 20 FPS instead of only when something moves")
+    parser.add_argument('--item-budget', type=int, default=10000,
+                        help="face items shared by all clocks before they lose detail (default: 10000)")
+    add_time_arguments(parser)
+    args = parser.parse_args()
+    zones = args.zones or [parse_zone(name) for name in (city_zones() if args.all else WORLD_ZONES)]
+    width, height = (int(value) for value in args.size.lower().split('x'))
+    
+    root = tk.Tk()
+    dashboard = ClockDashboard(
+        root, dashboard_designs(len(zones), args.design), width, height, args.columns,
+        motion=args.motion, adaptive=not args.fixed_rate, time_source=time_source_from_args(args),
+        item_budget=args.item_budget, zones=zones
+    )
+    root.title("World Clock")
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark hand atlases: build time, file size and per-frame hand cost.
+
+Compares moving the vector hands with swapping atlas sprites over a full
+turn of the second hand, on the off-screen canvas (without rasterizing
+the frames). Runs without a display; needs Pillow.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine.atlas import build_atlas
+
+FRAMES = 3600
+
+
+def frame_cost(clock, start):
+    """Milliseconds of CPU per frame for the hands, sweeping one minute in 1/60 s steps"""
+    began = time.process_time()
+    for frame in range(FRAMES):
+        timestamp = start + frame / 60
+        for hand_type, angle in (('second', timestamp % 60 * 6), ('minute', timestamp % 3600 / 10),
+                                 ('hour', timestamp % 43200 / 120)):
+            clock.move_hand(hand_type, angle)
+    return (time.process_time() - began) / FRAMES * 1000
+
+
+def main():
+    start = time.time()
+    with tempfile.TemporaryDirectory() as out_dir:
+        for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+            for seconds in (60, 3600):
+                path = os.path.join(out_dir, f"{clock_cls.__name__}-{seconds}.atlas")
+                began = time.perf_counter()
+                sprites = build_atlas(clock_cls, path, positions={'second': seconds})
+                built = time.perf_counter() - began
+                vector = frame_cost(clock_cls(None), start)
+                clock = clock_cls(None, atlas=path)
+                # The first turn decodes each sprite, later ones reuse them
+                first = frame_cost(clock, start)
+                warm = frame_cost(clock, start)
+                print(f"{clock_cls.__name__:20s} {seconds:5d} s-positions  {sprites:5d} sprites "
+                      f"{os.path.getsize(path) / 1e6:6.1f} MB  built in {built:5.1f}s   "
+                      f"vector {vector:.3f}   atlas {first:.3f} first turn, {warm:.3f} after (ms/frame)")
+
+
+if __name__ == "__main__":
+    main()
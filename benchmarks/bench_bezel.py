@@ -0,0 +1,59 @@
+"""Benchmark the watch bezel animation: redraw versus rotating in place.
+
+"Redraw" deletes and recreates the ~180 bezel items every frame; "rotate"
+moves the existing items with one batched vertex transform, with and
+without NumPy. Uses a Tk canvas when a display is available, otherwise
+the off-screen raster canvas.
+"""
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine import rotation
+
+FRAMES = 500
+
+
+def redraw_frame(watch, frame):
+    """Throw the bezel items away and build them again at the new angle"""
+    watch.canvas.delete("bezel", "bezel_shadow")
+    watch.create_bezel_markings()
+    watch.bezel.rotate(frame * 0.3)
+
+
+def rotate_frame(watch, frame):
+    watch.bezel.rotate(frame * 0.3)
+
+
+def measure(watch, frame_fn, root):
+    start = time.process_time()
+    for frame in range(FRAMES):
+        frame_fn(watch, frame)
+        if root is not None:
+            root.update_idletasks()
+    return (time.process_time() - start) / FRAMES * 1000
+
+
+def main():
+    root = tk.Tk() if os.environ.get('DISPLAY') else None
+    watch = LuxuryWatchClock(root)
+    if root is not None:
+        watch.scheduler.stop()
+    print(f"{'Tk' if root else 'raster'} canvas, {len(watch.bezel.items)} bezel items")
+    print(f"  redraw            {measure(watch, redraw_frame, root):7.3f} ms/frame")
+    numpy = rotation.numpy
+    for label, module in (('rotate (NumPy)', numpy), ('rotate (Python)', None)):
+        if label.endswith('(NumPy)') and module is None:
+            continue
+        rotation.numpy = module
+        watch.bezel.array = None
+        print(f"  {label:17s} {measure(watch, rotate_frame, root):7.3f} ms/frame")
+    rotation.numpy = numpy
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark a dashboard of N clocks sharing one canvas and one tick.
+
+Reports build time, canvas item count, Python heap growth, the cost of
+one shared tick (all clocks updated for a new time) and of one glow frame
+(bounded by the glow budget) as N grows. Uses the
+off-screen raster canvas so it runs without a display; needs Pillow.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Clock_dashboard import ClockDashboard, dashboard_designs
+
+COUNTS = (1, 10, 50, 100, 200)
+TICKS = 50
+
+
+def main():
+    print(f"{'clocks':>6s} {'build ms':>9s} {'items':>7s} {'heap KiB':>9s} {'tick ms':>8s} {'ms/clock':>9s} {'glow ms':>8s}")
+    for count in COUNTS:
+        tracemalloc.start()
+        began = time.perf_counter()
+        dashboard = ClockDashboard(None, dashboard_designs(count, 'mixed'))
+        build = time.perf_counter() - began
+        heap = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        start = time.time()
+        began = time.perf_counter()
+        for i in range(TICKS):
+            dashboard.render_frame(start + i * 0.05)
+        tick = (time.perf_counter() - began) / TICKS
+        
+        began = time.perf_counter()
+        for _ in range(TICKS):
+            dashboard.animate_glow()
+        glow = (time.perf_counter() - began) / TICKS
+        print(f"{count:6d} {build * 1000:9.1f} {len(dashboard.canvas.find_all()):7d} "
+              f"{heap / 1024:9.0f} {tick * 1000:8.2f} {tick * 1000 / count:9.3f} {glow * 1000:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
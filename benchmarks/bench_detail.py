@@ -0,0 +1,56 @@
+"""Benchmark the levels of detail of both designs.
+
+For each level: the zoom it starts at, the items of the static and live
+layers, the time to rasterize the static layer at that zoom and the cost
+of a frame (hands, readouts, bezel) on the off-screen canvas, against the
+full face drawn at the same zoom. Runs without a display; needs Pillow.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine.faces import DETAIL_ZOOMS, load_face
+from clock_engine.raster import RasterCanvas
+from clock_engine.view import ClockView
+
+FRAMES = 200
+
+
+def measure(clock_cls, zoom, detail):
+    """Static layer rasterize ms and ms per frame of a clock drawn at ``zoom``"""
+    width, height = round(clock_cls.width * zoom), round(clock_cls.height * zoom)
+    raster = RasterCanvas(width, height, clock_cls.background)
+    clock = clock_cls(None, canvas=ClockView(raster, zoom=zoom), static_cache=False, detail=detail)
+    began = time.perf_counter()
+    raster.render()
+    static_ms = (time.perf_counter() - began) * 1000
+    
+    start = time.time()
+    began = time.perf_counter()
+    for frame in range(FRAMES):
+        clock.render_frame(start + frame * 0.05)
+    frame_ms = (time.perf_counter() - began) / FRAMES * 1000
+    return static_ms, frame_ms
+
+
+def main():
+    print(f"{'design':18s} {'level':>5s} {'zoom':>5s} {'static':>7s} {'live':>5s} "
+          f"{'raster ms':>10s} {'full ms':>8s} {'frame ms':>9s} {'full ms':>8s}")
+    for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+        for detail, zoom in enumerate((1.0,) + DETAIL_ZOOMS):
+            # Just below the threshold, where the level is first used
+            zoom = zoom * 0.99 if detail else zoom
+            layers = load_face(clock_cls.face_path(), detail).layers
+            live = sum(len(plan) for name, plan in layers.items() if name != 'static')
+            static_ms, frame_ms = measure(clock_cls, zoom, detail)
+            full_static_ms, full_frame_ms = measure(clock_cls, zoom, 0)
+            print(f"{clock_cls.__name__:18s} {detail:5d} {zoom:5.2f} {len(layers['static']):7d} {live:5d} "
+                  f"{static_ms:10.1f} {full_static_ms:8.1f} {frame_ms:9.3f} {full_frame_ms:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
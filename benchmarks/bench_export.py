@@ -0,0 +1,38 @@
+"""Benchmark clip export throughput across process counts and formats.
+
+Runs without a display; needs Pillow. Also reports the exporting
+process's peak memory, which should not grow with the clip length.
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from clock_engine.export import export_animation, frame_timestamps
+
+FPS = 25
+SIZE = (1280, 720)
+
+
+def main():
+    timestamps = frame_timestamps(time.time(), 8, FPS)
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+    with tempfile.TemporaryDirectory() as out_dir:
+        for fmt, output in (('png', 'frames'), ('gif', 'clip.gif'), ('raw', os.devnull)):
+            for processes in counts:
+                began = time.perf_counter()
+                export_animation(LuxuryModernClock, timestamps, os.path.join(out_dir, output), FPS,
+                                 SIZE, fmt, processes)
+                elapsed = time.perf_counter() - began
+                peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+                print(f"{fmt:4s} {processes:3d} processes   {len(timestamps) / elapsed:8.1f} frames/s   "
+                      f"peak {peak:6.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark loading the face files: compiling, from the plan cache, in memory.
+
+Also times drawing a compiled static layer off-screen, which is all a
+vector (uncached) start-up does with the face. Runs without a display;
+the drawing step needs Pillow.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine import faces
+from clock_engine.gradient import gradient_rings
+from clock_engine.raster import RasterCanvas
+
+REPEATS = 50
+
+
+def timed(fn):
+    """Mean ms of ``fn()`` over REPEATS calls"""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as cache:
+        os.environ['ANALOG_CLOCK_CACHE'] = cache
+        print(f"{'face':10s} {'compile':>10s} {'plan cache':>11s} {'memory':>9s} {'draw':>9s} {'items':>6s}")
+        for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+            path = clock_cls.face_path()
+            with open(path, 'rb') as source:
+                raw = source.read()
+            
+            # Gradient geometry is memoized across faces; start each compile cold
+            def compile_cold():
+                gradient_rings.cache_clear()
+                faces.compile_face(faces.parse_face(path, raw))
+            compile_ms = timed(compile_cold)
+            
+            # The first load writes the plan; later ones read it back
+            faces._faces.clear()
+            face = faces.load_face(path)
+            
+            def from_disk():
+                faces._faces.clear()
+                faces.load_face(path)
+            disk_ms = timed(from_disk)
+            memory_ms = timed(lambda: faces.load_face(path))
+            
+            plan = face.layers['static']
+            draw_ms = timed(lambda: faces.draw_plan(
+                RasterCanvas(clock_cls.width, clock_cls.height, clock_cls.background), plan
+            ))
+            print(f"{face.name:10s} {compile_ms:8.2f}ms {disk_ms:9.2f}ms {memory_ms:7.3f}ms "
+                  f"{draw_ms:7.2f}ms {len(plan):6d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Micro-benchmark of the per-frame math behind the clock hands.
+
+Compares hand direction/perpendicular vectors computed with math.cos/
+math.sin (as the hands used to) against the cached table lookup, then
+times a realistic run of hand updates for both designs: 20 frames per
+second of clock time, where only the second hand moves every frame.
+Runs without a display.
+"""
+import math
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine.geometry import hand_vectors
+
+FRAMES = 20000
+ANGLES = (123.45, 67.8, 301.2)
+
+
+class NullCanvas:
+    """Accepts coords() calls so only the Python side is timed"""
+    
+    def coords(self, item, *args):
+        pass
+
+
+def math_vectors():
+    """Direction and perpendicular of three hands with math.cos/sin"""
+    for angle in ANGLES:
+        angle_rad = math.radians(angle - 90)
+        perp_angle = angle_rad + math.pi/2
+        math.cos(angle_rad), math.sin(angle_rad)
+        math.cos(perp_angle), math.sin(perp_angle)
+
+
+def table_vectors():
+    """Direction and perpendicular of three hands from the table"""
+    for angle in ANGLES:
+        hand_vectors(angle)
+
+
+def geometry_only(clock_cls):
+    """A clock with just the state the hand geometry and moves need"""
+    clock = clock_cls.__new__(clock_cls)
+    clock.canvas = NullCanvas()
+    clock.hand_items = {hand_type: [0, 0, 0] for hand_type in clock.hand_styles}
+    clock.hand_angles = {}
+    return clock
+
+
+def hand_updates(clock, move, frames):
+    """Move all hands through ``frames`` frames at 50 ms per frame"""
+    for frame in range(frames):
+        seconds = frame * 0.05
+        move(clock, 'second', seconds * 6 % 360)
+        move(clock, 'minute', seconds * 0.1 % 360)
+        move(clock, 'hour', seconds / 120 % 360)
+
+
+def recompute_every_frame(clock, hand_type, angle):
+    """Old behaviour: full geometry for every hand on every frame"""
+    length, width, _ = clock.hand_styles[hand_type]
+    clock.hand_coords(angle, length, width, hand_type)
+
+
+def report(label, seconds):
+    print(f"{label:44s} {seconds / FRAMES * 1e6:7.2f} us/frame")
+
+
+def main():
+    report("hand vectors, math.cos/sin", timeit.timeit(math_vectors, number=FRAMES))
+    report("hand vectors, table", timeit.timeit(table_vectors, number=FRAMES))
+    for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+        clock = geometry_only(clock_cls)
+        move = clock_cls.move_hand
+        report(f"{clock_cls.__name__} all hands every frame", timeit.timeit(
+            lambda: hand_updates(clock, recompute_every_frame, FRAMES), number=1))
+        report(f"{clock_cls.__name__} move_hand", timeit.timeit(
+            lambda: hand_updates(clock, move, FRAMES), number=1))
+
+
+if __name__ == "__main__":
+    main()
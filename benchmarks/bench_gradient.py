@@ -0,0 +1,89 @@
+"""Benchmark the gradient engine on the static-scene setup path.
+
+Times one 15-step gradient oval with the old per-step color math against
+gradient_rings, then the full static scene of both designs with a cold and
+a warm gradient cache. Drawing goes to a canvas that discards items, so
+only the Python setup cost is measured. Runs without a display.
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine.gradient import gradient_rings
+
+REPEAT = 200
+
+
+class NullCanvas:
+    """Swallows drawing calls"""
+    
+    def _create(self, *args, **options):
+        return 0
+    
+    create_line = create_oval = create_polygon = create_rectangle = create_text = _create
+
+
+def legacy_gradient_oval(x1, y1, x2, y2, color1, color2, steps=15):
+    """The per-step loop create_gradient_oval used before the engine"""
+    def hex_to_rgb(hex_color):
+        hex_color = hex_color.lstrip('#')
+        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    
+    width = x2 - x1
+    height = y2 - y1
+    rings = []
+    for i in range(steps):
+        ratio = i / steps
+        r1, g1, b1 = hex_to_rgb(color1)
+        r2, g2, b2 = hex_to_rgb(color2)
+        r = int(r1 + (r2 - r1) * ratio)
+        g = int(g1 + (g2 - g1) * ratio)
+        b = int(b1 + (b2 - b1) * ratio)
+        scale = 1 - ratio * 0.8
+        new_width = width * scale
+        new_height = height * scale
+        offset_x = (width - new_width) / 2
+        offset_y = (height - new_height) / 2
+        rings.append(((x1 + offset_x, y1 + offset_y,
+                       x1 + offset_x + new_width, y1 + offset_y + new_height),
+                      f"#{r:02x}{g:02x}{b:02x}"))
+    return rings
+
+
+def cold_rings():
+    gradient_rings.cache_clear()
+    gradient_rings((300, 300, 380, 380), ('#F4E4BC', '#8B7355'), 15, 0.8)
+
+
+def report(label, seconds):
+    print(f"{label:48s} {seconds / REPEAT * 1000:8.3f} ms")
+
+
+def main():
+    report("one gradient oval, legacy loop", timeit.timeit(
+        lambda: legacy_gradient_oval(300, 300, 380, 380, '#F4E4BC', '#8B7355'), number=REPEAT))
+    report("one gradient oval, gradient_rings (cold)", timeit.timeit(cold_rings, number=REPEAT))
+    report("one gradient oval, gradient_rings (memoized)", timeit.timeit(
+        lambda: gradient_rings((300, 300, 380, 380), ('#F4E4BC', '#8B7355'), 15, 0.8),
+        number=REPEAT))
+    
+    for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+        clock = clock_cls(None, static_cache=False)
+        canvas = NullCanvas()
+        
+        def cold_scene():
+            gradient_rings.cache_clear()
+            clock.render_static_scene(canvas)
+        
+        report(f"{clock_cls.__name__} static scene (cold cache)",
+               timeit.timeit(cold_scene, number=REPEAT))
+        report(f"{clock_cls.__name__} static scene (warm cache)",
+               timeit.timeit(lambda: clock.render_static_scene(canvas), number=REPEAT))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark CPU time per frame for hand updates, before and after retained mode.
+
+"Before" recreates the hands every frame (delete + create, as the clocks used
+to), "after" moves the existing hand items with coords(). Uses a Tk canvas
+when a display is available; otherwise the off-screen raster canvas, which
+times the canvas calls without drawing them.
+"""
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+
+FRAMES = 500
+
+
+def angles(frame):
+    """Hand angles for a frame, sweeping the whole dial"""
+    second = frame * 0.3 % 360
+    return {'second': second, 'minute': second / 60 * 6, 'hour': second / 720 * 6}
+
+
+def recreate_frame(clock, frame):
+    """Old behaviour: throw the hands away and build them again"""
+    clock.canvas.delete("hands")
+    clock.create_hands()
+    move_frame(clock, frame)
+
+
+def move_frame(clock, frame):
+    """Retained mode: only update coordinates of existing items"""
+    for hand_type, angle in angles(frame).items():
+        clock.move_hand(hand_type, angle)
+
+
+def measure(clock, frame_fn):
+    root = clock.root
+    if root is not None:
+        root.update()
+    start = time.process_time()
+    for frame in range(FRAMES):
+        frame_fn(clock, frame)
+        if root is not None:
+            root.update_idletasks()
+    return (time.process_time() - start) / FRAMES * 1000
+
+
+def main():
+    display = bool(os.environ.get('DISPLAY'))
+    print(f"{'Tk' if display else 'raster'} canvas")
+    for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+        root = tk.Tk() if display else None
+        clock = clock_cls(root)
+        before = measure(clock, recreate_frame)
+        after = measure(clock, move_frame)
+        print(f"{clock_cls.__name__:20s} recreate {before:7.3f} ms/frame   "
+              f"coords {after:7.3f} ms/frame   speedup {before / after:5.1f}x")
+        if root is not None:
+            root.destroy()
+
+
+if __name__ == "__main__":
+    main()
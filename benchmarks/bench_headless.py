@@ -0,0 +1,41 @@
+"""Benchmark headless frame rendering throughput across process counts.
+
+Each design is rendered as PNG at zlib level 1 (the default) and 0, and as
+raw RGB files, which skip encoding. Runs without a display; needs Pillow.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine.headless import render_frames
+
+FRAMES = 400
+# (label, format, PNG compress level)
+OUTPUTS = (('png 1', 'png', 1), ('png 0', 'png', 0), ('raw', 'raw', 1))
+
+
+def main():
+    start = time.time()
+    timestamps = [start + i * 0.25 for i in range(FRAMES)]
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+    for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+        for processes in counts:
+            rates = []
+            for label, fmt, compress_level in OUTPUTS:
+                with tempfile.TemporaryDirectory() as out_dir:
+                    began = time.perf_counter()
+                    render_frames(clock_cls, timestamps, out_dir, processes, fmt=fmt,
+                                  compress_level=compress_level)
+                    elapsed = time.perf_counter() - began
+                rates.append(f"{label} {FRAMES / elapsed:6.1f}")
+            print(f"{clock_cls.__name__:20s} {processes:3d} processes   {'   '.join(rates)} frames/s")
+
+
+if __name__ == "__main__":
+    main()
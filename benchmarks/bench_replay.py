@@ -0,0 +1,65 @@
+"""Benchmark the Python side of a frame against the canvas side, by record and replay.
+
+For each design a run of frames is recorded into a command log. Reported:
+the log size per frame, the cost of a live frame (the clock's geometry and
+its canvas calls, on an off-screen canvas that doesn't draw), the cost of
+replaying only the canvas calls, and of replaying them while rasterizing
+every frame. Live minus calls is the clock's own Python. Runs without a
+display; needs Pillow. ``xvfb-run python Clock_record.py replay LOG
+--backend tk`` times the same calls on a real Tk canvas.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Clock_dashboard import DESIGNS
+from clock_engine.raster import RasterCanvas
+from clock_engine.recording import record_clock, replay
+from clock_engine.view import ClockView
+
+FRAMES = 400
+
+
+def live_frame_ms(clock_cls, timestamps):
+    clock = clock_cls(None, canvas=ClockView(RasterCanvas(clock_cls.width, clock_cls.height)))
+    due = dict.fromkeys(clock.animations, timestamps[0])
+    began = time.perf_counter()
+    for timestamp in timestamps:
+        clock.render_frame(timestamp)
+        for name, period in clock.animations.items():
+            if timestamp >= due[name]:
+                getattr(clock, name)()
+                due[name] = timestamp + period
+    return (time.perf_counter() - began) / len(timestamps) * 1000
+
+
+def replay_frame_ms(log, render):
+    canvas = RasterCanvas(log.width, log.height, log.background)
+    _, frames = replay(log, canvas, canvas.render if render else None)
+    return sum(frames) / len(frames) * 1000
+
+
+def main():
+    start = time.time()
+    timestamps = [start + i * 0.05 for i in range(FRAMES)]
+    print(f"{'design':8s} {'commands':>9s} {'bytes/frame':>12s} {'live ms':>8s} {'calls ms':>9s} "
+          f"{'python ms':>10s} {'raster ms':>10s}")
+    with tempfile.TemporaryDirectory() as directory:
+        for design, clock_cls in DESIGNS.items():
+            path = os.path.join(directory, f"{design}.rec")
+            # The dial as its cached image, as the live clock shows it; only frames are compared
+            log = record_clock(clock_cls, path, timestamps, static_cache=True)
+            setup_size = sum(len(image) for image in log.images)
+            per_frame = (os.path.getsize(path) - setup_size) / FRAMES
+            live = live_frame_ms(clock_cls, timestamps)
+            calls = replay_frame_ms(log, render=False)
+            raster = replay_frame_ms(log, render=True)
+            print(f"{design:8s} {log.command_count():9d} {per_frame:12.0f} {live:8.3f} {calls:9.3f} "
+                  f"{live - calls:10.3f} {raster:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark resizing a clock: rebuilding it versus scaling it in place.
+
+Steps the canvas through window sizes up to 4K. "Rebuild" deletes the
+clock and constructs it again at the new size; "relayout" rescales the
+existing items with ``canvas.scale`` and swaps in the static image for
+that size. The first visit to a size has to rasterize its static layer;
+later visits find it in the image cache. Uses a Tk canvas when a display
+is available, otherwise the off-screen raster canvas.
+
+First checks that a size which isn't cached yet is left to the caller
+while resizing (``rasterize=False``) and only drawn when asked for.
+"""
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine.backend import TkBackend
+from clock_engine.raster import RasterCanvas
+from clock_engine.static_cache import cached_static_layer
+from clock_engine.view import ClockView, fit_zoom
+
+SIZES = [(700, 800), (1280, 1024), (1920, 1080), (2560, 1440), (3840, 2160)]
+ROUNDS = 5
+
+
+def make_canvas(root, clock_cls):
+    width, height = SIZES[-1]
+    if root is None:
+        return RasterCanvas(width, height, clock_cls.background)
+    canvas = TkBackend(root, width=width, height=height, bg=clock_cls.background)
+    canvas.pack()
+    return canvas
+
+
+def check_deferred_layer(clock_cls):
+    """Raise unless an uncached layer comes back None without rasterize, and is found once drawn"""
+    drawn = []
+    
+    def layer(zoom, rasterize):
+        return cached_static_layer(clock_cls.__name__, clock_cls.width, clock_cls.height, 'resize-check',
+                                   clock_cls.background, drawn.append, __file__, zoom, rasterize)
+    
+    if layer(0.5, rasterize=False) is not None or drawn:
+        raise RuntimeError("an uncached static layer was rasterized with rasterize=False")
+    path = layer(0.5, rasterize=True)
+    if path is None or len(drawn) != 1:
+        raise RuntimeError("the static layer was not rasterized once when asked for")
+    if layer(0.5, rasterize=False) != path or len(drawn) != 1:
+        raise RuntimeError("a cached static layer was not found without rasterize")
+
+
+def measure(root, clock_cls, canvas):
+    """Return (first visit ms, relayout ms, rebuild ms) per size change"""
+    def settle():
+        if root is not None:
+            root.update_idletasks()
+    
+    clock = clock_cls(None, canvas=ClockView(canvas, tag='resized'))
+    # First visits rasterize the static layer for the size
+    start = time.perf_counter()
+    for width, height in SIZES:
+        if not clock.relayout(*fit_zoom(clock_cls.width, clock_cls.height, width, height)):
+            clock.refresh_static_layer()
+        settle()
+    first = (time.perf_counter() - start) / len(SIZES) * 1000
+    
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for width, height in SIZES:
+            clock.relayout(*fit_zoom(clock_cls.width, clock_cls.height, width, height))
+            settle()
+    relayout = (time.perf_counter() - start) / (ROUNDS * len(SIZES)) * 1000
+    
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for width, height in SIZES:
+            clock.canvas.delete('all')
+            zoom, x, y = fit_zoom(clock_cls.width, clock_cls.height, width, height)
+            clock = clock_cls(None, canvas=ClockView(canvas, x, y, zoom, tag='resized'))
+            settle()
+    rebuild = (time.perf_counter() - start) / (ROUNDS * len(SIZES)) * 1000
+    return first, relayout, rebuild
+
+
+def main():
+    root = tk.Tk() if os.environ.get('DISPLAY') else None
+    with tempfile.TemporaryDirectory() as cache:
+        os.environ['ANALOG_CLOCK_CACHE'] = cache
+        print(f"{'Tk' if root else 'raster'} canvas, sizes {SIZES[0]} to {SIZES[-1]}")
+        print(f"{'design':20s} {'first visit':>12s} {'relayout':>10s} {'rebuild':>10s}")
+        for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+            check_deferred_layer(clock_cls)
+            first, relayout, rebuild = measure(root, clock_cls, make_canvas(root, clock_cls))
+            print(f"{clock_cls.__name__:20s} {first:10.1f}ms {relayout:8.2f}ms {rebuild:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark the HTTP render service under concurrent requests.
+
+Starts the service in-process on a free port and fires batches of
+concurrent requests: all for the same second (one render, shared), each
+for a different second (one render each, hands only), and revalidations
+answered with 304. Runs without a display; needs Pillow.
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine.serve import RenderService
+
+CONCURRENT = 300
+
+
+async def fetch(port, target, headers=''):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n{headers}\r\n".encode())
+    response = await reader.read()
+    writer.close()
+    head = response.split(b'\r\n\r\n', 1)[0].decode()
+    etag = next((line.split(': ', 1)[1] for line in head.split('\r\n') if line.startswith('ETag')), None)
+    return int(head.split()[1]), etag
+
+
+async def batch(port, targets, headers=''):
+    began = time.perf_counter()
+    results = await asyncio.gather(*(fetch(port, target, headers) for target in targets))
+    return time.perf_counter() - began, results
+
+
+async def main():
+    service = RenderService({'modern': LuxuryModernClock, 'watch': LuxuryWatchClock})
+    server = await asyncio.start_server(service.handle, '127.0.0.1', 0, backlog=1024)
+    port = server.sockets[0].getsockname()[1]
+    start = int(time.time())
+    for fmt in ('png', 'svg'):
+        for design in ('modern', 'watch'):
+            base = f"/clock.{fmt}?design={design}&size=480x480"
+            await fetch(port, f"{base}&time={start - 1}")  # build the clock and its dial
+            same, results = await batch(port, [f"{base}&time={start}"] * CONCURRENT)
+            distinct, _ = await batch(port, [f"{base}&time={start + 1 + i}" for i in range(CONCURRENT)])
+            etag = results[0][1]
+            cached, _ = await batch(port, [f"{base}&time={start}"] * CONCURRENT, f"If-None-Match: {etag}\r\n")
+            print(f"{fmt} {design:7s} {CONCURRENT} requests: same second {CONCURRENT / same:7.0f}/s   "
+                  f"distinct seconds {CONCURRENT / distinct:6.0f}/s   304s {CONCURRENT / cached:7.0f}/s")
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,43 @@
+"""Soak both clocks through a full day of simulated time.
+
+Every frame goes through render_frame with a SimulatedTime source, so
+the run covers 24 hours of hand motion and readout changes in seconds
+and always shows the same instants. The canvas item count must stay
+flat, and the digest of the final frame is the same on every run.
+Runs without a display; needs Pillow.
+"""
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine.timesource import SimulatedTime
+
+# Midnight, 1 March 2024 local time
+START = time.mktime((2024, 3, 1, 0, 0, 0, 0, 0, -1))
+DAY = 24 * 60 * 60
+STEP = 1.25
+
+
+def main():
+    frames = int(DAY / STEP)
+    for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+        clock = clock_cls(None)
+        source = SimulatedTime(START, step=STEP)
+        items = len(clock.canvas.find_all())
+        began = time.perf_counter()
+        for _ in range(frames):
+            clock.render_frame(source.now())
+        elapsed = time.perf_counter() - began
+        leaked = len(clock.canvas.find_all()) - items
+        digest = hashlib.sha1(clock.canvas.render().tobytes()).hexdigest()[:12]
+        print(f"{clock_cls.__name__:20s} {frames} frames in {elapsed:6.2f}s "
+              f"({frames / elapsed:9.0f} frames/s)   items leaked {leaked}   final frame {digest}")
+
+
+if __name__ == "__main__":
+    main()
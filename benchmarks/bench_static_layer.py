@@ -0,0 +1,65 @@
+"""Benchmark startup and redraw cost with and without the cached static layer.
+
+Startup is timed twice for the cached layer: the first run rasterizes it
+(cache miss), later runs load the PNG. A redraw repaints the whole canvas,
+as on an expose event. Uses a Tk canvas when a display is available;
+otherwise the off-screen raster canvas, where a redraw rasterizes a frame.
+"""
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+
+REDRAWS = 50
+
+
+def measure(clock_cls, static_cache, display):
+    """Return (startup ms, full redraw ms, canvas items)"""
+    root = tk.Tk() if display else None
+    start = time.perf_counter()
+    clock = clock_cls(root, static_cache=static_cache)
+    if root is not None:
+        root.update()
+    startup = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    for _ in range(REDRAWS):
+        if root is None:
+            # Drop the dial kept composited between frames, so everything is rasterized again
+            clock.canvas.base = None
+            clock.canvas.render()
+            continue
+        # Force Tk to repaint the whole canvas
+        clock.canvas.move("all", 0, 0)
+        root.update_idletasks()
+    redraw = (time.perf_counter() - start) / REDRAWS * 1000
+    
+    items = len(clock.canvas.find_all())
+    if root is not None:
+        root.destroy()
+    return startup, redraw, items
+
+
+def main():
+    os.environ['ANALOG_CLOCK_CACHE'] = tempfile.mkdtemp(prefix='clock-cache-')
+    display = bool(os.environ.get('DISPLAY'))
+    print(f"{'Tk' if display else 'raster'} canvas")
+    for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+        runs = [
+            ('vector', measure(clock_cls, False, display)),
+            ('cache miss', measure(clock_cls, True, display)),
+            ('cache hit', measure(clock_cls, True, display)),
+        ]
+        for label, (startup, redraw, items) in runs:
+            print(f"{clock_cls.__name__:20s} {label:10s} startup {startup:8.1f} ms   "
+                  f"redraw {redraw:6.2f} ms   {items:5d} items")
+
+
+if __name__ == "__main__":
+    main()
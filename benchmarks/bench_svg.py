@@ -0,0 +1,59 @@
+"""Benchmark vector SVG documents: size and time per document.
+
+Compares a full SvgCanvas render of each design with the VectorClock
+document (dial defined once, hands as transforms), plain and gzipped,
+for one clock and for a page of 100 clocks. Runs without a display.
+"""
+import gzip
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Analog_clock import LuxuryModernClock
+from Luxury_analog_watch import LuxuryWatchClock
+from clock_engine.svg import SvgCanvas
+from clock_engine.vector import VectorClock, clock_page
+
+DOCUMENTS = 200
+PAGE = 100
+
+
+def sizes(document):
+    data = document.encode()
+    return f"{len(data) / 1024:6.1f} KB ({len(gzip.compress(data)) / 1024:5.1f} KB gzipped)"
+
+
+def main():
+    start = time.time()
+    for clock_cls in (LuxuryModernClock, LuxuryWatchClock):
+        canvas = SvgCanvas(clock_cls.width, clock_cls.height, clock_cls.background)
+        clock = clock_cls(None, canvas=canvas, motion='tick', static_cache=False)
+        began = time.perf_counter()
+        for second in range(DOCUMENTS):
+            clock.render_frame(start + second)
+            full = canvas.render()
+        full_ms = (time.perf_counter() - began) / DOCUMENTS * 1000
+        
+        began = time.perf_counter()
+        vector = VectorClock(clock_cls)
+        build_ms = (time.perf_counter() - began) * 1000
+        began = time.perf_counter()
+        for second in range(DOCUMENTS):
+            document = vector.document(start + second)
+        vector_ms = (time.perf_counter() - began) / DOCUMENTS * 1000
+        animated = vector.document(start, animate=True)
+        began = time.perf_counter()
+        page = clock_page([(vector, None)] * PAGE, start)
+        page_ms = (time.perf_counter() - began) * 1000
+        
+        print(f"{clock_cls.__name__}")
+        print(f"  canvas render   {sizes(full)}  {full_ms:6.2f} ms/document")
+        print(f"  vector document {sizes(document)}  {vector_ms:6.2f} ms/document (definitions {build_ms:.0f} ms once)")
+        print(f"  animated        {sizes(animated)}")
+        print(f"  page of {PAGE}     {sizes(page)}  {page_ms:6.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark world-clock time zone handling.
+
+Reports the cost of converting one instant into the wall time of N zones,
+looked up in the zone rules each time (datetime.fromtimestamp) against the
+offsets cached between transitions (clock_engine.zones), and the cost of
+one tick of a dashboard of N clocks all on local time against N clocks in
+N different zones. Uses the off-screen raster canvas so it runs without a
+display; needs Pillow and Python 3.9+.
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Clock_dashboard import ClockDashboard, dashboard_designs
+from clock_engine.zones import city_zones, get_zone, zone_time
+
+COUNTS = (1, 10, 100, 400)
+INSTANTS = 200
+TICKS = 50
+
+
+def convert(zones, lookup):
+    """Microseconds to convert one instant for every zone"""
+    start = time.time()
+    began = time.perf_counter()
+    for i in range(INSTANTS):
+        timestamp = start + i * 0.05
+        for zone in zones:
+            lookup(zone, timestamp)
+    return (time.perf_counter() - began) / INSTANTS * 1e6
+
+
+def tick(dashboard):
+    """Milliseconds per shared tick"""
+    start = time.time()
+    began = time.perf_counter()
+    for i in range(TICKS):
+        dashboard.render_frame(start + i * 0.05)
+    return (time.perf_counter() - began) / TICKS * 1000
+
+
+def main():
+    names = city_zones()
+    print(f"{'zones':>5s} {'rules us':>9s} {'cached us':>10s} {'local tick ms':>14s} {'zones tick ms':>14s}")
+    for count in COUNTS:
+        zones = [get_zone(name) for name in names[:count]]
+        rules = convert(zones, lambda zone, timestamp: datetime.fromtimestamp(timestamp, zone).timetuple())
+        # The first frame finds each zone's next transition; later ones only shift the timestamp
+        convert(zones, lambda zone, timestamp: zone_time(zone).struct_time(timestamp))
+        cached = convert(zones, lambda zone, timestamp: zone_time(zone).struct_time(timestamp))
+        
+        designs = dashboard_designs(count, 'mixed')
+        local_ms = tick(ClockDashboard(None, designs))
+        zones_ms = tick(ClockDashboard(None, designs, zones=zones))
+        print(f"{count:5d} {rules:9.1f} {cached:10.1f} {local_ms:14.2f} {zones_ms:14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""Benchmark suite for both clock designs, with JSON results.
+
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --compare before.json
+
+Each design is measured in fresh subprocesses: one with an empty static
+layer cache (cold start) and one with the cache filled (warm start),
+repeated ``--runs`` times keeping the best timing of each metric. The
+warm run also times clock construction, the per-frame update and the
+canvas item count over a run of simulated frames, and reports the peak
+RSS of the process.
+
+``--backend raster`` (the default) draws off-screen and needs Pillow;
+``--backend tk`` measures real Tk canvases and needs a display, e.g.
+under ``xvfb-run``. ``--compare`` reports metrics that got slower or
+bigger than a previous results file by more than ``--threshold`` and
+exits with status 1 if there are any.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+DESIGNS = {
+    'modern': ('Analog_clock', 'LuxuryModernClock', 'update_clock'),
+    'watch': ('Luxury_analog_watch', 'LuxuryWatchClock', 'update_clock'),
+}
+
+# Metrics compared by --compare; all of them are better when lower
+METRICS = (
+    'cold_first_frame_ms', 'warm_first_frame_ms', 'construct_vector_ms', 'construct_cached_ms',
+    'frame_mean_ms', 'frame_p95_ms', 'render_ms', 'items_end', 'peak_rss_kib',
+)
+
+
+def measure(design, backend, frames, repeats):
+    """Run inside a child process; returns the metrics of one design"""
+    began = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    module_name, class_name, update_name = DESIGNS[design]
+    module = __import__(module_name)
+    from clock_engine.timesource import SimulatedTime
+    clock_cls = getattr(module, class_name)
+    imported = time.perf_counter()
+    
+    root = None
+    if backend == 'tk':
+        import tkinter as tk
+        root = tk.Tk()
+    
+    def build(**options):
+        clock = clock_cls(root, **options)
+        if root is not None:
+            clock.scheduler.stop()
+            root.update()
+        return clock
+    
+    def dispose(clock):
+        if root is not None:
+            clock.screen.destroy()
+    
+    # Start-up: import to first drawn frame
+    source = SimulatedTime(time.mktime((2024, 3, 1, 10, 8, 30, 0, 0, -1)), step=0.05)
+    clock = build(time_source=source)
+    getattr(clock, update_name)()
+    if root is not None:
+        root.update()
+    first_frame = time.perf_counter()
+    result = {
+        'import_ms': (imported - began) * 1000,
+        'first_frame_ms': (first_frame - began) * 1000,
+    }
+    
+    # Per-frame cost and item count over a run of simulated frames
+    update = getattr(clock, update_name)
+    items = [len(clock.canvas.find_all())]
+    times = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        update()
+        if root is not None:
+            root.update_idletasks()
+        times.append(time.perf_counter() - start)
+        if frame % 100 == 99:
+            items.append(len(clock.canvas.find_all()))
+    times.sort()
+    result.update({
+        'frames': frames,
+        'frame_mean_ms': statistics.fmean(times) * 1000,
+        'frame_p50_ms': times[len(times) // 2] * 1000,
+        'frame_p95_ms': times[int(len(times) * 0.95)] * 1000,
+        'frame_max_ms': times[-1] * 1000,
+        'items_start': items[0],
+        'items_end': items[-1],
+        'items_over_time': items,
+    })
+    if root is None:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            clock.canvas.render()
+        result['render_ms'] = (time.perf_counter() - start) / repeats * 1000
+    dispose(clock)
+    
+    # Construction of the whole scene, drawn as vectors and from the cache
+    for label, static_cache in (('construct_vector_ms', False), ('construct_cached_ms', True)):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            dispose(build(static_cache=static_cache))
+        result[label] = (time.perf_counter() - start) / repeats * 1000
+    
+    try:
+        import resource
+        result['peak_rss_kib'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        pass
+    return result
+
+
+def run_child(design, args, cache_dir):
+    env = dict(os.environ, ANALOG_CLOCK_CACHE=cache_dir)
+    command = [sys.executable, os.path.abspath(__file__), '--child', design,
+               '--backend', args.backend, '--frames', str(args.frames), '--repeats', str(args.repeats)]
+    output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def run_suite(args):
+    results = {}
+    for design in args.designs:
+        best = None
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                cold = run_child(design, args, cache_dir)
+                warm = run_child(design, args, cache_dir)
+            warm['cold_first_frame_ms'] = cold['first_frame_ms']
+            warm['warm_first_frame_ms'] = warm.pop('first_frame_ms')
+            # Keep the fastest of the runs for each timing, which is far
+            # less noisy than any single run
+            best = warm if best is None else {
+                name: min(value, warm[name]) if isinstance(value, float) else value
+                for name, value in best.items()
+            }
+        results[design] = best
+    
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'commit': commit,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'backend': args.backend,
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold):
+    """Lines describing metrics that regressed by more than ``threshold``"""
+    regressions = []
+    for design, metrics in current['results'].items():
+        before = baseline.get('results', {}).get(design, {})
+        for name in METRICS:
+            if name not in metrics or not before.get(name):
+                continue
+            ratio = metrics[name] / before[name]
+            if ratio > 1 + threshold:
+                regressions.append(f"{design:8s} {name:22s} {before[name]:10.2f} -> "
+                                   f"{metrics[name]:10.2f}  (+{(ratio - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_summary(report):
+    print(f"{report['commit'] or 'working tree'} ({report['backend']} backend, "
+          f"Python {report['python']})", file=sys.stderr)
+    for design, metrics in report['results'].items():
+        print(f"  {design:8s} cold start {metrics['cold_first_frame_ms']:7.1f} ms   "
+              f"warm start {metrics['warm_first_frame_ms']:7.1f} ms   "
+              f"frame {metrics['frame_mean_ms']:6.3f} ms (p95 {metrics['frame_p95_ms']:6.3f})   "
+              f"items {metrics['items_start']}->{metrics['items_end']}   "
+              f"RSS {metrics.get('peak_rss_kib', 0) / 1024:.0f} MiB", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark both clock designs and write JSON results")
+    parser.add_argument('--backend', choices=['raster', 'tk'], default='raster',
+                        help="off-screen raster canvas or a real Tk canvas (default: raster)")
+    parser.add_argument('--designs', nargs='+', choices=list(DESIGNS), default=list(DESIGNS))
+    parser.add_argument('--frames', type=int, default=1200, help="frames per run (default: 1200)")
+    parser.add_argument('--repeats', type=int, default=5,
+                        help="repetitions of construction and render timings (default: 5)")
+    parser.add_argument('--runs', type=int, default=3,
+                        help="child runs per design; the fastest timing of each is kept (default: 3)")
+    parser.add_argument('--output', metavar='FILE', help="write JSON results to FILE instead of stdout")
+    parser.add_argument('--compare', metavar='FILE', help="report regressions against earlier results")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="relative slowdown counted as a regression (default: 0.25)")
+    parser.add_argument('--child', choices=list(DESIGNS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.child:
+        json.dump(measure(args.child, args.backend, args.frames, args.repeats), sys.stdout)
+        return
+    
+    report = run_suite(args)
+    print_summary(report)
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    
+    if args.compare:
+        with open(args.compare) as baseline:
+            regressions = compare(json.load(baseline), report, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""Shared building blocks for the analog clock designs."""
+from .watchdog import CanvasItemLeak, ItemWatchdog
+
+__all__ = ['CanvasItemLeak', 'ItemWatchdog']
@@ -0,0 +1,239 @@
+"""Hand sprites pre-rendered at every position, for playback without live geometry."""
+import math
+import mmap
+import os
+import struct
+import sys
+from collections import OrderedDict
+
+from .raster import Image, RasterCanvas
+from .static_cache import source_digest
+from .view import ClockView
+
+ATLAS_MAGIC = b'CLKATLAS'
+ATLAS_VERSION = 1
+
+# Positions per turn: the second hand ticks (60) or sweeps in 0.1 degree steps (3600).
+# Only the first quarter turn is stored, so each must be a multiple of 4.
+POSITIONS = {'second': 60, 'minute': 720, 'hour': 720}
+
+# Metadata file: header, the shared RGB palette, one record per hand, one per sprite
+HEADER = struct.Struct('<8sHd32s12sH')
+PALETTE_SIZE = 768
+HAND = struct.Struct('<16sII')
+# Byte offset of the sprite in the pixel file, its size and its top-left
+# corner in pixels relative to the pivot
+SPRITE = struct.Struct('<IHHhh')
+
+
+def metadata_path(path):
+    """The binary metadata file that goes with the atlas pixels at ``path``"""
+    return f"{path}.idx"
+
+
+def hand_sprites(clock, hand_type, count, zoom, positions=None):
+    """Yield ``(image, left, top)`` for a hand at its first ``count`` of ``positions`` angles.
+
+    The hand is drawn with the clock's own ``create_hand`` and
+    ``hand_coords`` on a transparent canvas centered on its pivot; each
+    RGBA image is cropped to the hand, ``left``/``top`` is its corner in
+    pixels relative to the pivot.
+    """
+    length, width, color = clock.hand_styles[hand_type]
+    cx, cy = clock.center_x, clock.center_y
+    coords = [c for part in clock.hand_coords(0, length, width, hand_type) for c in part]
+    reach = max(math.hypot(x - cx, y - cy) for x, y in zip(coords[0::2], coords[1::2])) + width + 2
+    size = math.ceil(2 * reach * zoom) + 2
+    pivot = size // 2
+    canvas = RasterCanvas(size, size, '#00000000')
+    view = ClockView(canvas, pivot - cx * zoom, pivot - cy * zoom, zoom)
+    
+    screen, clock.canvas = clock.canvas, view
+    try:
+        items = clock.create_hand(length, width, color, hand_type, "hand")
+    finally:
+        clock.canvas = screen
+    positions = positions or count
+    for index in range(count):
+        for item, part in zip(items, clock.hand_coords(index * 360 / positions, length, width, hand_type)):
+            view.coords(item, part)
+        image = canvas.render('RGBA')
+        box = image.getbbox() or (pivot, pivot, pivot + 1, pivot + 1)
+        yield image.crop(box), box[0] - pivot, box[1] - pivot
+
+
+def build_atlas(clock_cls, path, zoom=1.0, positions=None, clock_options=None):
+    """Pre-render every hand of ``clock_cls`` into an atlas at ``path``; returns the sprite count.
+
+    ``positions`` maps hand type to positions per turn (default:
+    POSITIONS). Each sprite is stored as two planes, colors indexed into
+    one palette shared by the whole atlas and an 8-bit alpha plane, so the
+    pixel file can be memory-mapped and sliced without decoding. Turning
+    a hand a quarter turn about its pivot maps pixels onto pixels, so only
+    the first quarter is stored and the rest are rotated copies.
+    Sprites are written as they are rendered; nothing but the palette is
+    held in memory.
+    """
+    positions = dict(POSITIONS, **(positions or {}))
+    for hand_type, count in positions.items():
+        if count % 4:
+            raise ValueError(f"{hand_type} hand positions must be a multiple of 4, not {count}")
+    clock = clock_cls(None, **(clock_options or {}))
+    hands = list(clock.hand_styles)
+    
+    # One palette from every hand pointing at 12 covers their colors and edges
+    samples = [next(hand_sprites(clock, hand_type, 1, zoom))[0] for hand_type in hands]
+    mosaic = Image.new('RGB', (sum(sample.width for sample in samples), max(sample.height for sample in samples)))
+    left = 0
+    for sample in samples:
+        mosaic.paste(sample.convert('RGB'), (left, 0))
+        left += sample.width
+    palette = mosaic.quantize(256)
+    
+    records = []
+    hand_records = []
+    offset = 0
+    partial = f"{path}.{os.getpid()}.tmp"
+    with open(partial, 'wb') as pixels:
+        for hand_type in hands:
+            first = len(records)
+            hand_records.append(HAND.pack(hand_type.encode(), positions[hand_type], first))
+            quarter = positions[hand_type] // 4
+            for image, left, top in hand_sprites(clock, hand_type, quarter, zoom, positions[hand_type]):
+                indices = image.convert('RGB').quantize(palette=palette, dither=Image.Dither.NONE)
+                pixels.write(indices.tobytes())
+                pixels.write(image.getchannel('A').tobytes())
+                records.append(SPRITE.pack(offset, image.width, image.height, left, top))
+                offset += 2 * image.width * image.height
+    
+    source = sys.modules[clock_cls.__module__].__file__
+    header = HEADER.pack(ATLAS_MAGIC, ATLAS_VERSION, zoom, clock_cls.__name__.encode(),
+                         source_digest(source).encode(), len(hands))
+    colors = bytes(palette.getpalette()[:PALETTE_SIZE]).ljust(PALETTE_SIZE, b'\0')
+    with open(f"{partial}.idx", 'wb') as metadata:
+        metadata.write(header + colors + b''.join(hand_records) + b''.join(records))
+    # Pixels last, so a reader never pairs new metadata with old pixels for long
+    os.replace(f"{partial}.idx", metadata_path(path))
+    os.replace(partial, path)
+    return len(records)
+
+
+class Atlas:
+    """A hand atlas opened for playback.
+
+    The metadata is read once; the pixel file is memory-mapped read-only,
+    so every process showing the same atlas shares one copy of it in the
+    page cache. ``sprite`` decodes a single sprite on demand.
+    """
+    
+    def __init__(self, path):
+        if Image is None:
+            raise RuntimeError("hand atlases need Pillow (pip install pillow)")
+        with open(metadata_path(path), 'rb') as metadata:
+            data = metadata.read()
+        magic, version, self.zoom, design, digest, hand_count = HEADER.unpack_from(data)
+        if magic != ATLAS_MAGIC or version != ATLAS_VERSION:
+            raise ValueError(f"{path} is not a version {ATLAS_VERSION} hand atlas")
+        self.path = path
+        self.design = design.rstrip(b'\0').decode()
+        self.digest = digest.decode()
+        offset = HEADER.size
+        self.palette = data[offset:offset + PALETTE_SIZE]
+        offset += PALETTE_SIZE
+        self.hands = {}
+        for _ in range(hand_count):
+            name, positions, first = HAND.unpack_from(data, offset)
+            self.hands[name.rstrip(b'\0').decode()] = (positions, first)
+            offset += HAND.size
+        self.sprites = list(SPRITE.iter_unpack(data[offset:]))
+        
+        with open(path, 'rb') as pixels:
+            self.pixels = mmap.mmap(pixels.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def check(self, clock_cls, zoom=None):
+        """Raise ValueError unless the atlas was built from ``clock_cls`` as it is now, at ``zoom``"""
+        source = sys.modules[clock_cls.__module__].__file__
+        if self.design != clock_cls.__name__:
+            raise ValueError(f"{self.path} holds {self.design} hands, not {clock_cls.__name__}")
+        if self.digest != source_digest(source):
+            raise ValueError(f"{self.path} is out of date; build it again")
+        if zoom is not None and zoom != self.zoom:
+            raise ValueError(f"{self.path} was built for zoom {self.zoom}, the clock is drawn at {zoom}")
+    
+    def position(self, hand_type, angle):
+        """Position of ``hand_type`` closest to ``angle`` degrees"""
+        positions, _ = self.hands[hand_type]
+        return round(angle * positions / 360) % positions
+    
+    def sprite(self, hand_type, position):
+        """``(image, left, top)`` of a hand at a position, as returned by hand_sprites"""
+        positions, first = self.hands[hand_type]
+        quarters, index = divmod(position, positions // 4)
+        offset, width, height, left, top = self.sprites[first + index]
+        size = width * height
+        view = memoryview(self.pixels)
+        indices = Image.frombuffer('P', (width, height), view[offset:offset + size], 'raw', 'P', 0, 1)
+        indices.putpalette(self.palette)
+        image = indices.convert('RGBA')
+        image.putalpha(Image.frombuffer('L', (width, height), view[offset + size:offset + 2 * size],
+                                        'raw', 'L', 0, 1))
+        for _ in range(quarters):
+            # A quarter turn clockwise about the pivot: (x, y) becomes (-y, x)
+            image = image.transpose(Image.Transpose.ROTATE_270)
+            left, top = -(top + image.width), left
+        return image, left, top
+
+
+class SpriteHands:
+    """Hands shown as one image item each, swapped for the atlas sprite of the angle.
+
+    Moving a hand is an ``itemconfig`` and a ``coords`` call, and only when
+    its sprite changes. A sprite is decoded from the mapped atlas and
+    turned into a canvas image the first time it is shown; the last
+    ``cache_size`` of them are kept, by default every position of every
+    hand, so after the first turn a swap converts nothing. A smaller
+    cache holds less memory (a 3600-position second hand is some 60-100 MB
+    of canvas images) at the cost of converting again each turn.
+    """
+    
+    def __init__(self, canvas, atlas, cx, cy, cache_size=None):
+        self.canvas = canvas
+        self.atlas = atlas
+        self.cx = cx
+        self.cy = cy
+        # (hand type, position) to (canvas image, x, y), least recently shown first
+        self.images = OrderedDict()
+        self.cache_size = cache_size or sum(positions for positions, _ in atlas.hands.values())
+        # Item to (position, canvas image); Tk drops an image whose last reference goes,
+        # so the one on screen is kept here even once the cache has let it go
+        self.shown = {}
+    
+    def image(self, hand_type, position):
+        """``(canvas image, x, y)`` of a hand's sprite at a position"""
+        key = (hand_type, position)
+        if key in self.images:
+            self.images.move_to_end(key)
+            return self.images[key]
+        image, left, top = self.atlas.sprite(hand_type, position)
+        zoom = self.atlas.zoom
+        sprite = self.images[key] = (self.canvas.photo_image(image), self.cx + left / zoom, self.cy + top / zoom)
+        if len(self.images) > self.cache_size:
+            self.images.popitem(last=False)
+        return sprite
+    
+    def create(self, hand_type, tag):
+        """Create the image item of a hand, pointing at 12; returns its id"""
+        image, x, y = self.image(hand_type, 0)
+        item = self.canvas.create_image(x, y, image=image, anchor='nw', tags=tag)
+        self.shown[item] = (0, image)
+        return item
+    
+    def move(self, item, hand_type, angle):
+        """Show the sprite of ``hand_type`` at ``angle`` in ``item``"""
+        position = self.atlas.position(hand_type, angle)
+        if self.shown[item][0] == position:
+            return
+        image, x, y = self.image(hand_type, position)
+        self.shown[item] = (position, image)
+        self.canvas.itemconfig(item, image=image)
+        self.canvas.coords(item, x, y)
@@ -0,0 +1,188 @@
+"""Drawing backends the clock designs render through."""
+import base64
+import io
+import tkinter as tk
+from collections import OrderedDict
+
+
+class CanvasBackend:
+    """The subset of the ``tk.Canvas`` API the clock designs draw with.
+
+    Items are created with ``create_line``, ``create_oval``,
+    ``create_polygon``, ``create_rectangle``, ``create_text`` and
+    ``create_image``, which return item ids. Existing items are changed
+    with ``coords`` and ``itemconfig`` and removed with ``delete``, by id
+    or tag. ``load_image`` turns a PNG path into whatever ``create_image``
+    accepts as ``image=`` on that backend; images are shared by path, so
+    many clocks on one canvas hold a single copy of their static layer.
+    ``photo_image`` does the same for an RGBA Pillow image, e.g. a hand
+    sprite. ``zoom`` is how many pixels one design unit covers.
+    """
+    
+    zoom = 1.0
+    
+    def load_image(self, path):
+        raise NotImplementedError
+    
+    def photo_image(self, image):
+        raise NotImplementedError
+
+
+def flatten(args):
+    """Flatten Tk-style coordinate arguments into a flat list of floats"""
+    if len(args) == 1 and isinstance(args[0], (list, tuple)):
+        # The common coords(item, [x0, y0, ...]) call
+        try:
+            return list(map(float, args[0]))
+        except TypeError:
+            pass  # nested points
+    coords = []
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            coords.extend(flatten(arg))
+        else:
+            coords.append(float(arg))
+    return coords
+
+
+class RetainedCanvas(CanvasBackend):
+    """Canvas items kept in memory, for backends that draw them all at once.
+
+    ``items`` maps item id to ``[kind, coords, options, tags]`` in stacking
+    order; subclasses turn that into output (an image, a document).
+    ``_changed`` is called with every item that is changed or deleted.
+    """
+    
+    def __init__(self):
+        self.items = {}
+        self.next_id = 1
+    
+    def _changed(self, item):
+        pass
+    
+    def _create(self, kind, args, options):
+        item = self.next_id
+        self.next_id += 1
+        tags = options.pop('tags', ())
+        self.items[item] = [kind, flatten(args), options, (tags,) if isinstance(tags, str) else tuple(tags)]
+        return item
+    
+    def create_line(self, *args, **options):
+        return self._create('line', args, options)
+    
+    def create_oval(self, *args, **options):
+        return self._create('oval', args, options)
+    
+    def create_polygon(self, *args, **options):
+        return self._create('polygon', args, options)
+    
+    def create_rectangle(self, *args, **options):
+        return self._create('rectangle', args, options)
+    
+    def create_text(self, *args, **options):
+        return self._create('text', args, options)
+    
+    def create_image(self, *args, **options):
+        return self._create('image', args, options)
+    
+    def find_withtag(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            return (tag_or_id,) if tag_or_id in self.items else ()
+        if tag_or_id == 'all':
+            return tuple(self.items)
+        return tuple(item for item, (_, _, _, tags) in self.items.items() if tag_or_id in tags)
+    
+    def find_all(self):
+        return tuple(self.items)
+    
+    def gettags(self, item):
+        return self.items[item][3]
+    
+    def coords(self, tag_or_id, *args):
+        items = self.find_withtag(tag_or_id)
+        if not args:
+            return list(self.items[items[0]][1]) if items else []
+        coords = flatten(args)
+        for item in items:
+            self.items[item][1] = coords
+            self._changed(item)
+    
+    def itemconfig(self, tag_or_id, **options):
+        tags = options.pop('tags', None)
+        for item in self.find_withtag(tag_or_id):
+            self.items[item][2].update(options)
+            if tags is not None:
+                self.items[item][3] = (tags,) if isinstance(tags, str) else tuple(tags)
+            self._changed(item)
+    
+    itemconfigure = itemconfig
+    
+    def move(self, tag_or_id, dx, dy):
+        for item in self.find_withtag(tag_or_id):
+            coords = self.items[item][1]
+            self.items[item][1] = [c + (dx if i % 2 == 0 else dy) for i, c in enumerate(coords)]
+            self._changed(item)
+    
+    def scale(self, tag_or_id, x, y, xscale, yscale):
+        for item in self.find_withtag(tag_or_id):
+            coords = self.items[item][1]
+            self.items[item][1] = [
+                x + (c - x) * xscale if i % 2 == 0 else y + (c - y) * yscale
+                for i, c in enumerate(coords)
+            ]
+            self._changed(item)
+    
+    def delete(self, *tags_or_ids):
+        for tag_or_id in tags_or_ids:
+            for item in self.find_withtag(tag_or_id):
+                del self.items[item]
+                self._changed(item)
+
+
+def pixel_font(font):
+    """A Tk font tuple with its point size turned into pixels at 96 dpi"""
+    if isinstance(font, tuple) and len(font) > 1 and font[1] > 0:
+        return (font[0], -round(font[1] * 96 / 72)) + font[2:]
+    return font
+
+
+class TkBackend(tk.Canvas, CanvasBackend):
+    """Draw on a live Tk canvas.
+
+    Font sizes are drawn in pixels, as on a 96 dpi screen, so text scales
+    with the zoom like everything else instead of with the screen's dpi.
+    The last ``image_cache`` images loaded are kept, so resizing back and
+    forth between a few sizes reuses their static layers.
+    """
+    
+    def __init__(self, *args, image_cache=8, **options):
+        super().__init__(*args, **options)
+        self.images = OrderedDict()
+        self.image_cache = image_cache
+    
+    def load_image(self, path):
+        if path in self.images:
+            self.images.move_to_end(path)
+            return self.images[path]
+        image = self.images[path] = tk.PhotoImage(file=path, master=self)
+        if len(self.images) > self.image_cache:
+            self.images.popitem(last=False)
+        return image
+    
+    def photo_image(self, image):
+        # Tk reads PNG data; the caller keeps the PhotoImage referenced
+        data = io.BytesIO()
+        image.save(data, 'PNG', compress_level=1)
+        return tk.PhotoImage(data=base64.b64encode(data.getvalue()), format='png', master=self)
+    
+    def create_text(self, *args, **options):
+        if 'font' in options:
+            options['font'] = pixel_font(options['font'])
+        return super().create_text(*args, **options)
+    
+    def itemconfig(self, tag_or_id, **options):
+        if 'font' in options:
+            options['font'] = pixel_font(options['font'])
+        return super().itemconfig(tag_or_id, **options)
+    
+    itemconfigure = itemconfig
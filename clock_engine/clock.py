@@ -0,0 +1,418 @@
+"""Frame loop, layers and hands shared by every clock face."""
+import argparse
+import os
+import sys
+import tkinter as tk
+
+from .atlas import Atlas, SpriteHands
+from .backend import TkBackend
+from .faces import MAX_DETAIL, detail_level, draw_plan, load_face
+from .geometry import angle_index, pixel_step_interval
+from .headless import add_headless_arguments, render_frames_from_args
+from .metrics import CountingCanvas, attach_metrics
+from .raster import RasterCanvas
+from .readouts import TextReadout
+from .scheduler import FrameAnimations, FrameScheduler, next_frame_delay
+from .serve import design_name, serve
+from .static_cache import cached_static_layer
+from .timesource import WallClock, add_time_arguments, time_source_from_args
+from .view import ClockView, fit_zoom
+from .watchdog import ItemWatchdog
+from .zones import parse_zone, zone_label, zone_time
+
+# Rasterize the static layer for a new size once resizing has paused this long
+RESIZE_SETTLE_MS = 150
+
+
+class BaseClock:
+    """A clock face on top of the shared engine.
+
+    A face is mostly a description: its design size and colors, its hand
+    styles, a face file (``face_file``, see clock_engine.faces) whose
+    'static' layer is rasterized once into the cached static layer and
+    whose other layers live parts draw with ``draw_layer``, the methods
+    that create live items on top of it (``live_parts``), and any extra
+    animations to schedule (``animations``, method name to period). It
+    implements ``hand_coords`` and ``create_hand`` for its hand shapes and
+    registers its digital readouts with ``add_readout``. The engine builds
+    the canvas, moves the hands, updates the readouts and paces the frames.
+
+    ``root=None`` draws off-screen on a RasterCanvas; passing ``canvas``
+    (e.g. a ClockView) puts the clock on a shared canvas whose owner
+    drives the frames. In its own window the clock draws through a
+    ClockView and scales to fit whenever the window is resized.
+
+    With ``atlas`` (see clock_engine.atlas) the hands are not drawn at all
+    but shown as pre-rendered sprites, at the size the atlas was built for.
+    ``zone`` (a tzinfo or an IANA name) shows the time in that zone instead
+    of local time; its offset is looked up once per DST period and shared
+    with every clock in the zone (see clock_engine.zones).
+
+    Small clocks draw their face at a reduced level of detail (see
+    clock_engine.faces.detail_level); ``detail`` fixes the level instead.
+    The live layers are made coarser still while their items exceed
+    ``item_budget``, and keep the level they were created at. The static
+    layer follows the size it is rasterized for.
+    """
+    
+    # Design size; everything is drawn in these coordinates
+    width = 680
+    height = 750
+    background = '#1a1a1a'
+    title = "Clock"
+    window_size = "700x800"
+    
+    center_x = 340
+    center_y = 375
+    
+    # Hand styles (length, width, color), drawn bottom to top; the
+    # 'second' hand decides how often a sweeping clock redraws
+    hand_styles = {}
+    # Hand sprite Atlas, set per instance; without one the hands are drawn as geometry
+    atlas = None
+    
+    # Face file relative to the face's module; static_parts are drawn after its static layer
+    face_file = None
+    static_parts = ()
+    live_parts = ('create_hands', 'create_readouts')
+    animations = {}
+    
+    def __init__(self, root, static_cache=True, motion='sweep', adaptive=True, canvas=None,
+                 time_source=None, metrics=False, metrics_file=None, face=None, atlas=None, zone=None,
+                 detail=None, item_budget=None):
+        self.root = root
+        self.zone = zone
+        
+        # Hand sprites replace the hand geometry; they only exist at one size
+        self.atlas = Atlas(atlas) if isinstance(atlas, str) else atlas
+        
+        if canvas is not None:
+            # Part of a shared canvas (e.g. a ClockView on a dashboard);
+            # the owner drives frames
+            self.canvas = canvas
+        elif root is None:
+            # Headless: draw off-screen, frames are rendered by the caller
+            self.canvas = RasterCanvas(self.width, self.height, self.background)
+        else:
+            # Start at the same physical size on high-dpi screens
+            scale = max(1.0, round(root.winfo_fpixels('1i') / 96 * 4) / 4)
+            if self.atlas is not None:
+                scale = self.atlas.zoom
+            window_width, window_height = (int(size) for size in self.window_size.split('x'))
+            title = self.title if zone is None else f"{self.title} - {zone_label(zone_time(zone).zone)}"
+            self.root.title(title)
+            self.root.geometry(f"{round(window_width * scale)}x{round(window_height * scale)}")
+            self.root.configure(bg=self.background)
+            self.screen = TkBackend(
+                root, width=round(self.width * scale), height=round(self.height * scale),
+                bg=self.background, highlightthickness=0
+            )
+            self.screen.pack(pady=round(25 * scale), fill='both', expand=True)
+            self.canvas = ClockView(self.screen, zoom=scale, tag="clock")
+            self.resize_job = None
+            self.screen.bind('<Configure>', self.on_resize)
+            if metrics or metrics_file:
+                # Parts keep the canvas they are built with; count their item churn from the start
+                self.canvas = CountingCanvas(self.canvas)
+        
+        # 'sweep' moves the second hand smoothly, 'tick' once per second.
+        # Adaptive mode only wakes up when a hand tip moves a whole pixel.
+        if motion not in ('sweep', 'tick'):
+            raise ValueError(f"motion must be 'sweep' or 'tick', not {motion!r}")
+        self.motion = motion
+        self.adaptive = adaptive
+        self.time_source = time_source or WallClock()
+        self.zoom_changed()
+        
+        # Static scene rasterized once into a cached image
+        self.static_cache = static_cache
+        
+        # Compiled face artwork; ``face`` swaps in another face file
+        self.detail = detail
+        self.item_budget = item_budget
+        self.face_source = face or (self.face_path() if self.face_file else None)
+        self.face = self.static_face = None
+        if self.face_source:
+            self.face = load_face(self.face_source, self.detail_for(self.canvas.zoom, budgeted=True))
+            self.static_face = load_face(self.face_source, self.detail_for(self.canvas.zoom))
+        self.theme = self.static_face.theme if self.static_face else 'default'
+        self.readouts = []
+        
+        self.draw_static_layer()
+        for part in self.live_parts:
+            getattr(self, part)()
+        
+        # Report canvas items piling up across frames
+        self.watchdog = ItemWatchdog(self.canvas)
+        self.frame_animations = None
+        
+        if root is not None and canvas is None:
+            # One timer paces the frames and every animation
+            self.scheduler = FrameScheduler(root)
+            update = self.update_clock
+            if metrics or metrics_file:
+                # Frame timing is only wrapped in when asked for
+                update = attach_metrics(self, self.scheduler, update, overlay=metrics, path=metrics_file)
+            self.scheduler.add_job(update, 0.05)
+            animations = [(getattr(self, name), period) for name, period in self.animations.items()]
+            if adaptive:
+                # Animations step with the frames; on timers of their own they would wake the clock
+                self.frame_animations = FrameAnimations(animations)
+            else:
+                for callback, period in animations:
+                    self.scheduler.add_job(callback, period)
+            self.scheduler.pause_while_unmapped()
+            self.scheduler.start()
+    
+    @classmethod
+    def face_path(cls):
+        """Absolute path of the design's own face file"""
+        module_dir = os.path.dirname(os.path.abspath(sys.modules[cls.__module__].__file__))
+        return os.path.join(module_dir, cls.face_file)
+    
+    def detail_for(self, zoom, budgeted=False):
+        """Level of detail of the face at ``zoom``; ``budgeted`` also fits the live layers in item_budget"""
+        if self.detail is not None:
+            return self.detail
+        detail = detail_level(zoom)
+        if budgeted and self.item_budget is not None:
+            while detail < MAX_DETAIL and self.live_face_items(detail) > self.item_budget:
+                detail += 1
+        return detail
+    
+    def live_face_items(self, detail):
+        """Canvas items the face's live layers make at a level of detail"""
+        layers = load_face(self.face_source, detail).layers
+        return sum(len(plan) for name, plan in layers.items() if name != 'static')
+    
+    def draw_layer(self, name, tags=None):
+        """Draw a layer of the face file, tagged with its name; returns the item ids"""
+        return draw_plan(self.canvas, self.face.layers[name], name if tags is None else tags)
+    
+    def draw_static_scene(self):
+        """Draw everything that never changes while the clock runs"""
+        if self.static_face is not None:
+            draw_plan(self.canvas, self.static_face.layers.get('static', ()))
+        for part in self.static_parts:
+            getattr(self, part)()
+    
+    def render_static_scene(self, canvas):
+        """Draw the static scene onto another canvas, e.g. for rasterizing"""
+        screen, self.canvas = self.canvas, canvas
+        try:
+            self.draw_static_scene()
+        finally:
+            self.canvas = screen
+    
+    def static_layer_path(self, rasterize=True):
+        """Cached static image for the current zoom, or None (see cached_static_layer)"""
+        if not self.static_cache:
+            return None
+        # The face's own source file is part of the cache key
+        source = sys.modules[type(self).__module__].__file__
+        return cached_static_layer(
+            type(self).__name__, self.width, self.height, self.theme,
+            self.background, self.render_static_scene, source, self.canvas.zoom, rasterize
+        )
+    
+    def draw_static_layer(self):
+        """Show the static scene as one cached image, or as vector items"""
+        path = self.static_layer_path()
+        if path is None:
+            self.static_image = None
+            self.draw_static_scene()
+            return
+        
+        # Keep a reference, Tk does not hold on to PhotoImage objects
+        self.static_image = self.canvas.load_image(path)
+        self.static_zoom = self.canvas.zoom
+        self.canvas.create_image(0, 0, image=self.static_image, anchor='nw', tags="static")
+    
+    def refresh_static_layer(self, rasterize=True):
+        """Show the static image for the current zoom; False if it isn't rasterized yet"""
+        if self.static_image is None or self.static_zoom == self.canvas.zoom:
+            # Vector items are scaled in place with everything else
+            return True
+        if self.static_face is not None:
+            self.static_face = load_face(self.face_source, self.detail_for(self.canvas.zoom))
+            self.theme = self.static_face.theme
+        path = self.static_layer_path(rasterize)
+        if path is None:
+            return False
+        self.static_image = self.canvas.load_image(path)
+        self.static_zoom = self.canvas.zoom
+        self.canvas.itemconfig("static", image=self.static_image)
+        return True
+    
+    def zoom_changed(self):
+        """Recompute what depends on the drawn size, like when a hand tip moves a pixel"""
+        self.pixel_interval = pixel_step_interval(self.hand_styles['second'][0] * self.canvas.zoom)
+    
+    def relayout(self, zoom, x, y):
+        """Move and scale the drawn clock in place; False while its static image is stale"""
+        canvas = self.canvas
+        if (zoom, x, y) != (canvas.zoom, canvas.x, canvas.y):
+            zoomed = zoom != canvas.zoom
+            canvas.rescale(zoom, x, y)
+            if zoomed:
+                self.zoom_changed()
+        # Sizes seen before come from the image cache; new ones wait for resizing to settle
+        return self.refresh_static_layer(rasterize=False)
+    
+    def on_resize(self, event):
+        """Fit the clock to its resized window"""
+        if self.resize_job is not None:
+            self.root.after_cancel(self.resize_job)
+            self.resize_job = None
+        zoom, x, y = fit_zoom(self.width, self.height, event.width, event.height)
+        if self.atlas is not None:
+            # Hand sprites have one size; keep it and only center the clock
+            zoom = self.atlas.zoom
+            x, y = (event.width - self.width * zoom) / 2, (event.height - self.height * zoom) / 2
+        if not self.relayout(zoom, x, y):
+            self.resize_job = self.root.after(RESIZE_SETTLE_MS, self.finish_resize)
+    
+    def finish_resize(self):
+        self.resize_job = None
+        self.refresh_static_layer()
+    
+    def hand_coords(self, angle, length, width, hand_type):
+        """Coordinates of every item making up a hand, in creation order"""
+        raise NotImplementedError
+    
+    def create_hand(self, length, width, color, hand_type, tag):
+        """Create the canvas items of a hand once and return their ids"""
+        raise NotImplementedError
+    
+    def create_hands(self):
+        """Create all hands once; frames only move them"""
+        self.hand_items = {}
+        self.hand_angles = {}
+        if self.atlas is not None:
+            self.atlas.check(type(self), self.canvas.zoom)
+            self.sprite_hands = SpriteHands(self.canvas, self.atlas, self.center_x, self.center_y)
+            for hand_type in self.hand_styles:
+                self.hand_items[hand_type] = [self.sprite_hands.create(hand_type, "hands")]
+            return
+        for hand_type, (length, width, color) in self.hand_styles.items():
+            self.hand_items[hand_type] = self.create_hand(length, width, color, hand_type, "hands")
+    
+    def move_hand(self, hand_type, angle):
+        """Move an existing hand by updating its coordinates in place"""
+        if self.atlas is not None:
+            self.sprite_hands.move(self.hand_items[hand_type][0], hand_type, angle)
+            return
+        
+        # Hands that haven't moved a full table step keep their coordinates
+        index = angle_index(angle)
+        if self.hand_angles.get(hand_type) == index:
+            return
+        self.hand_angles[hand_type] = index
+        
+        length, width, color = self.hand_styles[hand_type]
+        parts = self.hand_coords(angle, length, width, hand_type)
+        for item, coords in zip(self.hand_items[hand_type], parts):
+            self.canvas.coords(item, coords)
+    
+    def create_readouts(self):
+        """Create the text items of the digital readouts with add_readout"""
+    
+    def add_readout(self, items, formatter):
+        """Show ``formatter(struct_time)`` in ``items`` every frame, if it changed"""
+        self.readouts.append((TextReadout(self.canvas, items), formatter))
+    
+    def update_clock(self):
+        """Draw the frame for the current time and say when the next one is due"""
+        now = self.time_source.now()
+        self.render_frame(now)
+        if self.frame_animations is not None:
+            self.frame_animations.run()
+        self.watchdog.check()
+        
+        # Tell the scheduler when something will next visibly change
+        if self.adaptive:
+            return self.time_source.wall_delay(next_frame_delay(now, self.motion, self.pixel_interval))
+    
+    def local_time(self, timestamp):
+        """The struct_time shown for an epoch time, in ``zone`` or else local time"""
+        return zone_time(self.zone).struct_time(timestamp)
+    
+    def hand_angles_at(self, timestamp, current_time):
+        """Angles in degrees clockwise from 12 of each hand, for an epoch time and its struct_time"""
+        hours = current_time.tm_hour % 12
+        minutes = current_time.tm_min
+        seconds = current_time.tm_sec
+        
+        # Calculate angles with smooth movement
+        second_angle = seconds * 6
+        if self.motion == 'sweep':
+            second_angle += (timestamp % 1) * 6  # Smooth second movement
+        return {
+            'second': second_angle,
+            'minute': minutes * 6 + seconds * 0.1,
+            'hour': hours * 30 + minutes * 0.5,
+        }
+    
+    def turning_parts(self):
+        """``(RotatingItems, degrees per second)`` of item groups that keep turning, e.g. a bezel"""
+        return ()
+    
+    def render_frame(self, timestamp):
+        """Draw the hands, readouts and animations for a given epoch time"""
+        current_time = self.local_time(timestamp)
+        
+        # Move the existing hands instead of recreating them
+        for hand_type, angle in self.hand_angles_at(timestamp, current_time).items():
+            self.move_hand(hand_type, angle)
+        
+        # Readouts are reconfigured only when their text changes
+        for readout, formatter in self.readouts:
+            readout.set(formatter(current_time))
+        
+        self.animate_frame(timestamp)
+    
+    def animate_frame(self, timestamp):
+        """Hook for face animations that follow the displayed time"""
+
+
+def run_clock(clock_cls, description):
+    """Command line entry point shared by the clock scripts"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--motion', choices=['sweep', 'tick'], default='sweep',
+                        help="smooth sweeping or once-per-second second hand")
+    parser.add_argument('--fixed-rate', action='store_true',
+                        help="redraw at a steady 20 FPS instead of only when something moves")
+    parser.add_argument('--metrics', action='store_true',
+                        help="show frame rate, frame times and scheduler lateness on the clock")
+    parser.add_argument('--metrics-file', metavar='FILE',
+                        help="write the same numbers to FILE every 10 s (.prom for Prometheus text, else JSON)")
+    parser.add_argument('--face', metavar='FILE',
+                        help="draw the clock from another face file (JSON, or TOML on Python 3.11+)")
+    parser.add_argument('--atlas', metavar='FILE',
+                        help="show the hands as sprites from an atlas built with Clock_atlas.py")
+    parser.add_argument('--zone', type=parse_zone, default=None,
+                        help="IANA time zone to show, e.g. Asia/Tokyo (default: local time)")
+    parser.add_argument('--serve', nargs='?', const='127.0.0.1:8080', metavar='[HOST:]PORT',
+                        help="serve PNG/SVG images of the clock over HTTP instead (default: 127.0.0.1:8080)")
+    add_time_arguments(parser)
+    add_headless_arguments(parser)
+    args = parser.parse_args()
+    if args.face:
+        # Compile it here first, so a broken face file fails once and not in every worker
+        load_face(args.face)
+    if args.atlas:
+        # Same for the atlas; headless frames are drawn at zoom 1
+        Atlas(args.atlas).check(clock_cls, 1.0 if args.frames else None)
+    if args.serve:
+        serve({design_name(clock_cls): clock_cls}, args.serve)
+        return
+    if args.frames:
+        render_frames_from_args(clock_cls, args, motion=args.motion, face=args.face, atlas=args.atlas,
+                                zone=args.zone)
+        return
+    
+    root = tk.Tk()
+    clock = clock_cls(root, motion=args.motion, adaptive=not args.fixed_rate,
+                      time_source=time_source_from_args(args), metrics=args.metrics,
+                      metrics_file=args.metrics_file, face=args.face, atlas=args.atlas, zone=args.zone)
+    root.mainloop()
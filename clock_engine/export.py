@@ -0,0 +1,309 @@
+"""Export clock animations as PNG sequences, animated GIFs or video."""
+import os
+import shutil
+import subprocess
+import sys
+import time
+from collections import deque
+from multiprocessing import Pool
+
+from .raster import Image, RasterCanvas
+from .timesource import parse_timestamp
+from .view import ClockView, fit_zoom
+
+try:
+    from PIL import GifImagePlugin, ImageChops
+except ImportError:  # Pillow is optional; RasterCanvas reports it missing
+    GifImagePlugin = ImageChops = None
+
+# Output extensions that are piped through ffmpeg
+VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.mov', '.webm', '.avi')
+FORMATS = ('png', 'gif', 'raw', 'video')
+
+# The clock, canvas and settings each worker process renders with, built once per process
+_worker = None
+
+
+def output_format(output):
+    """Guess the export format from the output path"""
+    extension = os.path.splitext(output)[1].lower()
+    if output == '-' or extension in ('.rgb', '.raw'):
+        return 'raw'
+    if extension == '.gif':
+        return 'gif'
+    if extension in VIDEO_EXTENSIONS:
+        return 'video'
+    return 'png'
+
+
+def frame_timestamps(start, duration, fps, speed=1.0):
+    """Clock times of the frames of a ``duration`` second clip at ``fps`` frames per second"""
+    return [start + index * speed / fps for index in range(round(duration * fps))]
+
+
+class ExportWorker:
+    """A clock drawn at the export size, turning timestamps into frame data.
+
+    ``fmt`` decides what a frame becomes: 'png' writes the file into
+    ``output`` and returns its path, 'gif' returns the frame's palette
+    indices (mapped onto ``palette`` without dithering, so unchanged pixels
+    keep their index from frame to frame), and 'raw' or 'video' return
+    packed RGB bytes. PNG files are written at ``compress_level``.
+    """
+    
+    def __init__(self, clock_cls, size, fmt, output=None, palette=None, clock_options=None, compress_level=1):
+        width, height = size
+        zoom, x, y = fit_zoom(clock_cls.width, clock_cls.height, width, height)
+        self.raster = RasterCanvas(width, height, clock_cls.background)
+        self.clock = clock_cls(None, canvas=ClockView(self.raster, x, y, zoom), **(clock_options or {}))
+        self.fmt = fmt
+        self.output = output
+        self.compress_level = compress_level
+        self.palette = None
+        if palette is not None:
+            self.palette = Image.new('P', (1, 1))
+            self.palette.putpalette(palette)
+    
+    def render(self, timestamp):
+        """Draw the frame for ``timestamp`` and return it as an RGB image"""
+        self.clock.render_frame(timestamp)
+        return self.raster.render()
+    
+    def frame(self, index, timestamp):
+        image = self.render(timestamp)
+        if self.fmt == 'png':
+            path = os.path.join(self.output, f"frame_{index:06d}.png")
+            image.save(path, compress_level=self.compress_level)
+            return path
+        if self.fmt == 'gif':
+            return image.quantize(palette=self.palette, dither=Image.Dither.NONE).tobytes()
+        return image.tobytes()
+
+
+def _init_worker(*args):
+    global _worker
+    _worker = ExportWorker(*args)
+
+
+def _render_batch(batch):
+    first, timestamps = batch
+    return [_worker.frame(first + offset, timestamp) for offset, timestamp in enumerate(timestamps)]
+
+
+class PngSequence:
+    """Frames already written by the workers; only counts them"""
+    
+    def __init__(self):
+        self.frames = 0
+    
+    def write(self, path):
+        self.frames += 1
+    
+    def close(self):
+        pass
+
+
+class RawVideo:
+    """Packed 8-bit RGB frames back to back, e.g. for ``ffmpeg -f rawvideo``"""
+    
+    def __init__(self, output):
+        self.stream = sys.stdout.buffer if output == '-' else open(output, 'wb')
+        self.frames = 0
+    
+    def write(self, data):
+        self.stream.write(data)
+        self.frames += 1
+    
+    def close(self):
+        self.stream.flush()
+        if self.stream is not sys.stdout.buffer:
+            self.stream.close()
+
+
+class FfmpegVideo(RawVideo):
+    """Raw frames piped into an ffmpeg process that encodes ``output``"""
+    
+    def __init__(self, output, size, fps):
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
+            raise RuntimeError("video export needs ffmpeg on the PATH; "
+                               "export --format raw and encode it elsewhere instead")
+        width, height = size
+        self.process = subprocess.Popen([
+            ffmpeg, '-loglevel', 'error', '-y',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f"{width}x{height}", '-r', str(fps), '-i', '-',
+            # yuv420p, which every player understands, needs even dimensions
+            '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', output,
+        ], stdin=subprocess.PIPE)
+        self.stream = self.process.stdin
+        self.frames = 0
+    
+    def close(self):
+        self.stream.close()
+        if self.process.wait():
+            raise RuntimeError(f"ffmpeg exited with status {self.process.returncode}")
+
+
+class GifAnimation:
+    """Animated GIF written one frame at a time.
+
+    Frames share one global palette. Each frame after the first only
+    stores the rectangle that changed since the previous one, and a frame
+    identical to the previous one just extends its display time, so a
+    clip where only the hands move stays small. Only the previous frame is
+    kept in memory, however long the clip.
+    """
+    
+    def __init__(self, output, size, palette, fps, loop=0):
+        self.file = open(output, 'wb')
+        self.size = size
+        self.palette = palette
+        self.fps = fps
+        self.loop = loop
+        self.frames = 0
+        self.previous = None
+        # Frame waiting for its display time to be known: [image, offset, centiseconds]
+        self.pending = None
+    
+    def write(self, data):
+        index = self.frames
+        self.frames += 1
+        # GIF delays are in centiseconds; rounding the running total keeps the clip in sync
+        delay = round((index + 1) * 100 / self.fps) - round(index * 100 / self.fps)
+        indices = Image.frombytes('L', self.size, data)
+        if self.previous is None:
+            box = (0, 0) + self.size
+        else:
+            box = ImageChops.difference(indices, self.previous).getbbox()
+            if box is None:
+                self.pending[2] += delay
+                return
+        self.previous = indices
+        
+        frame = Image.frombytes('P', self.size, data)
+        frame.putpalette(self.palette)
+        if self.pending is None:
+            header, _ = GifImagePlugin.getheader(frame, info={'loop': self.loop, 'optimize': False})
+            self.file.write(b''.join(header))
+        self.flush()
+        self.pending = [frame.crop(box), box[:2], delay]
+    
+    def flush(self):
+        if self.pending is not None:
+            frame, offset, delay = self.pending
+            self.file.write(b''.join(GifImagePlugin.getdata(frame, offset, duration=delay * 10)))
+    
+    def close(self):
+        self.flush()
+        self.file.write(b';')
+        self.file.close()
+
+
+def export_animation(clock_cls, timestamps, output, fps, size=None, fmt=None, processes=None,
+                     clock_options=None, compress_level=1):
+    """Render a frame per timestamp and write them to ``output``; returns the frame count.
+
+    ``fmt`` is 'png' (a directory of numbered frames), 'gif', 'raw'
+    (packed RGB, '-' for stdout) or 'video' (encoded by ffmpeg, chosen by
+    the extension); by default it follows the extension of ``output``.
+    PNG frames are written at ``compress_level``; encoding them is most
+    of the cost of a frame, which 'raw' skips.
+    ``size`` is the frame size in pixels, the clock centered and scaled to
+    fit (default: the design size).
+
+    Consecutive frames are rendered in batches on a process pool, each
+    worker building the clock and its static layer once. Results are
+    written in order as they arrive, with only a few batches per worker in
+    flight, so memory stays flat however long the clip. ``processes=1``
+    renders in the calling process.
+    """
+    fmt = fmt or output_format(output)
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}, not {fmt!r}")
+    size = tuple(size or (clock_cls.width, clock_cls.height))
+    clock_options = clock_options or {}
+    if fmt == 'png':
+        os.makedirs(output, exist_ok=True)
+    
+    # One clock here first: rasterizes the static layer once for all
+    # workers, fails early on bad options and picks the GIF palette
+    palette = None
+    reference = ExportWorker(clock_cls, size, 'raw', clock_options=clock_options)
+    if fmt == 'gif':
+        palette = reference.render(timestamps[0]).quantize(255).getpalette()
+    
+    if fmt == 'png':
+        writer = PngSequence()
+    elif fmt == 'gif':
+        writer = GifAnimation(output, size, palette, fps)
+    elif fmt == 'raw':
+        writer = RawVideo(output)
+    else:
+        writer = FfmpegVideo(output, size, fps)
+    
+    processes = processes or os.cpu_count() or 1
+    batch = max(1, min(16, len(timestamps) // (processes * 4)))
+    batches = [(first, timestamps[first:first + batch]) for first in range(0, len(timestamps), batch)]
+    worker_args = (clock_cls, size, fmt, output, palette, clock_options, compress_level)
+    try:
+        if processes == 1:
+            _init_worker(*worker_args)
+            for frames in map(_render_batch, batches):
+                for frame in frames:
+                    writer.write(frame)
+        else:
+            with Pool(processes, initializer=_init_worker, initargs=worker_args) as pool:
+                # Keep the workers busy without queueing up the whole clip
+                pending = deque()
+                for job in batches:
+                    pending.append(pool.apply_async(_render_batch, (job,)))
+                    if len(pending) >= 2 * processes:
+                        for frame in pending.popleft().get():
+                            writer.write(frame)
+                while pending:
+                    for frame in pending.popleft().get():
+                        writer.write(frame)
+    finally:
+        writer.close()
+    return writer.frames
+
+
+def parse_size(value):
+    """``WIDTHxHEIGHT`` as a pair of ints"""
+    width, height = (int(part) for part in value.lower().split('x'))
+    return width, height
+
+
+def add_export_arguments(parser):
+    """Add the clip length, frame rate, size and format options to an argument parser"""
+    group = parser.add_argument_group('export')
+    group.add_argument('--duration', type=float, default=10.0,
+                       help="length of the clip in seconds (default: 10)")
+    group.add_argument('--end', type=parse_timestamp, default=None, metavar='TIME',
+                       help="clock time to stop at instead of --duration; needs --start")
+    group.add_argument('--fps', type=float, default=25.0, help="frames per second (default: 25)")
+    group.add_argument('--size', type=parse_size, default=None, metavar='WIDTHxHEIGHT',
+                       help="frame size in pixels (default: the clock's design size)")
+    group.add_argument('--format', choices=FORMATS, default=None,
+                       help="png sequence, gif, raw RGB or ffmpeg video (default: from the output name)")
+    group.add_argument('--compress-level', type=int, choices=range(10), default=1, metavar='0-9',
+                       help="zlib level of PNG frames; 0 is fastest and largest (default: 1)")
+    group.add_argument('--processes', type=int, default=None,
+                       help="worker processes (default: one per CPU)")
+
+
+def export_from_args(clock_cls, args, **clock_options):
+    """Run export_animation for the export and time options"""
+    start = time.time() if args.start is None else args.start
+    duration = args.duration
+    if args.end is not None:
+        duration = (args.end - start) / args.speed
+    timestamps = frame_timestamps(start, duration, args.fps, args.speed)
+    if not timestamps:
+        raise SystemExit("nothing to export: the clip is shorter than one frame")
+    began = time.perf_counter()
+    frames = export_animation(clock_cls, timestamps, args.output, args.fps, args.size, args.format,
+                              args.processes, clock_options, args.compress_level)
+    elapsed = time.perf_counter() - began
+    print(f"Exported {frames} frames to {args.output} in {elapsed:.2f}s "
+          f"({frames / elapsed:.0f} frames/s)", file=sys.stderr)
@@ -0,0 +1,504 @@
+"""Clock faces described in JSON or TOML files, compiled once into draw plans."""
+import hashlib
+import json
+import math
+import os
+import pickle
+from functools import lru_cache
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: JSON faces only
+    tomllib = None
+
+from .geometry import dial_vectors, perpendicular
+from .gradient import gradient_rings
+from .static_cache import cache_dir, source_digest
+
+# Bump when the plan format changes in a way the key can't see
+PLAN_VERSION = 1
+
+# Element keys handed straight to the canvas
+CANVAS_OPTIONS = ('fill', 'outline', 'width', 'stipple', 'capstyle', 'font', 'anchor', 'tags')
+
+# Zoom below which each further level of detail is used; level 0 is the full face
+DETAIL_ZOOMS = (0.75, 0.4, 0.2, 0.1)
+MAX_DETAIL = len(DETAIL_ZOOMS)
+# Pixels apart that gradient rings, rays, serrations and grid lines must stay
+# at each reduced level of detail; anything closer is thinned out. Smaller
+# clocks keep them further apart, so every level draws less than the last.
+DETAIL_SPACING = (8, 10, 12, 16)
+
+
+class Face:
+    """A compiled face: named layers of draw primitives.
+
+    Each layer is a tuple of ``(kind, coords, options)`` in stacking order,
+    in absolute design coordinates, so drawing it is one ``create_<kind>``
+    call per primitive with no geometry left to compute.
+    """
+    
+    def __init__(self, name, digest, layers, detail=0):
+        self.name = name
+        self.digest = digest
+        self.layers = layers
+        self.detail = detail
+    
+    @property
+    def theme(self):
+        """Theme key for the static layer cache; changes with the file contents and detail"""
+        if self.detail:
+            return f"{self.name}-{self.digest}-d{self.detail}"
+        return f"{self.name}-{self.digest}"
+
+
+def options(element):
+    """Canvas options of an element; lists become tuples (e.g. fonts)"""
+    return {
+        name: tuple(value) if isinstance(value, list) else value
+        for name, value in element.items() if name in CANVAS_OPTIONS
+    }
+
+
+def oval(x, y, radius):
+    return (x - radius, y - radius, x + radius, y + radius)
+
+
+def star_points(x, y, points, size, inner=None):
+    """Outline of a star around ``(x, y)`` pointing up; no ``inner`` ratio gives a regular polygon"""
+    if inner is None:
+        vectors = dial_vectors(points, -90)
+    else:
+        vectors = dial_vectors(2 * points, -90)
+    coords = []
+    for i, (cos_a, sin_a) in enumerate(vectors):
+        radius = size if inner is None or i % 2 == 0 else size * inner
+        coords.extend((x + radius * cos_a, y + radius * sin_a))
+    return tuple(coords)
+
+
+def gradient_ovals(bbox, colors, steps, shrink, mode, extra):
+    boxes, fills = gradient_rings(tuple(bbox), tuple(colors), steps, shrink, mode)
+    for box, fill in zip(boxes, fills):
+        yield 'oval', box, {'fill': fill, 'outline': "", **extra}
+
+
+def compile_rect(element, cx, cy):
+    """Rectangle ``box`` (x1, y1, x2, y2) relative to the center"""
+    x1, y1, x2, y2 = element['box']
+    yield 'rectangle', (cx + x1, cy + y1, cx + x2, cy + y2), options(element)
+
+
+def compile_circle(element, cx, cy):
+    """Circle of radius ``r``, optionally offset by ``at``"""
+    dx, dy = element.get('at', (0, 0))
+    yield 'oval', oval(cx + dx, cy + dy, element['r']), options(element)
+
+
+def compile_gradient(element, cx, cy):
+    """Concentric-ring gradient filling ``box``, or a circle of radius ``r`` at ``at``"""
+    if 'box' in element:
+        x1, y1, x2, y2 = element['box']
+        bbox = (cx + x1, cy + y1, cx + x2, cy + y2)
+    else:
+        dx, dy = element.get('at', (0, 0))
+        bbox = oval(cx + dx, cy + dy, element['r'])
+    yield from gradient_ovals(
+        bbox, element['colors'], element.get('steps', 15), element.get('shrink', 0.8),
+        element.get('mode', 'blend'), options(element)
+    )
+
+
+def compile_polygon(element, cx, cy):
+    """Polygon through ``points``, relative to the center offset by ``at``"""
+    dx, dy = element.get('at', (0, 0))
+    x, y = cx + dx, cy + dy
+    coords = []
+    for px, py in element['points']:
+        coords.extend((x + px, y + py))
+    yield 'polygon', tuple(coords), options(element)
+
+
+def compile_star(element, cx, cy):
+    """Star of ``points`` tips and ``size`` radius at ``at``; ``inner`` is the notch ratio"""
+    dx, dy = element['at']
+    yield 'polygon', star_points(
+        cx + dx, cy + dy, element.get('points', 5), element['size'], element.get('inner')
+    ), options(element)
+
+
+def compile_text(element, cx, cy):
+    """Fixed text at ``at``"""
+    dx, dy = element['at']
+    yield 'text', (cx + dx, cy + dy), dict(options(element), text=element['text'])
+
+
+def compile_grid(element, cx, cy):
+    """Horizontal then vertical lines of each line set, clipped to its ``length``"""
+    rows, columns = element['rows'], element['columns']
+    for line_set in element['sets']:
+        spacing = line_set['spacing']
+        half = line_set['length'] // 2
+        line_options = options(line_set)
+        for i in range(-rows, rows + 1):
+            if abs(i * spacing) <= half:
+                y = cy + i * spacing
+                yield 'line', (cx - half, y, cx + half, y), line_options
+        for i in range(-columns, columns + 1):
+            if abs(i * spacing) <= half:
+                x = cx + i * spacing
+                yield 'line', (x, cy - half, x, cy + half), line_options
+
+
+def compile_spokes(element, cx, cy):
+    """A radial line from each ``radii`` pair's first to second radius, in every direction"""
+    line_options = options(element)
+    for cos_a, sin_a in dial_vectors(element['count'], element.get('start', 0)):
+        for start, end in element['radii']:
+            yield 'line', (
+                cx + start * cos_a, cy + start * sin_a, cx + end * cos_a, cy + end * sin_a
+            ), line_options
+
+
+def mark_line(mark, cx, cy, cos_a, sin_a):
+    start, end = mark['radii']
+    yield 'line', (cx + start * cos_a, cy + start * sin_a, cx + end * cos_a, cy + end * sin_a), options(mark)
+
+
+def mark_bar(mark, cx, cy, cos_a, sin_a):
+    start, end = mark['radii']
+    half = mark['half_width']
+    perp_cos, perp_sin = perpendicular((cos_a, sin_a))
+    start_x, start_y = cx + start * cos_a, cy + start * sin_a
+    end_x, end_y = cx + end * cos_a, cy + end * sin_a
+    yield 'polygon', (
+        start_x + half * perp_cos, start_y + half * perp_sin,
+        start_x - half * perp_cos, start_y - half * perp_sin,
+        end_x - half * perp_cos, end_y - half * perp_sin,
+        end_x + half * perp_cos, end_y + half * perp_sin,
+    ), options(mark)
+
+
+def mark_dot(mark, cx, cy, cos_a, sin_a):
+    radius = mark['radius']
+    yield 'oval', oval(cx + radius * cos_a, cy + radius * sin_a, mark['size']), options(mark)
+
+
+def mark_star(mark, cx, cy, cos_a, sin_a):
+    radius = mark['radius']
+    yield 'polygon', star_points(
+        cx + radius * cos_a, cy + radius * sin_a, mark.get('points', 5), mark['size'], mark.get('inner')
+    ), options(mark)
+
+
+def mark_polygon(mark, cx, cy, cos_a, sin_a):
+    radius = mark['radius']
+    x, y = cx + radius * cos_a, cy + radius * sin_a
+    coords = []
+    for px, py in mark['points']:
+        coords.extend((x + px, y + py))
+    yield 'polygon', tuple(coords), options(mark)
+
+
+MARKS = {
+    'line': mark_line,
+    'bar': mark_bar,
+    'dot': mark_dot,
+    'star': mark_star,
+    'polygon': mark_polygon,
+}
+
+
+def mark_matches(mark, index):
+    if 'at' in mark:
+        return index in mark['at']
+    if 'every' in mark:
+        return index % mark['every'] == 0
+    return True
+
+
+def compile_ticks(element, cx, cy):
+    """Markers at ``count`` positions from ``start`` degrees; each uses the first mark that matches"""
+    marks = element['marks']
+    for i, (cos_a, sin_a) in enumerate(dial_vectors(element['count'], element.get('start', 0))):
+        for mark in marks:
+            if mark_matches(mark, i):
+                yield from MARKS[mark.get('shape', 'line')](mark, cx, cy, cos_a, sin_a)
+                break
+
+
+def compile_numerals(element, cx, cy):
+    """Numbers 1 to ``count`` at ``radius``, each on an optional ``disc``"""
+    count = element['count']
+    radius = element['radius']
+    vectors = dial_vectors(count, element.get('start', -90))
+    disc = element.get('disc')
+    text_options = options(element)
+    for number in range(1, count + 1):
+        cos_a, sin_a = vectors[number % count]
+        x = cx + radius * cos_a
+        y = cy + radius * sin_a
+        if disc:
+            yield 'oval', oval(x, y, disc['r']), options(disc)
+        yield 'text', (x, y), dict(text_options, text=str(number))
+
+
+def compile_sunbursts(element, cx, cy):
+    """Medallions with halo rings and a repeating ray ``pattern``, at each (dx, dy, r)"""
+    color = element['color']
+    pattern = element['pattern']
+    ray_color = element['rays']
+    for dx, dy, radius in element['at']:
+        x, y = cx + dx, cy + dy
+        for i in range(element.get('halo', 5)):
+            yield 'oval', oval(x, y, radius + i * 3), {'fill': "", 'outline': color, 'width': 1}
+        yield from gradient_ovals(oval(x, y, radius), (color, element['edge']), element.get('steps', 15),
+                                  0.8, 'blend', {})
+        for i, (cos_a, sin_a) in enumerate(dial_vectors(element.get('count', 32))):
+            inner, outer, width = pattern[i % len(pattern)]
+            inner_radius = radius * inner
+            outer_radius = radius * outer
+            yield 'line', (
+                x + inner_radius * cos_a, y + inner_radius * sin_a,
+                x + outer_radius * cos_a, y + outer_radius * sin_a
+            ), {'fill': ray_color, 'width': width}
+
+
+def compile_spheres(element, cx, cy):
+    """Shaded spheres with a halo ring and a highlight, at each (dx, dy, r)"""
+    for dx, dy, radius in element['at']:
+        x, y = cx + dx, cy + dy
+        yield 'oval', oval(x, y, radius + 3), {'fill': "", 'outline': element['halo'], 'width': 1}
+        yield from gradient_ovals(oval(x, y, radius), element['colors'], element.get('steps', 15),
+                                  0.8, 'blend', {})
+        highlight_radius = radius * 0.3
+        yield 'oval', oval(x - highlight_radius, y - highlight_radius, highlight_radius), {
+            'fill': element['highlight'], 'outline': ""
+        }
+
+
+def compile_jewels(element, cx, cy):
+    """Stacked discs of each (r, color) in ``rings`` at every position of ``at``"""
+    for position in element['at']:
+        x, y = cx + position[0], cy + position[1]
+        for radius, color in element['rings']:
+            yield 'oval', oval(x, y, radius), dict(options(element), fill=color, outline="")
+
+
+ELEMENTS = {
+    'rect': compile_rect,
+    'circle': compile_circle,
+    'gradient': compile_gradient,
+    'polygon': compile_polygon,
+    'star': compile_star,
+    'text': compile_text,
+    'grid': compile_grid,
+    'spokes': compile_spokes,
+    'ticks': compile_ticks,
+    'numerals': compile_numerals,
+    'sunbursts': compile_sunbursts,
+    'spheres': compile_spheres,
+    'jewels': compile_jewels,
+}
+
+
+def detail_level(zoom):
+    """Level of detail for a face drawn at ``zoom``: 0 (full) to MAX_DETAIL"""
+    return sum(1 for threshold in DETAIL_ZOOMS if zoom < threshold)
+
+
+def detail_scale(detail):
+    """Largest zoom a level of detail is used at; its reductions assume that size"""
+    return DETAIL_ZOOMS[detail - 1] if detail else 1.0
+
+
+def detail_spacing(detail):
+    """Pixels apart that repeated marks stay at a reduced level of detail"""
+    return DETAIL_SPACING[detail - 1]
+
+
+def fitting_steps(steps, length, spacing):
+    """How many of ``steps`` rings fit ``length`` pixels ``spacing`` apart, at least 2"""
+    return max(2, min(steps, int(length / spacing)))
+
+
+def thinned(count, circumference, spacing):
+    """``count`` halved until its positions around ``circumference`` pixels are ``spacing`` apart"""
+    while count % 2 == 0 and count > 4 and circumference / count < spacing:
+        count //= 2
+    return count
+
+
+def reduce_gradient(element, scale, spacing):
+    """Only as many rings as stay ``spacing`` apart"""
+    if 'box' in element:
+        x1, y1, x2, y2 = element['box']
+        radius = max(x2 - x1, y2 - y1) / 2
+    else:
+        radius = element['r']
+    length = radius * element.get('shrink', 0.8) * scale
+    return dict(element, steps=fitting_steps(element.get('steps', 15), length, spacing))
+
+
+def reduce_sunbursts(element, scale, spacing):
+    """Fewer rays and gradient rings; one halo ring once they would merge"""
+    radius = max(r for _, _, r in element['at'])
+    count = element.get('count', 32)
+    pattern = element['pattern']
+    rays = thinned(count, 2 * math.pi * radius * scale, spacing)
+    # Every stride-th ray of the full face, with the pattern it had there
+    stride = count // rays
+    pattern = [pattern[i * stride % len(pattern)] for i in range(len(pattern))]
+    # Halo rings are 3 units apart
+    halo = element.get('halo', 5) if 3 * scale >= 1 else 1
+    return dict(element, count=rays, pattern=pattern, halo=halo,
+                steps=fitting_steps(element.get('steps', 15), radius * 0.8 * scale, spacing))
+
+
+def reduce_spheres(element, scale, spacing):
+    radius = max(r for _, _, r in element['at'])
+    return dict(element, steps=fitting_steps(element.get('steps', 15), radius * 0.8 * scale, spacing))
+
+
+def reduce_spokes(element, scale, spacing):
+    """Every other serration until they are ``spacing`` apart"""
+    radius = max(max(radii) for radii in element['radii'])
+    return dict(element, count=thinned(element['count'], 2 * math.pi * radius * scale, spacing))
+
+
+def reduce_ticks(element, scale, spacing):
+    """Only the marks picked by ``at`` or ``every`` once the rest crowd together"""
+    radius = max(max(mark['radii']) if 'radii' in mark else mark['radius'] for mark in element['marks'])
+    if 2 * math.pi * radius * scale / element['count'] >= spacing:
+        return element
+    marks = [mark for mark in element['marks'] if 'at' in mark or 'every' in mark]
+    return dict(element, marks=marks) if marks else None
+
+
+def reduce_grid(element, scale, spacing):
+    """Without the line sets spaced closer than ``spacing``"""
+    sets = [line_set for line_set in element['sets'] if line_set['spacing'] * scale >= spacing]
+    return dict(element, sets=sets) if sets else None
+
+
+def reduce_jewels(element, scale, spacing):
+    """Without discs that would show as rings narrower than a pixel"""
+    rings = []
+    for radius, color in element['rings']:
+        if radius * scale >= 1 and (not rings or (rings[-1][0] - radius) * scale >= 1):
+            rings.append((radius, color))
+    return dict(element, rings=rings) if rings else None
+
+
+def reduce_star(element, scale, spacing):
+    """Left out below a pixel"""
+    return element if element['size'] * scale >= 1 else None
+
+
+# How each element type is thinned out at a reduced level of detail; the
+# result (None leaves the element out) is compiled as usual
+REDUCERS = {
+    'gradient': reduce_gradient,
+    'sunbursts': reduce_sunbursts,
+    'spheres': reduce_spheres,
+    'spokes': reduce_spokes,
+    'ticks': reduce_ticks,
+    'grid': reduce_grid,
+    'jewels': reduce_jewels,
+    'star': reduce_star,
+}
+
+
+def compile_face(description, detail=0):
+    """Expand a parsed face description into layers of draw primitives.
+
+    ``colors`` may name one of the face's ``palettes``, and ``at`` may name
+    another element's ``id`` to share its positions. A ``detail`` level
+    above 0 thins the elements out for a smaller clock (see REDUCERS).
+    """
+    cx, cy = description['center']
+    palettes = description.get('palettes', {})
+    elements_by_id = {
+        element['id']: element
+        for elements in description['layers'].values() for element in elements if 'id' in element
+    }
+    
+    layers = {}
+    for name, elements in description['layers'].items():
+        plan = []
+        for element in elements:
+            compiler = ELEMENTS.get(element['type'])
+            if compiler is None:
+                raise ValueError(f"unknown face element type {element['type']!r} in layer {name!r}")
+            if isinstance(element.get('colors'), str):
+                element = dict(element, colors=palettes[element['colors']])
+            if isinstance(element.get('at'), str):
+                element = dict(element, at=elements_by_id[element['at']]['at'])
+            if detail and element['type'] in REDUCERS:
+                element = REDUCERS[element['type']](element, detail_scale(detail), detail_spacing(detail))
+                if element is None:
+                    continue
+            plan.extend(compiler(element, cx, cy))
+        layers[name] = tuple(plan)
+    return layers
+
+
+def parse_face(path, raw):
+    """Parse a face file: TOML for ``.toml`` (Python 3.11+), JSON otherwise"""
+    if path.endswith('.toml'):
+        if tomllib is None:
+            raise RuntimeError("TOML faces need Python 3.11 or later; use a JSON face")
+        return tomllib.loads(raw.decode('utf-8'))
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=None)
+def compiler_digest():
+    return source_digest(__file__)
+
+
+# Faces already loaded by this process
+_faces = {}
+
+
+def load_face(path, detail=0):
+    """The compiled face of a face file, at a level of detail (0 is the full face).
+
+    Plans are cached on disk keyed by the file's content hash and size (and
+    the compiler version and detail), so restarts and theme switches only
+    unpickle a plan; a face is compiled again only after its file changed.
+    """
+    with open(path, 'rb') as source:
+        raw = source.read()
+    name = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(raw).hexdigest()[:12]
+    key = f"{name}-{digest}-{len(raw)}-d{detail}-v{PLAN_VERSION}-{compiler_digest()}"
+    face = _faces.get(key)
+    if face is not None:
+        return face
+    
+    cached = os.path.join(cache_dir(), 'plans', f"{key}.pickle")
+    try:
+        with open(cached, 'rb') as plan:
+            layers = pickle.load(plan)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        layers = compile_face(parse_face(path, raw), detail)
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        # Write then rename so concurrent launches never read a partial file
+        partial = f"{cached}.{os.getpid()}.tmp"
+        with open(partial, 'wb') as plan:
+            pickle.dump(layers, plan, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial, cached)
+    
+    face = _faces[key] = Face(name, digest, layers, detail)
+    return face
+
+
+def draw_plan(canvas, plan, tags=None):
+    """Create the items of a compiled layer on ``canvas``; returns their ids in order"""
+    items = []
+    for kind, coords, item_options in plan:
+        if tags is not None and 'tags' not in item_options:
+            item_options = dict(item_options, tags=tags)
+        items.append(getattr(canvas, 'create_' + kind)(coords, **item_options))
+    return items
@@ -0,0 +1,60 @@
+"""Cached trigonometry for dial geometry and hand positions.
+
+Angles are in degrees, measured the way the canvas draws them: 0 points
+right (3 o'clock) and angles grow clockwise because y grows downward.
+Subtract 90 from a clock angle (0 at 12 o'clock) to get a canvas angle.
+"""
+import math
+from array import array
+from functools import lru_cache
+
+# Unit-vector tables at 0.1 degree resolution; a 110 px hand tip lands
+# within 0.1 px of the exact position
+STEPS_PER_DEGREE = 10
+ANGLE_STEPS = 360 * STEPS_PER_DEGREE
+COS_TABLE = array('d', (math.cos(math.radians(i / STEPS_PER_DEGREE)) for i in range(ANGLE_STEPS)))
+SIN_TABLE = array('d', (math.sin(math.radians(i / STEPS_PER_DEGREE)) for i in range(ANGLE_STEPS)))
+
+# (cos, sin, perp_cos, perp_sin) of the canvas direction for each clock angle
+# step, so a hand needs a single lookup per frame
+HAND_TABLE = tuple(
+    (COS_TABLE[i], SIN_TABLE[i], -SIN_TABLE[i], COS_TABLE[i])
+    for i in (
+        (step - 90 * STEPS_PER_DEGREE) % ANGLE_STEPS for step in range(ANGLE_STEPS)
+    )
+)
+
+
+def angle_index(clock_degrees):
+    """Table index of a non-negative clock angle, rounded to 0.1 degree"""
+    return int(clock_degrees * STEPS_PER_DEGREE + 0.5) % ANGLE_STEPS
+
+
+def hand_vectors(clock_degrees):
+    """Direction and perpendicular of a hand at a clock angle (0 = 12 o'clock)"""
+    return HAND_TABLE[int(clock_degrees * STEPS_PER_DEGREE + 0.5) % ANGLE_STEPS]
+
+
+def perpendicular(vector):
+    """The unit vector rotated a quarter turn clockwise on screen"""
+    cos_a, sin_a = vector
+    return -sin_a, cos_a
+
+
+@lru_cache(maxsize=None)
+def dial_vectors(count, offset=0.0):
+    """Exact unit vectors for ``count`` evenly spaced angles from ``offset`` degrees.
+
+    Used for ticks, numerals, rays and serrations; computed once per
+    (count, offset) and shared by every clock.
+    """
+    return tuple(
+        (math.cos(math.radians(offset + i * 360 / count)),
+         math.sin(math.radians(offset + i * 360 / count)))
+        for i in range(count)
+    )
+
+
+def pixel_step_interval(length, revolution=60.0):
+    """Seconds a hand tip of ``length`` px needs to travel one pixel"""
+    return revolution / (2 * math.pi * length)
@@ -0,0 +1,58 @@
+"""Concentric-ring gradients shared by both clock designs."""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def hex_to_rgb(hex_color):
+    """Convert a #rrggbb color to an RGB tuple"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+@lru_cache(maxsize=1024)
+def gradient_rings(bbox, palette, steps, shrink, mode='blend'):
+    """Geometry and colors of a gradient drawn as shrinking concentric ovals.
+
+    ``bbox`` is the outer (x1, y1, x2, y2); ring ``i`` is scaled by
+    ``1 - i / steps * shrink`` around the center. ``palette`` is a tuple of
+    #rrggbb stops: ``mode='blend'`` interpolates linearly between them,
+    ``mode='step'`` picks the stop each ring falls in, like a machined
+    metal finish. Returns ``(boxes, colors)`` as two tuples, memoized on
+    all arguments so repeated ornaments cost one lookup.
+    """
+    x1, y1, x2, y2 = bbox
+    width = x2 - x1
+    height = y2 - y1
+    ratios = [i / steps for i in range(steps)]
+    
+    boxes = []
+    for ratio in ratios:
+        scale = 1 - ratio * shrink
+        new_width = width * scale
+        new_height = height * scale
+        offset_x = (width - new_width) / 2
+        offset_y = (height - new_height) / 2
+        boxes.append((
+            x1 + offset_x, y1 + offset_y,
+            x1 + offset_x + new_width, y1 + offset_y + new_height
+        ))
+    
+    last = len(palette) - 1
+    if mode == 'step':
+        colors = [palette[int(ratio * last)] for ratio in ratios]
+    elif mode == 'blend':
+        stops = [hex_to_rgb(color) for color in palette]
+        colors = []
+        for ratio in ratios:
+            # Position between the two surrounding stops
+            position = ratio * last
+            index = min(int(position), last - 1)
+            (r1, g1, b1), (r2, g2, b2) = stops[index], stops[index + 1]
+            t = position - index
+            colors.append(
+                f"#{int(r1 + (r2 - r1) * t):02x}{int(g1 + (g2 - g1) * t):02x}{int(b1 + (b2 - b1) * t):02x}"
+            )
+    else:
+        raise ValueError(f"mode must be 'blend' or 'step', not {mode!r}")
+    
+    return tuple(boxes), tuple(colors)
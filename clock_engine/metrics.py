@@ -0,0 +1,233 @@
+"""Frame timing metrics with an optional on-canvas overlay and file export."""
+import json
+import os
+import time
+from collections import deque
+
+
+class CountingCanvas:
+    """Canvas proxy that counts the items created, updated and deleted through it.
+
+    An update is a ``coords``, ``itemconfig``, ``move`` or ``scale`` call
+    that changes items; queries are not counted. Parts of a clock keep the
+    canvas they were built with, so the proxy has to be in place before
+    they are.
+    """
+    
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.created = 0
+        self.updated = 0
+        self.deleted = 0
+    
+    def __getattr__(self, name):
+        attr = getattr(self.canvas, name)
+        if name.startswith('create_'):
+            def create(*args, **kwargs):
+                self.created += 1
+                return attr(*args, **kwargs)
+            return create
+        return attr
+    
+    def coords(self, item, *args):
+        if args:
+            self.updated += 1
+        return self.canvas.coords(item, *args)
+    
+    def itemconfig(self, item, **options):
+        if options:
+            self.updated += 1
+        return self.canvas.itemconfig(item, **options)
+    
+    itemconfigure = itemconfig
+    
+    def move(self, item, dx, dy):
+        self.updated += 1
+        self.canvas.move(item, dx, dy)
+    
+    def scale(self, item, x, y, xscale, yscale):
+        self.updated += 1
+        self.canvas.scale(item, x, y, xscale, yscale)
+    
+    def delete(self, *items):
+        for item in items:
+            self.deleted += len(self.canvas.find_withtag(item))
+        self.canvas.delete(*items)
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class FrameMetrics:
+    """Frame times, frame rate, item churn and scheduler lateness of one clock.
+
+    ``timed(update)`` wraps a frame callback so every call is measured;
+    ``snapshot()`` summarizes the frames since the previous snapshot (frame
+    times over the last ``window`` frames). Nothing is measured unless a
+    clock was built with metrics enabled, so a disabled clock pays nothing.
+    """
+    
+    def __init__(self, name, canvas=None, scheduler=None, job_name=None, window=300,
+                 clock=time.perf_counter):
+        self.name = name
+        self.canvas = canvas
+        self.scheduler = scheduler
+        self.job_name = job_name
+        self.clock = clock
+        self.durations = deque(maxlen=window)
+        self.frames = 0
+        self.max_created = 0
+        self.max_updated = 0
+        self.max_deleted = 0
+        # Items made while the clock was built are not frame churn
+        self.last = {'time': clock(), 'frames': 0, 'runs': 0, 'lateness': 0.0, **self.counts()}
+    
+    def counts(self):
+        canvas = self.canvas
+        if canvas is None:
+            return {'created': 0, 'updated': 0, 'deleted': 0}
+        return {'created': canvas.created, 'updated': canvas.updated, 'deleted': canvas.deleted}
+    
+    def timed(self, update):
+        """Wrap a frame callback so each call is timed and counted"""
+        canvas = self.canvas
+        
+        def timed_update():
+            if canvas is not None:
+                created, updated, deleted = canvas.created, canvas.updated, canvas.deleted
+            start = self.clock()
+            result = update()
+            self.durations.append(self.clock() - start)
+            self.frames += 1
+            if canvas is not None:
+                self.max_created = max(self.max_created, canvas.created - created)
+                self.max_updated = max(self.max_updated, canvas.updated - updated)
+                self.max_deleted = max(self.max_deleted, canvas.deleted - deleted)
+            return result
+        
+        timed_update.__name__ = update.__name__
+        return timed_update
+    
+    def snapshot(self):
+        """Summary of the frames since the last snapshot, as a plain dict"""
+        now = self.clock()
+        ordered = sorted(self.durations)
+        current = {
+            'time': now,
+            'frames': self.frames,
+            **self.counts(),
+            'runs': 0,
+            'lateness': 0.0,
+            'max_lateness_ms': 0.0,
+        }
+        if self.scheduler is not None:
+            for job in self.scheduler.jobs:
+                if job.name == self.job_name:
+                    current.update(runs=job.runs, lateness=job.total_lateness,
+                                   max_lateness_ms=job.max_lateness * 1000)
+        
+        last = self.last
+        frames = current['frames'] - last['frames']
+        runs = current['runs'] - last['runs']
+        elapsed = now - last['time']
+        snapshot = {
+            'clock': self.name,
+            'fps': frames / elapsed if elapsed > 0 else 0.0,
+            'frames_total': self.frames,
+            'frame_p50_ms': percentile(ordered, 0.50) * 1000,
+            'frame_p95_ms': percentile(ordered, 0.95) * 1000,
+            'frame_p99_ms': percentile(ordered, 0.99) * 1000,
+            'items_created_per_frame': (current['created'] - last['created']) / frames if frames else 0.0,
+            'items_updated_per_frame': (current['updated'] - last['updated']) / frames if frames else 0.0,
+            'items_deleted_per_frame': (current['deleted'] - last['deleted']) / frames if frames else 0.0,
+            'items_created_max': self.max_created,
+            'items_updated_max': self.max_updated,
+            'items_deleted_max': self.max_deleted,
+            'lateness_mean_ms': (current['lateness'] - last['lateness']) / runs * 1000 if runs else 0.0,
+            'lateness_max_ms': current['max_lateness_ms'],
+        }
+        self.last = current
+        return snapshot
+
+
+def prometheus_text(snapshot):
+    """Render a snapshot in the Prometheus text exposition format"""
+    label = f'clock="{snapshot["clock"]}"'
+    lines = []
+    
+    def gauge(name, help_text, samples):
+        lines.append(f"# HELP analog_clock_{name} {help_text}")
+        lines.append(f"# TYPE analog_clock_{name} gauge")
+        for labels, value in samples:
+            lines.append(f"analog_clock_{name}{{{labels}}} {value:.6g}")
+    
+    gauge('fps', "Frames drawn per second", [(label, snapshot['fps'])])
+    gauge('frame_seconds', "Frame time percentiles over the recent frames", [
+        (f'{label},quantile="{q}"', snapshot[f'frame_p{p}_ms'] / 1000)
+        for q, p in (('0.5', 50), ('0.95', 95), ('0.99', 99))
+    ])
+    gauge('items_created_per_frame', "Canvas items created per frame", [(label, snapshot['items_created_per_frame'])])
+    gauge('items_updated_per_frame', "Canvas item coords/itemconfig calls per frame",
+          [(label, snapshot['items_updated_per_frame'])])
+    gauge('items_deleted_per_frame', "Canvas items deleted per frame", [(label, snapshot['items_deleted_per_frame'])])
+    gauge('lateness_seconds', "Mean scheduler lateness of the frame job", [(label, snapshot['lateness_mean_ms'] / 1000)])
+    gauge('lateness_max_seconds', "Worst scheduler lateness of the frame job", [(label, snapshot['lateness_max_ms'] / 1000)])
+    lines.append(f"analog_clock_frames_total{{{label}}} {snapshot['frames_total']}")
+    return '\n'.join(lines) + '\n'
+
+
+def write_metrics(path, snapshot):
+    """Atomically write a snapshot; ``.prom`` files get Prometheus text, others JSON"""
+    if path.endswith('.prom'):
+        text = prometheus_text(snapshot)
+    else:
+        text = json.dumps(snapshot, indent=2) + '\n'
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as out:
+        out.write(text)
+    os.replace(tmp, path)
+
+
+def overlay_text(snapshot):
+    return (f"{snapshot['fps']:5.1f} fps  frame p50 {snapshot['frame_p50_ms']:.2f}"
+            f" p95 {snapshot['frame_p95_ms']:.2f} p99 {snapshot['frame_p99_ms']:.2f} ms\n"
+            f"items +{snapshot['items_created_per_frame']:.1f} ~{snapshot['items_updated_per_frame']:.1f}"
+            f" -{snapshot['items_deleted_per_frame']:.1f}/frame  late {snapshot['lateness_mean_ms']:.1f} ms (max {snapshot['lateness_max_ms']:.1f})")
+
+
+def attach_metrics(owner, scheduler, update, overlay=True, path=None, every=1.0, dump_every=10.0):
+    """Instrument a clock's frame callback; returns the callback to schedule.
+
+    Item churn is counted on ``owner.canvas``, which should already be a
+    CountingCanvas from before the clock's parts were built; otherwise it
+    is swapped for one now and only counts what is drawn through the
+    owner from then on. Every ``every`` seconds the overlay text (if
+    ``overlay``) is refreshed, and every ``dump_every`` seconds the latest
+    numbers are written to ``path`` (if given).
+    """
+    if not isinstance(owner.canvas, CountingCanvas):
+        owner.canvas = CountingCanvas(owner.canvas)
+    owner.metrics = metrics = FrameMetrics(type(owner).__name__, owner.canvas, scheduler, update.__name__)
+    # The overlay is drawn past the counts, so it doesn't show up in them
+    screen = owner.canvas.canvas
+    text_item = None
+    if overlay:
+        text_item = screen.create_text(8, 8, anchor='nw', text="", fill='#808080',
+                                       font=('Courier', 9), tags="metrics_overlay")
+    next_dump = time.monotonic() + dump_every
+    
+    def report():
+        nonlocal next_dump
+        snapshot = metrics.snapshot()
+        if text_item is not None:
+            screen.itemconfig(text_item, text=overlay_text(snapshot))
+        if path and time.monotonic() >= next_dump:
+            next_dump += dump_every
+            write_metrics(path, snapshot)
+    
+    scheduler.add_job(report, every, name='metrics')
+    return metrics.timed(update)
@@ -0,0 +1,272 @@
+"""Off-screen canvas that rasterizes Tk-style drawing calls with Pillow."""
+from functools import lru_cache
+
+from .backend import RetainedCanvas
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # Pillow is optional; callers fall back to vector drawing
+    Image = ImageDraw = ImageFont = None
+
+# Tk text anchors mapped to Pillow text anchors
+TEXT_ANCHORS = {
+    'center': 'mm', 'n': 'mt', 's': 'mb', 'e': 'rm', 'w': 'lm',
+    'nw': 'lt', 'ne': 'rt', 'sw': 'lb', 'se': 'rb',
+}
+
+# Font files tried for Tk font families, in order
+FONT_FILES = {
+    'normal': ['DejaVuSerif.ttf', 'DejaVuSans.ttf', 'Arial.ttf'],
+    'bold': ['DejaVuSerif-Bold.ttf', 'DejaVuSans-Bold.ttf', 'Arial Bold.ttf'],
+}
+
+
+def smooth_points(coords, steps=8):
+    """Approximate Tk's smooth=True closed spline as a point list"""
+    points = list(zip(coords[0::2], coords[1::2]))
+    count = len(points)
+    if count < 3:
+        return coords
+    
+    smoothed = []
+    for i in range(count):
+        # Quadratic Bezier between edge midpoints, with the vertex as control point
+        (px, py), (cx, cy), (nx, ny) = points[i - 1], points[i], points[(i + 1) % count]
+        x0, y0 = (px + cx) / 2, (py + cy) / 2
+        x2, y2 = (cx + nx) / 2, (cy + ny) / 2
+        for step in range(steps):
+            t = step / steps
+            a, b, c = (1 - t) ** 2, 2 * (1 - t) * t, t * t
+            smoothed.extend([a * x0 + b * cx + c * x2, a * y0 + b * cy + c * y2])
+    return smoothed
+
+
+def font_pixels(font):
+    """Pixel size of a Tk font tuple (positive sizes are points at 96 dpi)"""
+    size = font[1] if len(font) > 1 else 10
+    return abs(size) if size < 0 else size * 96 / 72
+
+
+@lru_cache(maxsize=64)
+def load_font(family, size, bold):
+    """Load a TrueType font close to the requested Tk font"""
+    names = [f"{family}.ttf"] + FONT_FILES['bold' if bold else 'normal']
+    for name in names:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+class RasterCanvas(RetainedCanvas):
+    """Retained-mode canvas that rasterizes Tk drawing calls with Pillow.
+
+    Supports the subset of the ``tk.Canvas`` API used by the clock designs,
+    so a clock can draw into it exactly as it draws on screen, then call
+    ``render`` or ``save`` for each frame. Vector items are drawn at
+    ``supersample`` times the final size and scaled down for anti-aliasing;
+    runs of vector items above an image are rasterized only inside their
+    bounding box, so moving a few hands over a cached dial stays cheap.
+    The items below the first one changed between two frames are kept
+    composited, so later frames start from a copy of that dial and only
+    draw what lies above it, until one of the kept items changes.
+    """
+    
+    def __init__(self, width, height, background='#000000', supersample=2):
+        if Image is None:
+            raise RuntimeError("RasterCanvas needs Pillow (pip install pillow)")
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.background = background
+        self.supersample = supersample
+        self.images = {}
+        # (image, painted, item ids) of the unchanged items at the bottom of the stack
+        self.base = None
+        self.changed = set()
+    
+    def _changed(self, item):
+        if self.base is not None and item in self.base[2]:
+            self.base = None
+        self.changed.add(item)
+    
+    def load_image(self, path):
+        if path not in self.images:
+            self.images[path] = Image.open(path).convert('RGBA')
+        return self.images[path]
+    
+    def photo_image(self, image):
+        return image
+    
+    def render(self, mode='RGB'):
+        """Rasterize all visible items and return a Pillow image, RGB unless ``mode`` says otherwise"""
+        items = list(self.items.items())
+        changed, self.changed = self.changed, set()
+        if self.base is None:
+            # Keep what lies below the first item changed since the last frame
+            stable = next((index for index, (item, _) in enumerate(items) if item in changed), len(items))
+            base = Image.new('RGBA', (self.width, self.height), self.background)
+            painted = self._draw_items(base, [values for _, values in items[:stable]], False)
+            self.base = (base, painted, frozenset(item for item, _ in items[:stable]))
+        base, painted, kept = self.base
+        image = base.copy()
+        self._draw_items(image, [values for item, values in items if item not in kept], painted)
+        return image if mode == 'RGBA' else image.convert(mode)
+    
+    def _draw_items(self, image, items, painted):
+        """Draw items in stacking order; returns whether anything has been drawn"""
+        run = []
+        for kind, coords, options, _ in items:
+            if options.get('state') == 'hidden':
+                continue
+            if kind != 'image':
+                run.append((kind, coords, options))
+                continue
+            painted = self._draw_run(image, run, painted)
+            run = []
+            self._draw_image(image, coords, options)
+            painted = True
+        return self._draw_run(image, run, painted)
+    
+    def save(self, path, **params):
+        """Render the canvas and write it as an image file"""
+        params.setdefault('compress_level', 1)
+        self.render().save(path, **params)
+    
+    def _draw_image(self, image, coords, options):
+        picture = options['image']
+        x, y = coords[:2]
+        anchor = options.get('anchor', 'center')
+        if anchor == 'center':
+            x, y = x - picture.width / 2, y - picture.height / 2
+        elif anchor != 'nw':
+            raise ValueError(f"unsupported image anchor {anchor!r}")
+        image.alpha_composite(picture, (round(x), round(y)))
+    
+    def _draw_run(self, image, run, painted):
+        """Rasterize consecutive vector items; returns whether anything was drawn"""
+        if not run:
+            return painted
+        if not painted:
+            self._draw_layer(image, run, (0, 0, self.width, self.height), self.background)
+            return True
+        
+        # Split the run into clusters of overlapping items and draw each
+        # cluster on a small transparent layer covering only its bounds
+        cluster, bounds = [], None
+        for item in run:
+            item_bounds = self._item_bounds(*item)
+            if bounds and not self._overlap(bounds, item_bounds):
+                self._draw_layer(image, cluster, bounds, (0, 0, 0, 0))
+                cluster, bounds = [], None
+            cluster.append(item)
+            bounds = item_bounds if bounds is None else (
+                min(bounds[0], item_bounds[0]), min(bounds[1], item_bounds[1]),
+                max(bounds[2], item_bounds[2]), max(bounds[3], item_bounds[3]),
+            )
+        self._draw_layer(image, cluster, bounds, (0, 0, 0, 0))
+        return True
+    
+    def _draw_layer(self, image, items, bounds, background):
+        """Draw items supersampled inside bounds and composite them onto image"""
+        left, top = max(0, bounds[0]), max(0, bounds[1])
+        right, bottom = min(self.width, bounds[2]), min(self.height, bounds[3])
+        if right <= left or bottom <= top:
+            return
+        scale = self.supersample
+        layer = Image.new('RGBA', ((right - left) * scale, (bottom - top) * scale), background)
+        draw = ImageDraw.Draw(layer, 'RGBA')
+        for kind, coords, options in items:
+            shifted = [(c - (left if i % 2 == 0 else top)) * scale for i, c in enumerate(coords)]
+            getattr(self, f"_draw_{kind}")(draw, shifted, options, scale)
+        
+        if scale != 1:
+            # Box-filter down with premultiplied alpha so edges don't pick up dark fringes
+            layer = layer.convert('RGBa').reduce(scale).convert('RGBA')
+        image.alpha_composite(layer, (left, top))
+    
+    @staticmethod
+    def _item_bounds(kind, coords, options):
+        """Integer bounding box of an item, padded for line width and text"""
+        pad = options.get('width', 1) + 2
+        if kind == 'text':
+            size = font_pixels(options.get('font', ('TkDefaultFont', 10)))
+            pad = size * (0.4 * len(str(options.get('text', ''))) + 1)
+        xs, ys = coords[0::2], coords[1::2]
+        return (
+            int(min(xs) - pad), int(min(ys) - pad),
+            int(max(xs) + pad) + 1, int(max(ys) + pad) + 1,
+        )
+    
+    @staticmethod
+    def _overlap(a, b):
+        return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+    
+    @staticmethod
+    def _color(options, key, default):
+        color = options.get(key, default)
+        if not color:
+            return None
+        if options.get('stipple'):
+            # Stipple patterns read as a translucent fill once anti-aliased
+            return Image.new('RGB', (1, 1), color).getpixel((0, 0)) + (128,)
+        return color
+    
+    @staticmethod
+    def _box(coords, grow=0):
+        x1, y1, x2, y2 = coords[:4]
+        return [min(x1, x2) - grow, min(y1, y2) - grow, max(x1, x2) + grow, max(y1, y2) + grow]
+    
+    def _draw_oval(self, draw, coords, options, scale):
+        fill = self._color(options, 'fill', '')
+        outline = self._color(options, 'outline', 'black')
+        width = options.get('width', 1) * scale
+        if fill:
+            draw.ellipse(self._box(coords), fill=fill)
+        if outline and width:
+            # Tk centers the outline on the bounding box
+            draw.ellipse(self._box(coords, width / 2), outline=outline, width=round(width))
+    
+    def _draw_rectangle(self, draw, coords, options, scale):
+        fill = self._color(options, 'fill', '')
+        outline = self._color(options, 'outline', 'black')
+        width = options.get('width', 1) * scale
+        if fill:
+            draw.rectangle(self._box(coords), fill=fill)
+        if outline and width:
+            draw.rectangle(self._box(coords, width / 2), outline=outline, width=round(width))
+    
+    def _draw_line(self, draw, coords, options, scale):
+        fill = self._color(options, 'fill', 'black')
+        width = max(1, round(options.get('width', 1) * scale))
+        if not fill or len(coords) < 4:
+            return
+        draw.line(coords, fill=fill, width=width, joint='curve')
+        if options.get('capstyle') == 'round':
+            radius = width / 2
+            for x, y in ((coords[0], coords[1]), (coords[-2], coords[-1])):
+                draw.ellipse([x - radius, y - radius, x + radius, y + radius], fill=fill)
+    
+    def _draw_polygon(self, draw, coords, options, scale):
+        fill = self._color(options, 'fill', 'black')
+        outline = self._color(options, 'outline', '')
+        width = max(1, round(options.get('width', 1) * scale))
+        if options.get('smooth'):
+            coords = smooth_points(coords)
+        if len(coords) < 6:
+            return
+        if fill:
+            draw.polygon(coords, fill=fill)
+        if outline:
+            draw.line(coords + coords[:2], fill=outline, width=width, joint='curve')
+    
+    def _draw_text(self, draw, coords, options, scale):
+        font = options.get('font', ('TkDefaultFont', 10))
+        bold = 'bold' in font[2:]
+        draw.text(
+            coords[:2], str(options.get('text', '')),
+            fill=self._color(options, 'fill', 'black'),
+            font=load_font(font[0], max(1, round(font_pixels(font) * scale)), bold),
+            anchor=TEXT_ANCHORS.get(options.get('anchor', 'center'), 'mm'),
+        )
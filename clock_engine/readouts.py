@@ -0,0 +1,44 @@
+"""Persistent text readouts that only change when their text does."""
+import time
+
+
+class CachedFormat:
+    """``time.strftime`` memoized on the struct_time fields a format shows.
+
+    ``resolution`` is ``'second'`` for formats that include the time of day
+    and ``'day'`` for date-only formats, so a date string is formatted once
+    a day however often the clock redraws.
+    """
+    
+    FIELDS = {'second': 6, 'minute': 5, 'day': 3}
+    
+    def __init__(self, fmt, resolution='second'):
+        self.fmt = fmt
+        self.fields = self.FIELDS[resolution]
+        self.key = None
+        self.text = None
+    
+    def __call__(self, current_time):
+        key = tuple(current_time[:self.fields])
+        if key != self.key:
+            self.key = key
+            self.text = time.strftime(self.fmt, current_time)
+        return self.text
+
+
+class TextReadout:
+    """One or more text items (e.g. text and its shadow) showing one string"""
+    
+    def __init__(self, canvas, items):
+        self.canvas = canvas
+        self.items = items
+        self.text = None
+    
+    def set(self, text):
+        """Show ``text``; returns False without touching the canvas if unchanged"""
+        if text == self.text:
+            return False
+        self.text = text
+        for item in self.items:
+            self.canvas.itemconfig(item, text=text)
+        return True
@@ -0,0 +1,436 @@
+"""Record a clock's canvas calls into a compact binary log, and replay them."""
+import hashlib
+import io
+import struct
+import time
+
+from .backend import CanvasBackend, flatten
+from .raster import Image, RasterCanvas
+from .view import ClockView, fit_zoom
+
+LOG_MAGIC = b'CLKREC'
+LOG_VERSION = 1
+# Magic, version, canvas width and height, background color, design name
+HEADER = struct.Struct('<6sHHH16s32s')
+
+# Commands; each kind of item has its own create opcode, OP_CREATE + its index in KINDS
+OP_STRING, OP_IMAGE, OP_FRAME, OP_COORDS, OP_ITEMCONFIG, OP_DELETE, OP_MOVE, OP_SCALE = range(8)
+OP_CREATE = 16
+KINDS = ('line', 'oval', 'polygon', 'rectangle', 'text', 'image')
+
+# Types of option values and targets
+V_NONE, V_FALSE, V_TRUE, V_INT, V_FLOAT, V_STRING, V_TUPLE, V_IMAGE = range(8)
+CONSTANTS = {V_NONE: None, V_FALSE: False, V_TRUE: True}
+
+FLOAT = struct.Struct('<d')
+
+
+def write_varint(buffer, value):
+    """Append a non-negative int, 7 bits per byte"""
+    while value > 0x7f:
+        buffer.append(value & 0x7f | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, offset):
+    """``(value, offset)`` of the varint at ``offset``"""
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class RecordingCanvas(CanvasBackend):
+    """Pass drawing calls on to ``canvas`` and append each one to a binary log.
+
+    Every ``create_*``, ``coords``, ``itemconfig``, ``delete``, ``move``
+    and ``scale`` call that changes the canvas is logged; queries and
+    anything else go straight to the wrapped canvas. Strings (option
+    names, colors, tags) are written once and then referred to by number,
+    coordinates as 32-bit floats, and images as PNG the first time they
+    are loaded, so a log stands on its own. ``frame`` starts the commands
+    of a new frame; the ones before the first frame set the scene up.
+
+    Put it under a ClockView to log canvas pixels: a replay then makes
+    exactly the backend calls the clock made, with none of its geometry.
+    """
+    
+    def __init__(self, canvas, output, width, height, background='#000000', design=''):
+        self.canvas = canvas
+        self.output = output
+        self.zoom = canvas.zoom
+        self.buffer = bytearray()
+        self.strings = {}
+        # id of the canvas's image handle to (handle, index); the handle is kept so its id stays unique
+        self.images = {}
+        self.commands = 0
+        output.write(HEADER.pack(LOG_MAGIC, LOG_VERSION, width, height, background.encode(), design.encode()))
+    
+    def __getattr__(self, name):
+        return getattr(self.canvas, name)
+    
+    def _string(self, text):
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+            data = text.encode()
+            self.buffer.append(OP_STRING)
+            write_varint(self.buffer, len(data))
+            self.buffer += data
+        return index
+    
+    def _image(self, handle, data):
+        if id(handle) not in self.images:
+            self.images[id(handle)] = (handle, len(self.images))
+            self.buffer.append(OP_IMAGE)
+            write_varint(self.buffer, len(data))
+            self.buffer += data
+        return handle
+    
+    def _value(self, command, value):
+        if value is None or value is True or value is False:
+            command.append(V_NONE if value is None else V_TRUE if value else V_FALSE)
+        elif isinstance(value, int):
+            command.append(V_INT)
+            write_varint(command, value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, float):
+            command.append(V_FLOAT)
+            command += FLOAT.pack(value)
+        elif isinstance(value, str):
+            command.append(V_STRING)
+            write_varint(command, self._string(value))
+        elif isinstance(value, (tuple, list)):
+            command.append(V_TUPLE)
+            write_varint(command, len(value))
+            for part in value:
+                self._value(command, part)
+        elif id(value) in self.images:
+            command.append(V_IMAGE)
+            write_varint(command, self.images[id(value)][1])
+        else:
+            raise TypeError(f"can't record option value {value!r}")
+    
+    @staticmethod
+    def _coords(command, coords):
+        write_varint(command, len(coords))
+        command += struct.pack(f'<{len(coords)}f', *coords)
+    
+    def _options(self, command, options):
+        write_varint(command, len(options))
+        for name, value in options.items():
+            write_varint(command, self._string(name))
+            self._value(command, value)
+    
+    def _log(self, command):
+        # Strings and images a command uses were logged while it was encoded, ahead of it
+        self.buffer += command
+        self.commands += 1
+    
+    def _create(self, kind, args, options):
+        coords = flatten(args)
+        command = bytearray()
+        self._options(command, options)
+        # The wrapped canvas may take options apart, so they are encoded first
+        item = getattr(self.canvas, f"create_{kind}")(coords, **options)
+        header = bytearray((OP_CREATE + KINDS.index(kind),))
+        write_varint(header, item)
+        self._coords(header, coords)
+        self._log(header + command)
+        return item
+    
+    def create_line(self, *args, **options):
+        return self._create('line', args, options)
+    
+    def create_oval(self, *args, **options):
+        return self._create('oval', args, options)
+    
+    def create_polygon(self, *args, **options):
+        return self._create('polygon', args, options)
+    
+    def create_rectangle(self, *args, **options):
+        return self._create('rectangle', args, options)
+    
+    def create_text(self, *args, **options):
+        return self._create('text', args, options)
+    
+    def create_image(self, *args, **options):
+        return self._create('image', args, options)
+    
+    def coords(self, tag_or_id, *args):
+        if not args:
+            return self.canvas.coords(tag_or_id)
+        coords = flatten(args)
+        command = bytearray((OP_COORDS,))
+        self._value(command, tag_or_id)
+        self._coords(command, coords)
+        self._log(command)
+        return self.canvas.coords(tag_or_id, coords)
+    
+    def itemconfig(self, tag_or_id, **options):
+        if not options:
+            return self.canvas.itemconfig(tag_or_id)
+        command = bytearray((OP_ITEMCONFIG,))
+        self._value(command, tag_or_id)
+        self._options(command, options)
+        self._log(command)
+        return self.canvas.itemconfig(tag_or_id, **options)
+    
+    itemconfigure = itemconfig
+    
+    def delete(self, *tags_or_ids):
+        command = bytearray((OP_DELETE,))
+        self._value(command, tags_or_ids)
+        self._log(command)
+        self.canvas.delete(*tags_or_ids)
+    
+    def move(self, tag_or_id, dx, dy):
+        command = bytearray((OP_MOVE,))
+        self._value(command, tag_or_id)
+        self._value(command, (float(dx), float(dy)))
+        self._log(command)
+        self.canvas.move(tag_or_id, dx, dy)
+    
+    def scale(self, tag_or_id, x, y, xscale, yscale):
+        command = bytearray((OP_SCALE,))
+        self._value(command, tag_or_id)
+        self._value(command, tuple(float(value) for value in (x, y, xscale, yscale)))
+        self._log(command)
+        self.canvas.scale(tag_or_id, x, y, xscale, yscale)
+    
+    def load_image(self, path):
+        handle = self.canvas.load_image(path)
+        if id(handle) not in self.images:
+            with open(path, 'rb') as image:
+                self._image(handle, image.read())
+        return handle
+    
+    def photo_image(self, image):
+        handle = self.canvas.photo_image(image)
+        if id(handle) not in self.images:
+            data = io.BytesIO()
+            image.save(data, 'PNG')
+            self._image(handle, data.getvalue())
+        return handle
+    
+    def frame(self, timestamp):
+        """Start the commands of the frame for an epoch time, writing out those before it"""
+        self.buffer.append(OP_FRAME)
+        self.buffer += FLOAT.pack(timestamp)
+        self.flush()
+    
+    def flush(self):
+        self.output.write(self.buffer)
+        self.buffer.clear()
+
+
+class LoggedImage:
+    """An image option in a decoded log: the index of its PNG data in ``CommandLog.images``"""
+    
+    __slots__ = ('index',)
+    
+    def __init__(self, index):
+        self.index = index
+    
+    def __repr__(self):
+        return f"<image {self.index}>"
+
+
+class CommandLog:
+    """A command log read back from a file.
+
+    ``setup`` holds the commands logged before the first frame and
+    ``frames`` a ``(timestamp, commands)`` pair per frame. A command is
+    ``(method, target, args, options)``: the canvas method's name, the
+    logged item id (for ``create_*``, the id it was given), a tag or, for
+    ``delete``, a tuple of them, then its positional arguments after the
+    target (the coordinates of ``create_*``) and keyword options. Images
+    in options are LoggedImage indexes into ``images``, PNG data.
+    """
+    
+    def __init__(self, path):
+        with open(path, 'rb') as log:
+            data = log.read()
+        magic, version, self.width, self.height, background, design = HEADER.unpack_from(data)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise ValueError(f"{path} is not a version {LOG_VERSION} command log")
+        self.path = path
+        self.background = background.rstrip(b'\0').decode()
+        self.design = design.rstrip(b'\0').decode()
+        self.strings = []
+        self.images = []
+        self.setup = commands = []
+        self.frames = []
+        
+        offset = HEADER.size
+        while offset < len(data):
+            opcode = data[offset]
+            offset += 1
+            if opcode == OP_STRING or opcode == OP_IMAGE:
+                size, offset = read_varint(data, offset)
+                chunk = bytes(data[offset:offset + size])
+                offset += size
+                if opcode == OP_STRING:
+                    self.strings.append(chunk.decode())
+                else:
+                    self.images.append(chunk)
+            elif opcode == OP_FRAME:
+                commands = []
+                self.frames.append((FLOAT.unpack_from(data, offset)[0], commands))
+                offset += FLOAT.size
+            elif opcode >= OP_CREATE:
+                item, offset = read_varint(data, offset)
+                coords, offset = self._coords(data, offset)
+                options, offset = self._options(data, offset)
+                commands.append((f"create_{KINDS[opcode - OP_CREATE]}", item, (coords,), options))
+            else:
+                target, offset = self._value(data, offset)
+                if opcode == OP_COORDS:
+                    coords, offset = self._coords(data, offset)
+                    commands.append(('coords', target, (coords,), {}))
+                elif opcode == OP_ITEMCONFIG:
+                    options, offset = self._options(data, offset)
+                    commands.append(('itemconfig', target, (), options))
+                elif opcode == OP_DELETE:
+                    commands.append(('delete', target, (), {}))
+                elif opcode in (OP_MOVE, OP_SCALE):
+                    args, offset = self._value(data, offset)
+                    commands.append(('move' if opcode == OP_MOVE else 'scale', target, args, {}))
+                else:
+                    raise ValueError(f"{path}: unknown command {opcode} at byte {offset - 1}")
+    
+    def _value(self, data, offset):
+        kind = data[offset]
+        offset += 1
+        if kind in CONSTANTS:
+            return CONSTANTS[kind], offset
+        if kind == V_FLOAT:
+            return FLOAT.unpack_from(data, offset)[0], offset + FLOAT.size
+        if kind == V_TUPLE:
+            count, offset = read_varint(data, offset)
+            values = []
+            for _ in range(count):
+                value, offset = self._value(data, offset)
+                values.append(value)
+            return tuple(values), offset
+        number, offset = read_varint(data, offset)
+        if kind == V_INT:
+            return (number >> 1) ^ -(number & 1), offset
+        if kind == V_STRING:
+            return self.strings[number], offset
+        return LoggedImage(number), offset
+    
+    @staticmethod
+    def _coords(data, offset):
+        count, offset = read_varint(data, offset)
+        return list(struct.unpack_from(f'<{count}f', data, offset)), offset + 4 * count
+    
+    def _options(self, data, offset):
+        count, offset = read_varint(data, offset)
+        options = {}
+        for _ in range(count):
+            name, offset = read_varint(data, offset)
+            options[self.strings[name]], offset = self._value(data, offset)
+        return options, offset
+    
+    def command_count(self):
+        return len(self.setup) + sum(len(commands) for _, commands in self.frames)
+
+
+def record_clock(clock_cls, path, timestamps, size=None, clock_options=None, static_cache=False):
+    """Draw a headless clock at ``timestamps`` and log its canvas calls to ``path``; returns the log.
+
+    The clock draws through a ClockView fitted to ``size`` (default: the
+    design size) onto a RecordingCanvas over an off-screen RasterCanvas.
+    The dial is drawn item by item, so its calls are logged too;
+    ``static_cache=True`` logs it as the one cached image a clock shows.
+    Each frame is what the clock's update loop does: ``render_frame``, and
+    each of its ``animations`` as often as its period of displayed time.
+    """
+    width, height = size or (clock_cls.width, clock_cls.height)
+    zoom, x, y = fit_zoom(clock_cls.width, clock_cls.height, width, height)
+    with open(path, 'wb') as output:
+        recorder = RecordingCanvas(RasterCanvas(width, height, clock_cls.background), output,
+                                   width, height, clock_cls.background, clock_cls.__name__)
+        clock = clock_cls(None, canvas=ClockView(recorder, x, y, zoom), static_cache=static_cache,
+                          **(clock_options or {}))
+        due = dict.fromkeys(clock.animations, timestamps[0] if timestamps else 0)
+        for timestamp in timestamps:
+            recorder.frame(timestamp)
+            clock.render_frame(timestamp)
+            for name, period in clock.animations.items():
+                if timestamp >= due[name]:
+                    getattr(clock, name)()
+                    due[name] = timestamp + period
+        recorder.flush()
+    return CommandLog(path)
+
+
+def replay(log, canvas, on_frame=None):
+    """Make a log's calls on ``canvas`` as fast as it takes them; returns ``(setup, frames)`` in seconds.
+
+    Logged images are turned into the canvas's own and every call is
+    looked up before the clock starts, so the timings cover the canvas
+    calls and ``on_frame`` (e.g. Tk's ``update_idletasks``, to make it
+    draw), which runs after the setup and after each frame.
+    """
+    if log.images and Image is None:
+        raise RuntimeError("replaying images needs Pillow (pip install pillow)")
+    images = [canvas.photo_image(Image.open(io.BytesIO(data)).convert('RGBA')) for data in log.images]
+    
+    def prepare(commands):
+        prepared = []
+        for method, target, args, options in commands:
+            if any(isinstance(value, LoggedImage) for value in options.values()):
+                options = {
+                    name: images[value.index] if isinstance(value, LoggedImage) else value
+                    for name, value in options.items()
+                }
+            prepared.append((getattr(canvas, method), method.startswith('create_'), method == 'delete',
+                             target, args, options))
+        return prepared
+    setup = prepare(log.setup)
+    frames = [prepare(commands) for _, commands in log.frames]
+    
+    # Logged item ids to the ids the canvas gave the same items
+    ids = {}
+    
+    def run(commands):
+        began = time.perf_counter()
+        for call, create, delete, target, args, options in commands:
+            if create:
+                ids[target] = call(*args, **options)
+            elif delete:
+                call(*[ids.get(part, part) for part in target])
+            else:
+                call(ids.get(target, target), *args, **options)
+        if on_frame is not None:
+            on_frame()
+        return time.perf_counter() - began
+    
+    return run(setup), [run(commands) for commands in frames]
+
+
+def dump_log(log, output):
+    """Write a log as text, one command per line, so the calls of two versions can be diffed"""
+    output.write(f"# {log.design} {log.width}x{log.height} {log.background}\n")
+    for index, data in enumerate(log.images):
+        output.write(f"image {index} {len(data)} bytes sha1 {hashlib.sha1(data).hexdigest()[:12]}\n")
+    
+    def write(commands):
+        for method, target, args, options in commands:
+            parts = [method, repr(target)]
+            for arg in args:
+                if isinstance(arg, list):
+                    arg = '[' + ' '.join(f"{value:.6g}" for value in arg) + ']'
+                parts.append(str(arg))
+            parts.extend(f"{name}={value!r}" for name, value in options.items())
+            output.write(' '.join(parts) + '\n')
+    write(log.setup)
+    for index, (timestamp, commands) in enumerate(log.frames):
+        output.write(f"frame {index} {timestamp:.3f}\n")
+        write(commands)
@@ -0,0 +1,200 @@
+"""Drift-free frame scheduling for Tk clocks on a single timer."""
+import logging
+import math
+import time
+import tkinter as tk
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledJob:
+    """A periodic callback and its deadline statistics"""
+    
+    def __init__(self, name, callback, period):
+        self.name = name
+        self.callback = callback
+        self.period = period
+        self.deadline = None
+        self.runs = 0
+        self.on_time = 0
+        self.skipped = 0
+        self.total_lateness = 0.0
+        self.max_lateness = 0.0
+    
+    def stats(self):
+        return {
+            'period_ms': self.period * 1000,
+            'runs': self.runs,
+            'on_time': self.on_time,
+            'hit_rate': self.on_time / self.runs if self.runs else 1.0,
+            'skipped': self.skipped,
+            'mean_lateness_ms': self.total_lateness / self.runs * 1000 if self.runs else 0.0,
+            'max_lateness_ms': self.max_lateness * 1000,
+        }
+
+
+class FrameScheduler:
+    """Run all periodic jobs of a window from one ``root.after`` timer.
+
+    Deadlines come from a monotonic clock and advance by whole periods, so
+    render time never stretches the frame period. When a job falls more
+    than a period behind, the missed frames are skipped rather than run
+    back to back. A run counts as on time when the timer fires within
+    ``tolerance`` seconds of its deadline.
+
+    A job may return the number of seconds until it next needs to run
+    (never less than its period); returning None keeps the fixed period
+    and ``math.inf`` stops it until the scheduler is started again, e.g.
+    by ``resume``. With every job stopped the timer is not armed at all.
+    ``pause`` stops the timer entirely, e.g. while the window is unmapped.
+    """
+    
+    def __init__(self, root, tolerance=0.005, report_every=60.0, clock=time.monotonic):
+        self.root = root
+        self.tolerance = tolerance
+        self.report_every = report_every
+        self.clock = clock
+        self.jobs = []
+        self.timer = None
+        self.next_report = None
+        self.paused = False
+    
+    def add_job(self, callback, period, name=None):
+        """Run ``callback`` every ``period`` seconds once started"""
+        job = ScheduledJob(name or callback.__name__, callback, period)
+        self.jobs.append(job)
+        if self.next_report is not None and not self.paused:
+            # Already started; the timer may be idle with every job stopped
+            job.deadline = self.clock()
+            self._arm()
+        return job
+    
+    def start(self):
+        now = self.clock()
+        for job in self.jobs:
+            job.deadline = now
+        self.next_report = now + self.report_every
+        self._tick()
+    
+    def stop(self):
+        if self.timer is not None:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+    
+    def pause(self):
+        """Stop ticking until resume(); no frames are counted as missed"""
+        self.paused = True
+        self.stop()
+    
+    def resume(self):
+        """Restart all jobs from now after a pause"""
+        if self.paused:
+            self.paused = False
+            self.start()
+    
+    def pause_while_unmapped(self):
+        """Pause while the root window is minimized or hidden"""
+        def on_map_change(event):
+            # Child widgets report their own Map/Unmap through the root bindings
+            if event.widget is not self.root:
+                return
+            if event.type == tk.EventType.Unmap:
+                self.pause()
+            else:
+                self.resume()
+        
+        self.root.bind('<Unmap>', on_map_change, add='+')
+        self.root.bind('<Map>', on_map_change, add='+')
+    
+    def stats(self):
+        """Deadline statistics per job name"""
+        return {job.name: job.stats() for job in self.jobs}
+    
+    def _tick(self):
+        self.timer = None
+        # Lateness is measured from when the timer fired; jobs sharing a
+        # deadline are not penalized for running after one another
+        now = self.clock()
+        for job in self.jobs:
+            if job.deadline - now > 0.001:
+                continue
+            
+            lateness = max(0.0, now - job.deadline)
+            job.runs += 1
+            job.total_lateness += lateness
+            job.max_lateness = max(job.max_lateness, lateness)
+            if lateness <= self.tolerance:
+                job.on_time += 1
+            
+            # Next deadline on the original grid, skipping frames we missed
+            missed = int(lateness // job.period)
+            job.skipped += missed
+            job.deadline += (missed + 1) * job.period
+            
+            delay = job.callback()
+            if delay is not None:
+                # The job knows when it next has something to draw
+                job.deadline = now + max(delay, job.period)
+        
+        if self.clock() >= self.next_report:
+            self.next_report += self.report_every
+            for name, stats in self.stats().items():
+                logger.info("%s: %.1f%% of %d frames on time, %d skipped, max %.1f ms late",
+                            name, stats['hit_rate'] * 100, stats['runs'],
+                            stats['skipped'], stats['max_lateness_ms'])
+        if not self.paused:
+            self._arm()
+    
+    def _arm(self):
+        """(Re)start the single timer for the earliest pending deadline"""
+        if self.timer is not None:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+        if not self.jobs:
+            return
+        deadline = min(job.deadline for job in self.jobs)
+        if deadline == math.inf:
+            # Nothing will ever be due
+            return
+        delay = deadline - self.clock()
+        self.timer = self.root.after(max(1, math.ceil(delay * 1000)), self._tick)
+
+
+class FrameAnimations:
+    """Periodic callbacks run by a frame job instead of on timers of their own.
+
+    ``run`` calls every callback whose period has passed since its last
+    run. Called after each adaptive frame, an animation steps at most once
+    per period and only when a frame is drawn anyway, so it never wakes
+    the window up by itself: a sweeping clock keeps its frame rate and a
+    ticking one steps its animations once a second.
+    """
+    
+    def __init__(self, callbacks, clock=time.monotonic):
+        # [callback, period, deadline]
+        self.jobs = [[callback, period, None] for callback, period in callbacks]
+        self.clock = clock
+    
+    def run(self):
+        now = self.clock()
+        for job in self.jobs:
+            callback, period, deadline = job
+            if deadline is not None and deadline - now > 0.001:
+                continue
+            callback()
+            job[2] = now + period
+
+
+def next_frame_delay(timestamp, motion, pixel_interval, min_delay=0.05):
+    """Seconds until a clock next changes visibly.
+
+    In ``'tick'`` motion the hands and digital readout change on the next
+    whole second. In ``'sweep'`` motion the fastest hand tip moves one pixel
+    every ``pixel_interval`` seconds, and the readout still changes on the
+    second, whichever comes first, but never sooner than ``min_delay``.
+    """
+    # Wake just after the second boundary, not just before it
+    to_next_second = 1 - timestamp % 1 + 0.005
+    if motion == 'tick':
+        return to_next_second
+    return max(min_delay, min(pixel_interval, to_next_second))
@@ -0,0 +1,280 @@
+"""Local HTTP service that renders clock images on request."""
+import asyncio
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from .faces import load_face
+from .raster import RasterCanvas
+from .timesource import parse_timestamp
+from .vector import VectorClock
+from .view import ClockView, fit_zoom
+from .zones import get_zone
+
+CONTENT_TYPES = {'png': 'image/png', 'svg': 'image/svg+xml'}
+MAX_SIZE = 4096
+# Idle keep-alive connections are closed after this many seconds
+IDLE_TIMEOUT = 15
+THEME_NAME = re.compile(r'^[A-Za-z0-9_-]+$')
+# Epoch times that can be drawn: years 1 to 9997, leaving room for zone
+# offsets and the search for a zone's next transition
+TIME_RANGE = (-62135596800 + 86400, 253402300799 - 800 * 86400)
+
+
+class HttpError(Exception):
+    """A request the service answers with an error status"""
+    
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def design_name(clock_cls):
+    """Name a design is served under: its face file's name, e.g. 'modern'"""
+    return os.path.splitext(os.path.basename(clock_cls.face_file))[0]
+
+
+class RenderService:
+    """Clock images for ``GET /clock.png`` and ``/clock.svg``.
+
+    Query parameters: ``design`` (one of ``designs``, default the first),
+    ``time`` (epoch seconds or ISO 8601, default now), ``zone`` (an IANA
+    name, default the server's local time), ``size`` (``WIDTHxHEIGHT``,
+    default the design size) and ``theme`` (a face file next to the
+    design's own, by name). ``animate=1`` makes an SVG whose hands keep
+    turning in the browser (see clock_engine.vector).
+
+    Images show whole seconds, so the ETag of a request is fixed until the
+    displayed second changes and clients revalidating within it get a 304.
+    Each design, theme and size keeps a clock with its static dial in an
+    LRU of ``cache_size`` entries, so a request only moves and draws the
+    hands. The last ``response_cache`` images are kept, and concurrent
+    requests for the same image wait for one render.
+    """
+    
+    def __init__(self, designs, cache_size=32, response_cache=256):
+        self.designs = designs
+        self.default_design = next(iter(designs))
+        self.cache_size = cache_size
+        self.clocks = OrderedDict()
+        self.clocks_lock = threading.Lock()
+        self.response_cache = response_cache
+        self.responses = OrderedDict()
+        self.pending = {}
+        # Part of every ETag, so images cached by clients don't outlive a restart
+        self.token = f"{time.time():.0f}"
+    
+    def parse(self, target):
+        """Validated ``(fmt, design, theme, size, zone, second, animate)`` of a request target"""
+        url = urlsplit(target)
+        fmt = {'/': 'png', '/clock.png': 'png', '/clock.svg': 'svg'}.get(url.path)
+        if fmt is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"no such path {url.path!r}; try /clock.png or /clock.svg")
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        
+        design = query.get('design', self.default_design)
+        if design not in self.designs:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"no design {design!r}; one of {', '.join(self.designs)}")
+        clock_cls = self.designs[design]
+        
+        theme = query.get('theme')
+        if theme is not None:
+            path = self.theme_path(clock_cls, theme) if THEME_NAME.match(theme) else None
+            if path is None:
+                raise HttpError(HTTPStatus.NOT_FOUND, f"no theme {theme!r} for {design}")
+            problem = self.theme_problem(clock_cls, path)
+            if problem:
+                raise HttpError(HTTPStatus.NOT_FOUND, f"theme {theme!r} doesn't fit {design}: {problem}")
+        
+        size = (clock_cls.width, clock_cls.height)
+        if 'size' in query:
+            try:
+                size = tuple(int(value) for value in query['size'].lower().split('x'))
+            except ValueError:
+                size = ()
+            if len(size) != 2 or not all(0 < value <= MAX_SIZE for value in size):
+                raise HttpError(HTTPStatus.BAD_REQUEST, f"size must be WIDTHxHEIGHT, each 1 to {MAX_SIZE}")
+        
+        zone = query.get('zone')
+        if zone is not None:
+            try:
+                get_zone(zone)
+            except ValueError as error:
+                raise HttpError(HTTPStatus.BAD_REQUEST, str(error)) from None
+        
+        try:
+            second = int(parse_timestamp(query['time']) if 'time' in query else time.time())
+        except (ValueError, OverflowError, OSError):
+            # OverflowError and OSError for infinite or out of range times
+            raise HttpError(HTTPStatus.BAD_REQUEST, "time must be epoch seconds or ISO 8601") from None
+        if not TIME_RANGE[0] <= second <= TIME_RANGE[1]:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "time must be between the years 1 and 9997")
+        animate = fmt == 'svg' and query.get('animate', '0').lower() in ('1', 'true', 'yes')
+        return fmt, design, theme, size, zone, second, animate
+    
+    @staticmethod
+    def theme_path(clock_cls, theme):
+        """The face file of a theme, next to the design's own face file, or None"""
+        faces = os.path.dirname(clock_cls.face_path())
+        for extension in ('.json', '.toml'):
+            path = os.path.join(faces, theme + extension)
+            if os.path.exists(path):
+                return path
+        return None
+    
+    @staticmethod
+    def theme_problem(clock_cls, path):
+        """Why a theme's face can't dress a design (it fails to compile or lacks layers), or None"""
+        try:
+            layers = load_face(path).layers
+        except (ValueError, KeyError, TypeError, RuntimeError, OSError) as error:
+            return f"{type(error).__name__}: {error}"
+        missing = set(load_face(clock_cls.face_path()).layers) - set(layers)
+        if missing:
+            return f"no {', '.join(sorted(missing))} layer"
+        return None
+    
+    def etag(self, request):
+        key = '|'.join(map(str, request + (self.token,)))
+        return '"' + hashlib.sha1(key.encode()).hexdigest()[:20] + '"'
+    
+    def clock(self, fmt, design, theme, size):
+        """The cached clock for a design, theme and size, built on first use; with its lock"""
+        # SVG scales with its viewBox, so one clock serves every size
+        key = (fmt, design, theme, size if fmt == 'png' else None)
+        with self.clocks_lock:
+            if key in self.clocks:
+                self.clocks.move_to_end(key)
+                return self.clocks[key]
+        clock_cls = self.designs[design]
+        face = self.theme_path(clock_cls, theme) if theme else None
+        if fmt == 'svg':
+            # Dial and hands drawn once as shared definitions
+            clock, canvas = VectorClock(clock_cls, face=face), None
+        else:
+            zoom, x, y = fit_zoom(clock_cls.width, clock_cls.height, *size)
+            canvas = RasterCanvas(size[0], size[1], clock_cls.background)
+            clock = clock_cls(None, canvas=ClockView(canvas, x, y, zoom), motion='tick', face=face)
+        entry = (clock, canvas, threading.Lock())
+        with self.clocks_lock:
+            entry = self.clocks.setdefault(key, entry)
+            self.clocks.move_to_end(key)
+            while len(self.clocks) > self.cache_size:
+                self.clocks.popitem(last=False)
+        return entry
+    
+    def render(self, request):
+        """The image bytes for a parsed request"""
+        fmt, design, theme, size, zone, second, animate = request
+        clock, canvas, lock = self.clock(fmt, design, theme, size)
+        zone = get_zone(zone) if zone else None
+        with lock:
+            if fmt == 'svg':
+                return clock.document(second, zone, size, animate).encode()
+            clock.zone = zone
+            clock.render_frame(second)
+            data = io.BytesIO()
+            canvas.save(data, format='PNG')
+            return data.getvalue()
+    
+    async def image(self, request, etag):
+        """Image bytes for a request, rendered at most once however many ask at the same time"""
+        if etag in self.responses:
+            self.responses.move_to_end(etag)
+            return self.responses[etag]
+        if etag in self.pending:
+            return await asyncio.shield(self.pending[etag])
+        future = self.pending[etag] = asyncio.get_running_loop().run_in_executor(None, self.render, request)
+        try:
+            body = await asyncio.shield(future)
+        finally:
+            del self.pending[etag]
+        self.responses[etag] = body
+        while len(self.responses) > self.response_cache:
+            self.responses.popitem(last=False)
+        return body
+    
+    async def respond(self, method, target, headers):
+        """``(status, headers, body)`` for one request"""
+        if method not in ('GET', 'HEAD'):
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "only GET and HEAD are supported")
+        request = self.parse(target)
+        etag = self.etag(request)
+        response_headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if etag in (tag.strip() for tag in headers.get('if-none-match', '').split(',')):
+            return HTTPStatus.NOT_MODIFIED, response_headers, b''
+        body = await self.image(request, etag)
+        response_headers['Content-Type'] = CONTENT_TYPES[request[0]]
+        return HTTPStatus.OK, response_headers, body
+    
+    async def handle(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection until it closes"""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), IDLE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+                    return
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split()
+                except ValueError:
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                
+                try:
+                    status, response_headers, body = await self.respond(method, target, headers)
+                except HttpError as error:
+                    status, response_headers = error.status, {'Content-Type': 'text/plain; charset=utf-8'}
+                    body = f"{error}\n".encode()
+                except Exception as error:
+                    # e.g. a broken theme file; report it and keep serving
+                    status, response_headers = HTTPStatus.INTERNAL_SERVER_ERROR, {'Content-Type': 'text/plain; charset=utf-8'}
+                    body = f"{type(error).__name__}: {error}\n".encode()
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                response_headers['Content-Length'] = str(len(body))
+                response_headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n".encode()
+                    + ''.join(f"{name}: {value}\r\n" for name, value in response_headers.items()).encode()
+                    + b'\r\n' + (b'' if method == 'HEAD' else body)
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def parse_address(value):
+    """``[HOST:]PORT`` as ``(host, port)``; the host defaults to localhost"""
+    host, _, port = value.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def serve(designs, address='127.0.0.1:8080', **options):
+    """Run the render service for ``designs`` (name to clock class) until interrupted"""
+    host, port = parse_address(address)
+    service = RenderService(designs, **options)
+    
+    async def main():
+        server = await asyncio.start_server(service.handle, host, port, backlog=1024)
+        print(f"Serving {', '.join(designs)} on http://{host}:{port}/clock.png and /clock.svg")
+        async with server:
+            await server.serve_forever()
+    
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,69 @@
+"""On-disk cache of static dial layers rasterized to PNG images."""
+import hashlib
+import os
+from functools import lru_cache
+
+from .raster import Image, RasterCanvas
+from .view import ClockView
+
+# Bump when the rasterizer output changes in a way the key can't see
+CACHE_VERSION = 1
+
+# Engine modules whose code decides what a static layer looks like: the
+# face compiler and the geometry, gradients and rasterizer it draws with
+RENDER_SOURCES = ('faces.py', 'geometry.py', 'gradient.py', 'raster.py', 'backend.py', 'view.py')
+
+
+def cache_dir():
+    """Directory holding cached layers (override with ANALOG_CLOCK_CACHE)"""
+    default = os.path.join(os.path.expanduser('~'), '.cache', 'analog_clock')
+    return os.environ.get('ANALOG_CLOCK_CACHE', default)
+
+
+def source_digest(path):
+    """Short hash of a source file so layers are rebuilt when drawing code changes"""
+    with open(path, 'rb') as source:
+        return hashlib.sha1(source.read()).hexdigest()[:12]
+
+
+@lru_cache(maxsize=None)
+def render_digest():
+    """Short hash of the engine's drawing code, so layers are rebuilt when it changes"""
+    engine = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha1()
+    for name in RENDER_SOURCES:
+        with open(os.path.join(engine, name), 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()[:12]
+
+
+def static_layer_path(name, width, height, theme, source):
+    """Cache path of a static layer, keyed by design, size, theme and the code that draws it"""
+    key = f"{name}-{width}x{height}-{theme}-v{CACHE_VERSION}-{source_digest(source)}-{render_digest()}"
+    return os.path.join(cache_dir(), f"{key}.png")
+
+
+def cached_static_layer(name, width, height, theme, background, draw, source, zoom=1.0, rasterize=True):
+    """Return the PNG path of a static layer, rasterizing it on a cache miss.
+
+    ``width`` and ``height`` are the design size; the image is ``zoom``
+    times that. ``draw`` is called with a canvas to draw the static scene
+    on in design coordinates. Returns None when the layer is not cached
+    and Pillow is not installed, so the caller can fall back to drawing
+    vector items, or when it is not cached and ``rasterize`` is false.
+    """
+    width, height = round(width * zoom), round(height * zoom)
+    path = static_layer_path(name, width, height, theme, source)
+    if os.path.exists(path):
+        return path
+    if Image is None or not rasterize:
+        return None
+    
+    canvas = RasterCanvas(width, height, background)
+    draw(canvas if zoom == 1 else ClockView(canvas, zoom=zoom))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write then rename so concurrent launches never read a partial file
+    partial = f"{path}.{os.getpid()}.tmp"
+    canvas.render().save(partial, 'PNG')
+    os.replace(partial, path)
+    return path
@@ -0,0 +1,161 @@
+"""Canvas that writes Tk-style drawing calls out as an SVG document."""
+import base64
+import io
+from xml.sax.saxutils import escape, quoteattr
+
+from .backend import RetainedCanvas
+from .raster import font_pixels
+
+# Tk text anchors as SVG (text-anchor, dominant-baseline)
+TEXT_ANCHORS = {
+    'center': ('middle', 'central'), 'n': ('middle', 'text-before-edge'),
+    's': ('middle', 'text-after-edge'), 'e': ('end', 'central'), 'w': ('start', 'central'),
+    'nw': ('start', 'text-before-edge'), 'ne': ('end', 'text-before-edge'),
+    'sw': ('start', 'text-after-edge'), 'se': ('end', 'text-after-edge'),
+}
+
+
+def number(value):
+    """A coordinate with at most two decimals and no trailing zeros"""
+    text = f"{value:.2f}".rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def points(coords):
+    return ' '.join(f"{number(x)},{number(y)}" for x, y in zip(coords[0::2], coords[1::2]))
+
+
+def smooth_path(coords):
+    """Tk's smooth=True closed spline as an SVG path: quadratic curves between edge midpoints"""
+    vertices = list(zip(coords[0::2], coords[1::2]))
+    midpoints = [
+        ((x + nx) / 2, (y + ny) / 2)
+        for (x, y), (nx, ny) in zip(vertices, vertices[1:] + vertices[:1])
+    ]
+    path = [f"M{number(midpoints[-1][0])},{number(midpoints[-1][1])}"]
+    for (cx, cy), (x, y) in zip(vertices, midpoints):
+        path.append(f"Q{number(cx)},{number(cy)} {number(x)},{number(y)}")
+    return ' '.join(path) + 'Z'
+
+
+class SvgCanvas(RetainedCanvas):
+    """Retained-mode canvas whose ``render`` returns an SVG document.
+
+    Supports the same subset of the ``tk.Canvas`` API as RasterCanvas.
+    Each item's SVG element is generated once and kept until the item
+    changes, so rendering a frame where only the hands moved rebuilds only
+    the hands. Images (e.g. a cached static layer) are embedded as PNG.
+    """
+    
+    def __init__(self, width, height, background='#000000'):
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.background = background
+        self.elements = {}
+        self.images = {}
+    
+    def _changed(self, item):
+        self.elements.pop(item, None)
+    
+    def load_image(self, path):
+        if path not in self.images:
+            with open(path, 'rb') as image:
+                self.images[path] = f"data:image/png;base64,{base64.b64encode(image.read()).decode()}"
+        return self.images[path]
+    
+    def photo_image(self, image):
+        data = io.BytesIO()
+        image.save(data, 'PNG')
+        return f"data:image/png;base64,{base64.b64encode(data.getvalue()).decode()}"
+    
+    def element(self, item):
+        """The SVG markup of one item ('' while it is hidden)"""
+        if item not in self.elements:
+            kind, coords, options, _ = self.items[item]
+            self.elements[item] = self.markup(kind, coords, options)
+        return self.elements[item]
+    
+    def markup(self, kind, coords, options):
+        """The SVG element of an item's kind, coordinates and options"""
+        if options.get('state') == 'hidden':
+            return ''
+        return getattr(self, f"_{kind}")(coords, options)
+    
+    def body(self):
+        """The elements of every item, in stacking order"""
+        return ''.join(self.element(item) for item in self.items)
+    
+    def render(self, width=None, height=None):
+        """The whole canvas as an SVG document, scaled to ``width`` x ``height`` if given"""
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width or self.width}" '
+            f'height="{height or self.height}" viewBox="0 0 {self.width} {self.height}" '
+            f'style="background:{self.background}">'
+            f'<rect width="100%" height="100%" fill="{self.background}"/>'
+            f'{self.body()}</svg>'
+        )
+    
+    @staticmethod
+    def _paint(options, key, default):
+        color = options.get(key, default)
+        if not color:
+            return 'none'
+        return quoteattr(color)[1:-1]
+    
+    def _shape(self, options, fill_default, outline_default):
+        """fill and stroke attributes of a closed shape"""
+        attributes = f' fill="{self._paint(options, "fill", fill_default)}"'
+        if options.get('stipple'):
+            # Stipple patterns read as a translucent fill, as in RasterCanvas
+            attributes += ' fill-opacity="0.5"'
+        outline = self._paint(options, 'outline', outline_default)
+        width = options.get('width', 1)
+        if outline != 'none' and width:
+            attributes += f' stroke="{outline}" stroke-width="{number(width)}"'
+        return attributes
+    
+    def _line(self, coords, options):
+        stroke = self._paint(options, 'fill', 'black')
+        if stroke == 'none' or len(coords) < 4:
+            return ''
+        cap = ' stroke-linecap="round"' if options.get('capstyle') == 'round' else ''
+        return (f'<polyline points="{points(coords)}" fill="none" stroke="{stroke}" '
+                f'stroke-width="{number(options.get("width", 1))}" stroke-linejoin="round"{cap}/>')
+    
+    def _oval(self, coords, options):
+        x1, y1, x2, y2 = coords[:4]
+        center = f'cx="{number((x1 + x2) / 2)}" cy="{number((y1 + y2) / 2)}"'
+        rx, ry = number(abs(x2 - x1) / 2), number(abs(y2 - y1) / 2)
+        if rx == ry:
+            return f'<circle {center} r="{rx}"{self._shape(options, "", "black")}/>'
+        return f'<ellipse {center} rx="{rx}" ry="{ry}"{self._shape(options, "", "black")}/>'
+    
+    def _rectangle(self, coords, options):
+        x1, y1, x2, y2 = coords[:4]
+        return (f'<rect x="{number(min(x1, x2))}" y="{number(min(y1, y2))}" '
+                f'width="{number(abs(x2 - x1))}" height="{number(abs(y2 - y1))}"'
+                f'{self._shape(options, "", "black")}/>')
+    
+    def _polygon(self, coords, options):
+        if len(coords) < 6:
+            return ''
+        shape = self._shape(options, 'black', '')
+        if options.get('smooth'):
+            return f'<path d="{smooth_path(coords)}"{shape} stroke-linejoin="round"/>'
+        return f'<polygon points="{points(coords)}"{shape} stroke-linejoin="round"/>'
+    
+    def _text(self, coords, options):
+        font = options.get('font', ('TkDefaultFont', 10))
+        anchor, baseline = TEXT_ANCHORS.get(options.get('anchor', 'center'), TEXT_ANCHORS['center'])
+        weight = ' font-weight="bold"' if 'bold' in font[2:] else ''
+        style = ' font-style="italic"' if 'italic' in font[2:] else ''
+        return (f'<text x="{number(coords[0])}" y="{number(coords[1])}" font-family={quoteattr(font[0])} '
+                f'font-size="{number(font_pixels(font))}"{weight}{style} text-anchor="{anchor}" '
+                f'dominant-baseline="{baseline}" fill="{self._paint(options, "fill", "black")}">'
+                f'{escape(str(options.get("text", "")))}</text>')
+    
+    def _image(self, coords, options):
+        if options.get('anchor', 'center') != 'nw':
+            raise ValueError("SvgCanvas only places images by their 'nw' corner")
+        return f'<image x="{number(coords[0])}" y="{number(coords[1])}" href="{options["image"]}"/>'
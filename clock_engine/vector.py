@@ -0,0 +1,362 @@
+"""SVG documents that define a design's artwork once and draw each clock as references to it."""
+import math
+
+from .gradient import hex_to_rgb
+from .raster import font_pixels
+from .svg import SvgCanvas, number
+
+# Fewest concentric rings that are drawn as one radial gradient; smaller
+# stacks (e.g. jewels of three discs) stay separate discs
+GRADIENT_RINGS = 6
+# Color error, per channel, below which a gradient stop is left out
+STOP_TOLERANCE = 2
+# Seconds a hand takes for one turn, for animated documents
+HAND_PERIODS = {'second': 60, 'minute': 3600, 'hour': 43200}
+
+
+def oval_shape(coords):
+    """``(cx, cy, rx, ry)`` of an oval's bounding box"""
+    x1, y1, x2, y2 = coords[:4]
+    return (x1 + x2) / 2, (y1 + y2) / 2, abs(x2 - x1) / 2, abs(y2 - y1) / 2
+
+
+def is_ring(kind, options):
+    """A filled oval without an outline, as gradient_ovals draws them"""
+    return (kind == 'oval' and bool(options.get('fill')) and not options.get('outline')
+            and not options.get('stipple') and options.get('state') != 'hidden')
+
+
+def ring_run(primitives, first):
+    """Index past the stack of shrinking concentric rings starting at ``first``"""
+    kind, coords, options = primitives[first]
+    if not is_ring(kind, options):
+        return first + 1
+    cx, cy, rx, ry = oval_shape(coords)
+    rest = {name: value for name, value in options.items() if name != 'fill'}
+    end = first + 1
+    while end < len(primitives):
+        kind, coords, options = primitives[end]
+        if not is_ring(kind, options) or {n: v for n, v in options.items() if n != 'fill'} != rest:
+            break
+        x, y, inner_rx, inner_ry = oval_shape(coords)
+        if (abs(x - cx) > 1e-3 or abs(y - cy) > 1e-3 or not 0 < inner_rx < rx
+                or abs(inner_ry * rx - inner_rx * ry) > 1e-3 * rx * ry):
+            break
+        rx, ry = inner_rx, inner_ry
+        end += 1
+    return end
+
+
+def is_rgb(color):
+    return len(color) == 7 and color.startswith('#')
+
+
+def gradient_stops(rings):
+    """Radial gradient stops ``(offset, color)``, inside out, of rings listed outside in.
+
+    A color kept by several rings in a row is a band with hard edges (a
+    'step' gradient); a ring with a color of its own marks a point the
+    color blends through, so a 'blend' gradient becomes the smooth ramp
+    its rings approximate. Stops that the neighbouring stops already
+    interpolate are left out.
+    """
+    outer = oval_shape(rings[0][1])[2]
+    radii = [oval_shape(coords)[2] / outer for _, coords, _ in rings]
+    colors = [options['fill'] for _, _, options in rings]
+    stops = []
+    first = 0
+    while first < len(rings):
+        last = first
+        while last + 1 < len(rings) and colors[last + 1] == colors[first]:
+            last += 1
+        if last > first:
+            inner = radii[last + 1] if last + 1 < len(rings) else 0
+            stops.append((radii[first], colors[first]))
+            stops.append((inner, colors[first]))
+        else:
+            stops.append((radii[first], colors[first]))
+        first = last + 1
+    stops.reverse()
+    
+    kept = stops[:1]
+    for index in range(1, len(stops) - 1):
+        (before, start), (offset, color), (after, end) = kept[-1], stops[index], stops[index + 1]
+        if before < offset < after and all(map(is_rgb, (start, color, end))):
+            t = (offset - before) / (after - before)
+            expected = [a + (b - a) * t for a, b in zip(hex_to_rgb(start), hex_to_rgb(end))]
+            if all(abs(e - c) <= STOP_TOLERANCE for e, c in zip(expected, hex_to_rgb(color))):
+                continue
+        kept.append(stops[index])
+    if len(stops) > 1:
+        kept.append(stops[-1])
+    # Rounded, so ornaments of the same colors share one gradient
+    return tuple((round(offset, 3), color) for offset, color in kept)
+
+
+def bounds(kind, coords, options):
+    """Bounding box an item can paint in, or None if unknown"""
+    if kind == 'text':
+        size = font_pixels(options.get('font', ('TkDefaultFont', 10)))
+        reach = size * max(1, len(str(options.get('text', ''))))
+        return coords[0] - reach, coords[1] - size, coords[0] + reach, coords[1] + size
+    if kind == 'image' or len(coords) < 2:
+        return None
+    pad = options.get('width', 1) / 2 + 1
+    xs, ys = coords[0::2], coords[1::2]
+    return min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad
+
+
+def overlaps(box, other):
+    if box is None or other is None:
+        return True
+    return box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]
+
+
+def line_style(options):
+    """What a line's look depends on besides its points, or None if it can't share a path"""
+    if not options.get('fill') or options.get('stipple') or options.get('state') == 'hidden':
+        return None
+    return options['fill'], options.get('width', 1), options.get('capstyle', 'butt')
+
+
+def group_lines(primitives):
+    """Primitives with lines of one style gathered into ``('path', [coords, ...], style)``.
+
+    A line joins an earlier line of its style only if nothing drawn in
+    between overlaps it (or it is only lines of the same color), so the
+    picture is unchanged; rays, ticks and serrations of one color and
+    width become a single path.
+    """
+    entries = []
+    for kind, coords, options in primitives:
+        box = bounds(kind, coords, options)
+        style = line_style(options) if kind == 'line' else None
+        if style is not None:
+            for entry in reversed(entries):
+                if entry[0] == 'path' and entry[2] == style:
+                    entry[1].append(coords)
+                    entry[3].append(box)
+                    break
+                # Lines of the same solid color look the same in either order
+                if entry[0] == 'path' and entry[2][0] == style[0]:
+                    continue
+                if any(overlaps(box, other) for other in entry[3]):
+                    entries.append(['path', [coords], style, [box]])
+                    break
+            else:
+                entries.append(['path', [coords], style, [box]])
+        else:
+            entries.append([kind, coords, options, [box]])
+    return [entry[:3] for entry in entries]
+
+
+def path_markup(lines, style):
+    color, width, capstyle = style
+    segments = []
+    for coords in lines:
+        # Absolute start, then each point relative to the one before
+        segments.append(f"M{number(coords[0])},{number(coords[1])}l")
+        segments.append(' '.join(
+            f"{number(x - px)},{number(y - py)}"
+            for px, py, x, y in zip(coords[0::2], coords[1::2], coords[2::2], coords[3::2])
+        ))
+    data = ''.join(segments)
+    cap = {'round': ' stroke-linecap="round"', 'projecting': ' stroke-linecap="square"'}.get(capstyle, '')
+    return (f'<path d="{data}" fill="none" stroke="{color}" stroke-width="{number(width)}" '
+            f'stroke-linejoin="round"{cap}/>')
+
+
+class VectorClock:
+    """A clock design drawn once into SVG definitions that any number of clocks refer to.
+
+    The clock is built on an SvgCanvas and its items are split, in
+    stacking order, into the dial (everything that never moves), the
+    hands (each drawn at 12 o'clock), the clock's turning parts (see
+    BaseClock.turning_parts) and the readouts. Each part but the readouts
+    becomes one ``<g>`` in ``definitions``: concentric-ring gradients are
+    turned back into ``<radialGradient>`` fills (shared by every ornament
+    with the same colors) and lines of one style into single paths. A
+    clock in a document is then a ``<use>`` of the dial, a rotated
+    ``<use>`` per hand and the readout text.
+
+    Ids start with the face file's name (e.g. 'modern'), so several
+    designs can share a document. ``frame`` draws through the one clock;
+    callers sharing a VectorClock between threads must serialize it.
+    """
+    
+    def __init__(self, clock_cls, face=None, motion='tick'):
+        self.canvas = SvgCanvas(clock_cls.width, clock_cls.height, clock_cls.background)
+        self.clock = clock = clock_cls(None, canvas=self.canvas, motion=motion, static_cache=False, face=face)
+        self.prefix = clock.face.name if clock.face is not None else clock_cls.__name__.lower()
+        
+        roles = {}
+        for readout, _ in clock.readouts:
+            roles.update(dict.fromkeys(readout.items, ('text', None)))
+        for index, (group, _) in enumerate(clock.turning_parts()):
+            roles.update({item: ('turn', index) for item, _, _ in group.items})
+        for hand_type, items in clock.hand_items.items():
+            roles.update(dict.fromkeys(items, ('hand', hand_type)))
+        # Runs of items in stacking order: [(role, key), items]
+        self.parts = [[('dial', 0), []]]
+        for item in self.canvas.items:
+            role = roles.get(item, ('dial', None))
+            if role[0] != self.parts[-1][0][0] or role[1] not in (None, self.parts[-1][0][1]):
+                if role[0] == 'dial':
+                    role = ('dial', sum(1 for (kind, _), _ in self.parts if kind == 'dial'))
+                self.parts.append([role, []])
+            self.parts[-1][1].append(item)
+        
+        self.gradients = {}
+        groups = [self.group(role, items) for role, items in self.parts if role[0] != 'text']
+        gradients = ''.join(
+            f'<radialGradient id="{name}">'
+            + ''.join(f'<stop offset="{number(offset)}" stop-color="{color}"/>' for offset, color in stops)
+            + '</radialGradient>'
+            for stops, name in self.gradients.items()
+        )
+        self.definitions = gradients + ''.join(groups)
+    
+    def part_id(self, role):
+        kind, key = role
+        if kind == 'dial':
+            return f"{self.prefix}-dial{key or ''}"
+        if kind == 'turn':
+            return f"{self.prefix}-turn{key}"
+        return f"{self.prefix}-{key}"
+    
+    def group(self, role, items):
+        """The ``<g>`` definition of one part"""
+        primitives = [self.canvas.items[item][:3] for item in items]
+        collapsed = []
+        index = 0
+        while index < len(primitives):
+            end = ring_run(primitives, index)
+            if end - index >= GRADIENT_RINGS:
+                stops = gradient_stops(primitives[index:end])
+                name = self.gradients.setdefault(stops, f"{self.prefix}-g{len(self.gradients)}")
+                kind, coords, options = primitives[index]
+                collapsed.append((kind, coords, dict(options, fill=f"url(#{name})")))
+            else:
+                collapsed.extend(primitives[index:end])
+            index = end
+        
+        markup = []
+        if role == ('dial', 0):
+            markup.append(f'<rect width="{self.clock.width}" height="{self.clock.height}" '
+                          f'fill="{self.clock.background}"/>')
+        for kind, coords, options in group_lines(collapsed):
+            if kind == 'path':
+                markup.append(path_markup(coords, options))
+            else:
+                markup.append(self.canvas.markup(kind, coords, options))
+        return f'<g id="{self.part_id(role)}">{"".join(markup)}</g>'
+    
+    def rotated(self, role, angle, period=None, ticks=None, offset=0):
+        """A ``<use>`` of a part turned ``angle`` degrees about the center.
+
+        With ``period`` it keeps turning, a full turn every ``period``
+        seconds; in ``ticks`` steps if given, ``offset`` seconds into the
+        current one.
+        """
+        use = f'<use href="#{self.part_id(role)}"'
+        cx, cy = number(self.clock.center_x), number(self.clock.center_y)
+        if period is None:
+            if angle % 360 == 0:
+                return use + '/>'
+            return f'{use} transform="rotate({number(angle % 360)} {cx} {cy})"/>'
+        if ticks:
+            values = ';'.join(f"{number(angle + step * 360 / ticks)} {cx} {cy}" for step in range(ticks))
+            animation = (f'values="{values}" calcMode="discrete" begin="{number(-offset)}s"')
+        else:
+            animation = f'from="{number(angle)} {cx} {cy}" to="{number(angle + 360)} {cx} {cy}"'
+        return (f'{use}><animateTransform attributeName="transform" type="rotate" {animation} '
+                f'dur="{number(period)}s" repeatCount="indefinite"/></use>')
+    
+    def frame(self, timestamp, zone=None, animate=False):
+        """The clock at ``timestamp`` in design coordinates, as references to ``definitions``.
+
+        ``zone`` (a tzinfo) shows that zone instead of local time.
+        ``animate`` lets the hands and turning parts run on from there
+        with SMIL animations; readouts can't follow, so they are left out.
+        """
+        clock = self.clock
+        clock.zone = zone
+        clock.render_frame(timestamp)
+        angles = clock.hand_angles_at(timestamp, clock.local_time(timestamp))
+        turning = clock.turning_parts()
+        markup = []
+        for role, items in self.parts:
+            kind, key = role
+            if kind == 'dial':
+                markup.append(f'<use href="#{self.part_id(role)}"/>')
+            elif kind == 'text':
+                if not animate:
+                    markup.extend(self.canvas.element(item) for item in items)
+            elif kind == 'turn':
+                group, speed = turning[key]
+                period = 360 / speed if animate and speed else None
+                markup.append(self.rotated(role, group.angle, period))
+            elif not animate:
+                markup.append(self.rotated(role, angles[key]))
+            elif key == 'second' and clock.motion == 'tick':
+                markup.append(self.rotated(role, angles[key], HAND_PERIODS[key], 60, timestamp % 1))
+            else:
+                markup.append(self.rotated(role, angles[key], HAND_PERIODS[key]))
+        return ''.join(markup)
+    
+    def document(self, timestamp, zone=None, size=None, animate=False):
+        """A standalone SVG of one clock, scaled to ``size`` (width, height) if given"""
+        return svg_document(
+            self.clock.width, self.clock.height, size, self.clock.background,
+            self.definitions, self.frame(timestamp, zone, animate), timestamp if animate else None
+        )
+
+
+def svg_document(width, height, size, background, definitions, body, timestamp=None):
+    """Wrap definitions and a body drawn in ``width`` x ``height`` into an SVG document.
+
+    An animated document (one with ``timestamp``, the time its animations
+    start from) carries a one-line script that skips them ahead to the
+    viewer's current time, where scripts run.
+    """
+    shown_width, shown_height = size or (width, height)
+    script = ''
+    if timestamp is not None:
+        script = ("<script>addEventListener('load',function(){document.documentElement"
+                  f".setCurrentTime(Math.max(0,Date.now()/1e3-{timestamp:.3f}))}})</script>")
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{number(shown_width)}" height="{number(shown_height)}" '
+        f'viewBox="0 0 {number(width)} {number(height)}" style="background:{background}">'
+        f'{script}<defs>{definitions}</defs>{body}</svg>'
+    )
+
+
+def clock_page(clocks, timestamp, columns=None, cell_width=None, animate=False):
+    """One SVG of many clocks in a grid, all at the same instant.
+
+    ``clocks`` is a list of ``(VectorClock, zone)``; each design's
+    definitions are written once however many clocks use it. ``columns``
+    defaults to a roughly square grid and ``cell_width`` (pixels) to the
+    widest design's width.
+    """
+    columns = columns or math.ceil(math.sqrt(len(clocks)))
+    rows = math.ceil(len(clocks) / columns)
+    cell_w = max(vector.clock.width for vector, _ in clocks)
+    cell_h = max(vector.clock.height for vector, _ in clocks)
+    
+    definitions = {}
+    body = []
+    for index, (vector, zone) in enumerate(clocks):
+        definitions.setdefault(vector.prefix, vector.definitions)
+        row, column = divmod(index, columns)
+        x = column * cell_w + (cell_w - vector.clock.width) / 2
+        y = row * cell_h + (cell_h - vector.clock.height) / 2
+        body.append(f'<g transform="translate({number(x)} {number(y)})">'
+                    f'{vector.frame(timestamp, zone, animate)}</g>')
+    
+    scale = (cell_width or cell_w) / cell_w
+    return svg_document(
+        columns * cell_w, rows * cell_h, (columns * cell_w * scale, rows * cell_h * scale),
+        clocks[0][0].clock.background, ''.join(definitions.values()), ''.join(body),
+        timestamp if animate else None
+    )
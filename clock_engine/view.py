@@ -0,0 +1,153 @@
+"""A clock's window onto a canvas it may share with other clocks."""
+import math
+from itertools import count
+
+from .backend import CanvasBackend, flatten
+
+_view_ids = count(1)
+
+# Zoom levels are rounded down to 1/ZOOM_STEPS so that nearby window sizes
+# share cached static images
+ZOOM_STEPS = 100
+
+
+def fit_zoom(design_width, design_height, width, height):
+    """Zoom and offset that center a design in a ``width`` x ``height`` area"""
+    zoom = min(width / design_width, height / design_height)
+    zoom = max(1, math.floor(zoom * ZOOM_STEPS + 1e-9)) / ZOOM_STEPS
+    return zoom, (width - design_width * zoom) / 2, (height - design_height * zoom) / 2
+
+
+# Distinct unscaled sizes, shared by all the items that use them
+_sizes = {}
+
+
+def scaled_sizes(options):
+    """The options the view scales (line width and font) as shared ``(name, value)`` pairs"""
+    sizes = tuple((name, options[name]) for name in ('width', 'font') if options.get(name))
+    return _sizes.setdefault(sizes, sizes)
+
+
+class ClockView(CanvasBackend):
+    """Draw a clock into a region of another canvas.
+
+    Coordinates are scaled by ``zoom`` and offset by ``(x, y)``; line widths
+    and font sizes scale with them, so a clock designed for 680x750 can be
+    drawn as a thumbnail. Every item gets the view's tag, and the clock's
+    own tags are namespaced under it, so ``delete("hands")`` on one view
+    never touches another clock's hands.
+
+    ``rescale`` changes the zoom and offset of everything already drawn in
+    place, e.g. when the window is resized.
+    """
+    
+    def __init__(self, canvas, x=0, y=0, zoom=1.0, tag=None):
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.zoom = zoom
+        self.tag = tag or f"clock{next(_view_ids)}"
+        # Unscaled line widths and fonts of the items that have them, by item
+        self.sizes = {}
+    
+    def _map(self, args):
+        zoom, x, y = self.zoom, self.x, self.y
+        coords = flatten(args)
+        coords[0::2] = [x + c * zoom for c in coords[0::2]]
+        coords[1::2] = [y + c * zoom for c in coords[1::2]]
+        return coords
+    
+    def _options(self, options):
+        if 'width' in options:
+            options['width'] = options['width'] * self.zoom
+        font = options.get('font')
+        if font:
+            options['font'] = (font[0], max(1, round(font[1] * self.zoom))) + tuple(font[2:])
+        if 'tags' in options:
+            tags = options['tags']
+            tags = (tags,) if isinstance(tags, str) else tuple(tags)
+            options['tags'] = (self.tag,) + tuple(f"{self.tag}:{tag}" for tag in tags)
+        return options
+    
+    def _target(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            return tag_or_id
+        if tag_or_id == 'all':
+            return self.tag
+        return f"{self.tag}:{tag_or_id}"
+    
+    def _create(self, kind, args, options):
+        options.setdefault('tags', ())
+        sizes = scaled_sizes(options)
+        item = getattr(self.canvas, f"create_{kind}")(self._map(args), **self._options(options))
+        if sizes:
+            self.sizes[item] = sizes
+        return item
+    
+    def create_line(self, *args, **options):
+        return self._create('line', args, options)
+    
+    def create_oval(self, *args, **options):
+        return self._create('oval', args, options)
+    
+    def create_polygon(self, *args, **options):
+        return self._create('polygon', args, options)
+    
+    def create_rectangle(self, *args, **options):
+        return self._create('rectangle', args, options)
+    
+    def create_text(self, *args, **options):
+        return self._create('text', args, options)
+    
+    def create_image(self, *args, **options):
+        return self._create('image', args, options)
+    
+    def coords(self, tag_or_id, *args):
+        if args:
+            return self.canvas.coords(self._target(tag_or_id), self._map(args))
+        coords = self.canvas.coords(self._target(tag_or_id))
+        return [
+            (c - (self.x if i % 2 == 0 else self.y)) / self.zoom
+            for i, c in enumerate(coords)
+        ]
+    
+    def itemconfig(self, tag_or_id, **options):
+        target = self._target(tag_or_id)
+        sizes = scaled_sizes(options)
+        if sizes:
+            for item in self.canvas.find_withtag(target):
+                self.sizes[item] = scaled_sizes(dict(self.sizes.get(item, ()), **dict(sizes)))
+        return self.canvas.itemconfig(target, **self._options(options))
+    
+    itemconfigure = itemconfig
+    
+    def move(self, tag_or_id, dx, dy):
+        self.canvas.move(self._target(tag_or_id), dx * self.zoom, dy * self.zoom)
+    
+    def delete(self, *tags_or_ids):
+        for tag_or_id in tags_or_ids:
+            for item in self.canvas.find_withtag(self._target(tag_or_id)):
+                self.sizes.pop(item, None)
+        self.canvas.delete(*[self._target(tag_or_id) for tag_or_id in tags_or_ids])
+    
+    def rescale(self, zoom, x, y):
+        """Redraw everything in the view at a new zoom and offset, without recreating it"""
+        factor = zoom / self.zoom
+        self.canvas.scale(self.tag, self.x, self.y, factor, factor)
+        self.canvas.move(self.tag, x - self.x, y - self.y)
+        self.zoom, self.x, self.y = zoom, x, y
+        # Coordinates scale with the canvas, line widths and fonts don't
+        for item, sizes in self.sizes.items():
+            self.canvas.itemconfig(item, **self._options(dict(sizes)))
+    
+    def find_all(self):
+        return self.canvas.find_withtag(self.tag)
+    
+    def find_withtag(self, tag_or_id):
+        return self.canvas.find_withtag(self._target(tag_or_id))
+    
+    def load_image(self, path):
+        return self.canvas.load_image(path)
+    
+    def photo_image(self, image):
+        return self.canvas.photo_image(image)
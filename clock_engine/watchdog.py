@@ -0,0 +1,62 @@
+"""Runtime guard against canvas items piling up between frames."""
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CanvasItemLeak(RuntimeError):
+    """Raised when a watched canvas keeps accumulating items"""
+
+
+class ItemWatchdog:
+    """Track the canvas item count across frames and report leaks.
+
+    A steady clock creates the same number of items it deletes, so the item
+    count stays flat after the first frame. The watchdog samples the count
+    every ``check_every`` frames and reports when it has grown for
+    ``strikes`` samples in a row, or when it exceeds ``budget``.
+    ``action`` is ``'log'`` (warn through logging) or ``'raise'``.
+    """
+    
+    def __init__(self, canvas, check_every=20, strikes=3, budget=None, action='log'):
+        if action not in ('log', 'raise'):
+            raise ValueError(f"action must be 'log' or 'raise', not {action!r}")
+        self.canvas = canvas
+        self.check_every = check_every
+        self.strikes = strikes
+        self.budget = budget
+        self.action = action
+        self.frame = 0
+        self.baseline = None
+        self.last_count = None
+        self.growth = 0
+    
+    def check(self):
+        """Call once per frame; samples the item count every few frames"""
+        self.frame += 1
+        if self.frame % self.check_every:
+            return
+        
+        count = len(self.canvas.find_all())
+        if self.baseline is None:
+            self.baseline = self.last_count = count
+            return
+        
+        self.growth = self.growth + 1 if count > self.last_count else 0
+        self.last_count = count
+        
+        if self.budget is not None and count > self.budget:
+            self.report(f"canvas holds {count} items, over the budget of {self.budget}")
+        elif self.growth >= self.strikes:
+            self.report(
+                f"canvas item count grew for {self.growth} samples in a row "
+                f"({self.baseline} -> {count} items after {self.frame} frames)"
+            )
+    
+    def report(self, message):
+        """Log or raise a leak, then re-arm from the current count"""
+        self.baseline = self.last_count
+        self.growth = 0
+        if self.action == 'raise':
+            raise CanvasItemLeak(message)
+        logger.warning(message)
@@ -0,0 +1,135 @@
+"""Wall time in IANA time zones, with each zone's UTC offset cached between transitions."""
+import argparse
+import time
+from datetime import datetime
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+except ImportError:  # Python < 3.9: only local time
+    ZoneInfo = None
+
+# Offsets are probed this far apart when looking for the next transition;
+# two transitions closer than this would be missed (tz data has none)
+PROBE_STEP = 7 * 86400
+# An offset with no transition in sight is looked up again after this long
+HORIZON = 400 * 86400
+
+# Zones of the world clock when none are given
+WORLD_ZONES = (
+    'America/Los_Angeles', 'America/New_York', 'America/Sao_Paulo', 'Europe/London',
+    'Europe/Paris', 'Africa/Cairo', 'Asia/Dubai', 'Asia/Kolkata',
+    'Asia/Shanghai', 'Asia/Tokyo', 'Australia/Sydney', 'Pacific/Auckland',
+)
+# Areas of the tz database that only hold aliases and fixed offsets, e.g. 'US/Eastern'
+ALIAS_AREAS = ('Etc', 'SystemV', 'US', 'Brazil', 'Canada', 'Chile', 'Mexico')
+
+
+class ZoneTime:
+    """The struct_times of one zone, from an offset cached until its next transition.
+
+    The first lookup finds the zone's UTC offset at that instant and
+    searches ahead for the next change of offset, PROBE_STEP at a time and
+    then bisected to the second. Until then a struct_time is only
+    ``time.gmtime`` of the shifted timestamp. A struct_time holds whole
+    seconds, so the last one is kept and returned for every frame until
+    the second changes, to all the clocks sharing the zone.
+    ``zone=None`` is the local time zone.
+    """
+    
+    def __init__(self, zone):
+        self.zone = zone
+        # (start, end, offset): the offset holds from start up to, not including, end
+        self.period = None
+        self.last = (None, None)
+    
+    def utcoffset(self, timestamp):
+        """Seconds east of UTC at an epoch time, from the zone's rules"""
+        if self.zone is None:
+            return time.localtime(timestamp).tm_gmtoff
+        return int(datetime.fromtimestamp(timestamp, self.zone).utcoffset().total_seconds())
+    
+    def transition(self, timestamp, offset):
+        """The first whole second after ``timestamp`` with another offset, or the horizon"""
+        low = timestamp
+        while low < timestamp + HORIZON:
+            high = low + PROBE_STEP
+            if self.utcoffset(high) != offset:
+                # Transitions fall on whole seconds
+                low, high = int(low), int(high)
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self.utcoffset(middle) == offset:
+                        low = middle
+                    else:
+                        high = middle
+                return high
+            low = high
+        return low
+    
+    def locate(self, timestamp):
+        offset = self.utcoffset(timestamp)
+        self.period = (timestamp, self.transition(timestamp, offset), offset)
+        return self.period
+    
+    def struct_time(self, timestamp):
+        """The zone's wall time at an epoch time, like ``time.localtime``"""
+        second = timestamp // 1
+        last, current_time = self.last
+        if second == last:
+            return current_time
+        # Read and replaced whole, so clocks on other threads see a consistent pair
+        period = self.period
+        if period is None or not period[0] <= timestamp < period[1]:
+            period = self.locate(timestamp)
+        current_time = time.gmtime(timestamp + period[2])
+        self.last = (second, current_time)
+        return current_time
+
+
+# One ZoneTime per zone, shared by every clock showing it
+_zone_times = {}
+
+
+def zone_time(zone):
+    """The shared ZoneTime of a tzinfo, an IANA name, or None for local time"""
+    if isinstance(zone, str):
+        zone = get_zone(zone)
+    if zone not in _zone_times:
+        _zone_times[zone] = ZoneTime(zone)
+    return _zone_times[zone]
+
+
+def get_zone(name):
+    """The tzinfo of an IANA zone name; ValueError if there is no such zone"""
+    if ZoneInfo is None:
+        raise ValueError("time zones need Python 3.9 or newer")
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError, OSError):
+        raise ValueError(f"unknown time zone {name!r}") from None
+
+
+def city_zones():
+    """Names of every city zone in the tz database, sorted"""
+    if ZoneInfo is None:
+        return []
+    return sorted(
+        name for name in available_timezones()
+        if '/' in name and name.split('/', 1)[0] not in ALIAS_AREAS
+    )
+
+
+def parse_zone(value):
+    """argparse type for an IANA zone name"""
+    try:
+        return get_zone(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from None
+
+
+def zone_label(zone):
+    """A short name for a zone: the city of an IANA name, e.g. 'Buenos Aires'"""
+    if zone is None:
+        return "Local"
+    name = getattr(zone, 'key', None) or str(zone)
+    return name.rsplit('/', 1)[-1].replace('_', ' ')